@@ -0,0 +1,150 @@
+import os
+import re
+import stat
+from mimetypes import guess_type
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.staticfiles import NotModifiedResponse
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+from uploads import ENCODING_SUFFIXES, is_hashed_name
+
+# Content-hashed names never change, so caches may keep them for a year.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int):
+    """Parse a single "bytes=" range into an inclusive (start, end).
+
+    Returns None when the header should be ignored (malformed or multiple
+    ranges) and raises ValueError when the range cannot be satisfied.
+    """
+    match = _RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def accepted_encodings(header: str):
+    """Content codings the client accepts, ignoring any with q=0."""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding.strip() or params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class AssetFileResponse(FileResponse):
+    # Fewer, larger reads per download than FileResponse's 64 KiB.
+    chunk_size = 256 * 1024
+
+
+class FileRangeResponse(AssetFileResponse):
+    """206 response for bytes start..end (inclusive) of a file."""
+
+    def __init__(self, path, start: int, end: int, stat_result: os.stat_result, **kwargs):
+        super().__init__(path, status_code=206, stat_result=stat_result, **kwargs)
+        self.start, self.end = start, end
+        self.headers["content-length"] = str(end - start + 1)
+        self.headers["content-range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file.wrapped.fileno(),
+                    "offset": self.start,
+                    "count": self.end - self.start + 1,
+                })
+                return
+            remaining = self.end - self.start + 1
+            await file.seek(self.start)
+            while remaining:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+
+
+class AssetFiles(StaticFiles):
+    """StaticFiles with precompressed variants, range requests and cache headers.
+
+    A request for name.ext is answered from name.ext.br or name.ext.gz when
+    the client accepts that encoding and uploads.write_precompressed left a
+    variant on disk. Single byte ranges are served from the uncompressed
+    file. Content-hashed names get far-future immutable caching; everything
+    else must revalidate.
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        name = os.path.basename(full_path)
+        headers = {
+            "cache-control": IMMUTABLE_CACHE_CONTROL if is_hashed_name(name) else REVALIDATE_CACHE_CONTROL,
+            "accept-ranges": "bytes",
+        }
+        media_type = guess_type(name)[0] or "text/plain"
+
+        range_header = request_headers.get("range")
+        if range_header is None:
+            headers["vary"] = "Accept-Encoding"
+            accepted = accepted_encodings(request_headers.get("accept-encoding"))
+            for encoding, suffix in ENCODING_SUFFIXES.items():
+                if encoding not in accepted:
+                    continue
+                variant = self._variant(full_path, suffix, stat_result)
+                if variant is not None:
+                    full_path, stat_result = variant
+                    headers["content-encoding"] = encoding
+                    break
+
+        response = AssetFileResponse(full_path, status_code=status_code, headers=headers,
+                                     media_type=media_type, stat_result=stat_result)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+
+        if range_header is not None and status_code == 200:
+            if_range = request_headers.get("if-range")
+            if if_range is None or if_range == response.headers["etag"]:
+                try:
+                    byte_range = parse_range(range_header, stat_result.st_size)
+                except ValueError:
+                    return Response(status_code=416, headers={
+                        "content-range": f"bytes */{stat_result.st_size}", **headers})
+                if byte_range is not None:
+                    return FileRangeResponse(full_path, *byte_range, stat_result=stat_result,
+                                             headers=headers, media_type=media_type)
+        return response
+
+    @staticmethod
+    def _variant(full_path, suffix: str, original: os.stat_result):
+        path = f"{full_path}{suffix}"
+        try:
+            variant = os.stat(path)
+        except OSError:
+            return None
+        # A variant older than its source is stale; serve the original instead.
+        if not stat.S_ISREG(variant.st_mode) or variant.st_mtime < original.st_mtime:
+            return None
+        return path, variant
+
@@ -4,6 +4,11 @@ from datetime import datetime, timedelta
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import os
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 from models import TokenData
 from database import Database
 
@@ -15,8 +20,89 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # 24 hours
 
+# bcrypt runs in its own small pool; requests beyond workers + queue get a 503
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "16"))
+
+# Resolved admins cached per token
+ADMIN_CACHE_MAX_ENTRIES = int(os.getenv("ADMIN_CACHE_MAX_ENTRIES", "256"))
+ADMIN_CACHE_TTL_SECONDS = float(os.getenv("ADMIN_CACHE_TTL_SECONDS", "60"))
+
 # Security scheme
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+
+class AdminTokenCache:
+    """Bounded LRU of token -> admin document.
+
+    An entry lives for at most ADMIN_CACHE_TTL_SECONDS and never past the
+    token's own exp claim, so an expired token is always re-validated.
+    Concurrent misses on the same token share one lookup, and a lookup that
+    races with clear() or evict() is not stored. The admin write paths evict
+    a removed admin so they are locked out on their next request.
+    """
+
+    def __init__(self, max_entries: int = ADMIN_CACHE_MAX_ENTRIES, ttl: float = ADMIN_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._generation = 0
+
+    def get(self, token: str):
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        expires_at, admin = entry
+        if expires_at <= time.time():
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return admin
+
+    def put(self, token: str, admin: dict, exp):
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        self._entries[token] = (expires_at, admin)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(self, token: str, loader):
+        """Return the cached admin for token, calling loader() -> (admin, exp) on a miss."""
+        admin = self.get(token)
+        if admin is not None:
+            return admin
+        pending = self._loading.get(token)
+        if pending is None:
+            pending = self._loading[token] = asyncio.ensure_future(self._load(token, loader))
+        # Shielded so one cancelled request doesn't fail the others waiting on it.
+        return await asyncio.shield(pending)
+
+    async def _load(self, token: str, loader):
+        generation = self._generation
+        try:
+            admin, exp = await loader()
+            if self._generation == generation:
+                self.put(token, admin, exp)
+            return admin
+        finally:
+            del self._loading[token]
+
+    def evict(self, username: str):
+        """Drop every cached session of username."""
+        for token in [t for t, (_, admin) in self._entries.items() if admin.get("username") == username]:
+            del self._entries[token]
+        self._generation += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._generation += 1
+
+
+admin_token_cache = AdminTokenCache()
 
 def verify_password(plain_password, hashed_password):
     """Verify password"""
@@ -26,6 +112,77 @@ def get_password_hash(password):
     """Hash password"""
     return pwd_context.hash(password)
 
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop in a dedicated, bounded thread pool.
+
+    At most `workers` hashes run at once and at most `max_queue` more may wait;
+    anything beyond that is rejected with 503 so a login burst cannot pile up
+    unbounded work or stall unrelated requests.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+
+    def _timed(self, func, *args):
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.busy_seconds += time.perf_counter() - started
+
+    async def _run(self, func, *args):
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication attempts, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._timed, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def verify(self, plain_password, hashed_password) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password) -> str:
+        return await self._run(get_password_hash, password)
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": max(self.in_flight - self.workers, 0),
+            "max_in_flight": self.max_in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "busy_seconds": round(self.busy_seconds, 3),
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     """Create JWT access token"""
     to_encode = data.copy()
@@ -37,6 +194,21 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+async def get_current_admin_for_stream(
+    token: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+):
+    """Get current admin from the bearer header or ?token=, since EventSource cannot send headers"""
+    if credentials is None:
+        if not token:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return await get_current_admin(credentials)
+
 async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current authenticated admin"""
     credentials_exception = HTTPException(
@@ -45,26 +217,30 @@ async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
+    token = credentials.credentials
+
+    async def load():
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            username: str = payload.get("sub")
+            if username is None:
+                raise credentials_exception
+            token_data = TokenData(username=username)
+        except JWTError:
             raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
-    
-    admin = await Database.get_admin_by_username(username=token_data.username)
-    if admin is None:
-        raise credentials_exception
-    return admin
+
+        admin = await Database.get_admin_by_username(username=token_data.username)
+        if admin is None:
+            raise credentials_exception
+        return admin, payload.get("exp")
+
+    return await admin_token_cache.get_or_load(token, load)
 
 async def authenticate_admin(username: str, password: str):
     """Authenticate admin user"""
     admin = await Database.get_admin_by_username(username)
     if not admin:
         return False
-    if not verify_password(password, admin["password"]):
+    if not await password_hasher.verify(password, admin["password"]):
         return False
     return admin
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Load-testing benchmark for the portfolio API.
+
+Drives a concurrent mix of public page loads, admin search, contact form
+submits and admin project CRUD for a fixed duration, then prints a JSON
+report with p50/p95/p99 latency and requests per second, overall and per
+scenario. Reports have stable keys so two runs can be diffed across commits.
+
+By default the app runs in-process (httpx ASGITransport) against an
+in-memory MongoDB stand-in seeded with seed_data.seed_database:
+
+    python benchmark.py --duration 20 --concurrency 32 --output before.json
+
+To benchmark a real deployment, start it with uvicorn against a seeded
+mongod and point the benchmark at it:
+
+    python seed_data.py && uvicorn server:app --workers 4
+    python benchmark.py --url http://localhost:8000
+
+--seed and --seed-scale only apply in-process and are rejected with --url;
+seed the deployment's database with seed_data.py instead.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).parent
+
+PUBLIC_PATHS = [
+    "/api/profile",
+    "/api/projects",
+    "/api/projects/content",
+    "/api/skills",
+    "/api/education",
+    "/api/experience",
+    "/api/growth-mindset",
+    "/api/learning-journey",
+    "/api/experiments",
+    "/api/contact-section",
+    "/api/footer",
+]
+SEARCH_TERMS = ["python", "react", "ai", "portfolio", "mongo", "data", "web", "learning", "fastapi", "design"]
+DEFAULT_MIX = "public=60,portfolio=10,search=10,contact=10,admin=10"
+
+
+def percentile(sorted_values, p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(p * len(sorted_values) / 100) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def ms(seconds: float) -> float:
+    """Seconds as milliseconds, rounded for reports."""
+    return round(seconds * 1000, 3)
+
+
+def summarize(latencies, errors: int, elapsed: float):
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": ms(sum(values) / len(values)) if values else 0.0,
+        "p50_ms": ms(percentile(values, 50)),
+        "p95_ms": ms(percentile(values, 95)),
+        "p99_ms": ms(percentile(values, 99)),
+        "max_ms": ms(values[-1]) if values else 0.0,
+    }
+
+
+class Worker:
+    """One simulated client; records every request it makes while recording is on."""
+
+    def __init__(self, client: httpx.AsyncClient, rng: random.Random, auth: dict, results: dict):
+        self.client = client
+        self.rng = rng
+        self.auth = auth
+        self.results = results
+        self.recording = False
+
+    async def request(self, scenario: str, method: str, path: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        elapsed = time.perf_counter() - started
+        if self.recording:
+            latencies, errors = self.results.setdefault(scenario, ([], [0]))
+            latencies.append(elapsed)
+            errors[0] += not ok
+        return response
+
+    async def public(self):
+        await self.request("public", "GET", self.rng.choice(PUBLIC_PATHS))
+
+    async def portfolio(self):
+        await self.request("portfolio", "GET", "/api/portfolio")
+
+    async def search(self):
+        term = self.rng.choice(SEARCH_TERMS)
+        if self.rng.random() < 0.5:
+            await self.request("search", "GET", "/api/admin/search/suggest", params={"q": term[:2]}, headers=self.auth)
+        else:
+            await self.request("search", "GET", "/api/admin/search", params={"q": term}, headers=self.auth)
+
+    async def contact(self):
+        await self.request("contact", "POST", "/api/contact", json={
+            "name": f"Bench {self.rng.randrange(10**6)}",
+            "email": "bench@example.com",
+            "message": "Benchmark message " + " ".join(self.rng.choices(SEARCH_TERMS, k=8)),
+        })
+
+    async def admin(self):
+        project = {
+            "title": f"Bench project {self.rng.randrange(10**6)}",
+            "description": "Created by the benchmark",
+            "status": "completed",
+            "image": "https://example.com/bench.png",
+            "technologies": self.rng.sample(SEARCH_TERMS, 3),
+        }
+        response = await self.request("admin", "POST", "/api/admin/projects", json=project, headers=self.auth)
+        if response is None or response.status_code >= 400:
+            return
+        project_id = response.json()["id"]
+        await self.request("admin", "PUT", f"/api/admin/projects/{project_id}",
+                           json={"title": project["title"] + " (edited)"}, headers=self.auth)
+        await self.request("admin", "DELETE", f"/api/admin/projects/{project_id}", headers=self.auth)
+
+    async def run(self, mix, deadline: float):
+        scenarios = [getattr(self, name) for name in mix]
+        weights = list(mix.values())
+        while time.perf_counter() < deadline:
+            await self.rng.choices(scenarios, weights)[0]()
+
+
+def parse_mix(spec: str):
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("public", "portfolio", "search", "contact", "admin"):
+            raise SystemExit(f"Unknown scenario in --mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> dict:
+    response = await client.post("/api/admin/login", json={"username": username, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def benchmark(args):
+    mix = parse_mix(args.mix)
+    if args.url:
+        if args.seed or args.seed_scale:
+            # The server seeds from its own MONGO_URL; seed it with seed_data.py first.
+            raise SystemExit("--seed and --seed-scale only apply in-process; they can't be combined with --url")
+        mode = "http"
+        client = httpx.AsyncClient(base_url=args.url.rstrip("/"), timeout=30,
+                                   limits=httpx.Limits(max_connections=args.concurrency))
+        lifespan = contextlib.nullcontext()
+    else:
+        mode = "in-process"
+        os.environ.setdefault("MONGO_URL", "mongomock://")
+        os.environ.setdefault("DB_NAME", "portfolio_bench")
+        import seed_data
+        import server
+        # Request logging would dominate the measurements.
+        logging.getLogger().setLevel(logging.WARNING)
+        logging.getLogger("passlib").setLevel(logging.ERROR)
+        if args.seed or os.environ["MONGO_URL"].startswith("mongomock://"):
+            await seed_data.seed_database(scale=args.seed_scale)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://benchmark", timeout=30)
+        lifespan = server.lifespan(server.app)
+
+    results = {}
+    async with lifespan, client:
+        auth = await login(client, args.username, args.password)
+        workers = [Worker(client, random.Random(args.random_seed + i), auth, results) for i in range(args.concurrency)]
+        if args.warmup > 0:
+            deadline = time.perf_counter() + args.warmup
+            await asyncio.gather(*(worker.run(mix, deadline) for worker in workers))
+        for worker in workers:
+            worker.recording = True
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(worker.run(mix, deadline) for worker in workers))
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [latency for latencies, _ in results.values() for latency in latencies]
+    all_errors = sum(errors[0] for _, errors in results.values())
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "mode": mode,
+            "target": args.url or os.environ.get("MONGO_URL"),
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "concurrency": args.concurrency,
+            "mix": mix,
+            "random_seed": args.random_seed,
+            "seed_scale": None if args.url else args.seed_scale,
+            "python": platform.python_version(),
+            "elapsed_s": round(elapsed, 3),
+        },
+        "overall": summarize(all_latencies, all_errors, elapsed),
+        "scenarios": {name: summarize(latencies, errors[0], elapsed)
+                      for name, (latencies, errors) in sorted(results.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the portfolio API and report latency percentiles as JSON.")
+    parser.add_argument("--url", help="Benchmark a running server (e.g. http://localhost:8000) instead of in-process")
+    parser.add_argument("--duration", type=float, default=10, help="Measured seconds (default 10)")
+    parser.add_argument("--warmup", type=float, default=2, help="Unmeasured seconds before measuring (default 2)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent simulated clients (default 16)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights (default {DEFAULT_MIX})")
+    parser.add_argument("--seed", action="store_true",
+                        help="Run seed_data.seed_database first (always done for mongomock://; wipes a real database). "
+                             "In-process only; not allowed with --url")
+    parser.add_argument("--seed-scale", type=int, default=0,
+                        help="Seed this many synthetic projects, contact messages and notifications as well. "
+                             "In-process only; not allowed with --url")
+    parser.add_argument("--random-seed", type=int, default=1, help="Seed for the workload's random choices")
+    parser.add_argument("--username", default="shreeya")
+    parser.add_argument("--password", default="shreeya123")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    # Keep stdout clean for the report; startup and seeding chatter goes to stderr.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(benchmark(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import time
+from serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# How long a section stays cached when no admin write invalidates it first.
+# Every worker holds its own copy, so this also bounds how stale a worker can
+# be after an edit that was handled by a different worker.
+SECTION_CACHE_TTL_SECONDS = float(os.getenv("SECTION_CACHE_TTL_SECONDS", "300"))
+# ?fields= selections cached per section; further selections are loaded uncached.
+SECTION_CACHE_MAX_VARIANTS = int(os.getenv("SECTION_CACHE_MAX_VARIANTS", "16"))
+# Pre-rendered response bodies kept, least recently used dropped first.
+SECTION_CACHE_MAX_BODIES = int(os.getenv("SECTION_CACHE_MAX_BODIES", "256"))
+
+
+class SectionCache:
+    """In-process read-through cache for the public portfolio sections.
+
+    Entries are keyed by section name ("profile", "projects", ...), or by a
+    variant_key for one field selection of a section. Concurrent misses on the
+    same key share a single load, and a load that races with an invalidation
+    is not stored, so an admin write is never shadowed by the read that was in
+    flight while it happened. Invalidating a section drops all its variants
+    and their rendered bodies. At most max_variants field selections of a
+    section are cached at once, so arbitrary ?fields= combinations can't grow
+    the cache without bound; the rest go straight to the loader.
+    """
+
+    def __init__(self, ttl: float = SECTION_CACHE_TTL_SECONDS, max_variants: int = SECTION_CACHE_MAX_VARIANTS,
+                 max_bodies: int = SECTION_CACHE_MAX_BODIES):
+        self.ttl = ttl
+        self.max_variants = max_variants
+        self.max_bodies = max_bodies
+        self._entries = {}
+        self._locks = {}
+        self._generations = {}
+        self._listeners = []
+        self._bodies = {}
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def _fresh(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+        return None
+
+    async def get_or_load(self, key: str, loader):
+        """Return the cached value for key, calling loader() on a miss."""
+        entry = self._fresh(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+
+        if not self._has_room(key):
+            self.misses += 1
+            self.uncached += 1
+            return await loader()
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._fresh(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            section = section_of(key)
+            generation = self._generations.get(section, 0)
+            value = await loader()
+            # None means "not found" or a swallowed database error; don't pin it.
+            if value is not None and self._generations.get(section, 0) == generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+            elif key != section:
+                # Nothing stored, so give the variant's slot back.
+                self._locks.pop(key, None)
+            return value
+
+    def _has_room(self, key: str) -> bool:
+        """Whether key may be cached: sections always, variants while the section has room.
+
+        A variant holds a slot while it is cached or being loaded.
+        """
+        section = section_of(key)
+        if key == section or key in self._locks or key in self._entries:
+            return True
+        now = time.monotonic()
+        variants = {k for k in (*self._locks, *self._entries) if k != section and section_of(k) == section}
+        for variant in list(variants):
+            entry = self._entries.get(variant)
+            if entry is not None and entry[0] <= now:
+                del self._entries[variant]
+                self._drop_lock(variant)
+                if variant not in self._locks:
+                    variants.discard(variant)
+        return len(variants) < self.max_variants
+
+    def _drop_lock(self, key: str):
+        lock = self._locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._locks[key]
+
+    def render(self, key: str, value, build):
+        """Return (body, etag) for a response built from value.
+
+        build() is only called, and its result only JSON-encoded, when value is
+        not the object the stored body was rendered from, i.e. once per cache
+        fill instead of once per request. Variants loaded uncached are rendered
+        but not kept.
+        """
+        entry = self._bodies.pop(key, None)
+        if entry is not None and _same(entry[0], value):
+            self._bodies[key] = entry
+            return entry[1], entry[2]
+        body = encode_json(build())
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        if key == section_of(key) or key in self._entries:
+            self._bodies[key] = (value, body, etag)
+            while len(self._bodies) > self.max_bodies:
+                del self._bodies[next(iter(self._bodies))]
+        return body, etag
+
+    def invalidate(self, *keys: str):
+        """Drop the given sections, with all their variants, and notify listeners."""
+        for key in keys:
+            for cached_key in [k for k in self._entries if section_of(k) == key]:
+                del self._entries[cached_key]
+                if cached_key != key:
+                    self._drop_lock(cached_key)
+            for rendered_key in [k for k in self._bodies if section_of(k) == key]:
+                del self._bodies[rendered_key]
+            self._generations[key] = self._generations.get(key, 0) + 1
+            for listener in self._listeners:
+                try:
+                    listener(key)
+                except Exception as e:
+                    logger.error(f"Cache invalidation listener failed for {key}: {e}")
+
+    def clear(self):
+        """Drop every cached section."""
+        self.invalidate(*{section_of(key) for key in self._entries})
+
+    def subscribe(self, listener):
+        """Register a callable invoked with the key of every invalidated section."""
+        self._listeners.append(listener)
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "rendered_bodies": len(self._bodies),
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached_variant_loads": self.uncached,
+            "ttl_seconds": self.ttl,
+        }
+
+
+def variant_key(key: str, fields=None) -> str:
+    """Cache key for one field selection of a section; the section key itself without fields."""
+    return f"{key}?fields={','.join(sorted(fields))}" if fields else key
+
+
+def section_of(key: str) -> str:
+    """The section a (possibly variant) cache key belongs to."""
+    return key.partition("?")[0]
+
+
+def _same(a, b):
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+    return a is b
+
+
+def encode_json(content) -> bytes:
+    """Encode content like the app's FastJSONResponse."""
+    return dumps(content)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+section_cache = SectionCache()
+
+
+def cached(key: str):
+    """Serve a Database getter through section_cache.
+
+    Getters that project fields take an optional list of them; each field
+    selection is cached under its own variant_key, up to
+    SECTION_CACHE_MAX_VARIANTS per section. Cached values are shared
+    between requests and must be treated as read-only.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(fields=None):
+            if not fields:
+                return await section_cache.get_or_load(key, func)
+            fields = sorted(set(fields))
+            return await section_cache.get_or_load(variant_key(key, fields), functools.partial(func, fields))
+        return wrapper
+    return decorator
+
+
+def invalidates(*keys: str):
+    """Invalidate the given sections once the wrapped write has run."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                section_cache.invalidate(*keys)
+        return wrapper
+    return decorator
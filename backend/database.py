@@ -4,325 +4,309 @@ from dotenv import load_dotenv
 import os
 import logging
 import asyncio
-from pymongo import ASCENDING
+import base64
+from datetime import datetime
+from pymongo import ASCENDING, DESCENDING
 from bson import ObjectId
+from cache import cached, invalidates, section_cache
+from search_index import SearchIndex, SuggestIndex, empty_results
+from notifications import NotificationQueue, NotificationHub, UnreadCounter
+from metrics import mongo_command_metrics, mongo_pool_metrics
+from indexes import INDEXES, index_problems, summarize_plan
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / ".env")
 
-# MongoDB connection
+
+# Environment variables tuning the Motor client, mapped to pymongo options.
+# Unset ones keep whatever the connection string (or pymongo) defaults to.
+MONGO_CLIENT_OPTIONS = {
+    "MONGO_MAX_POOL_SIZE": ("maxPoolSize", int),
+    "MONGO_MIN_POOL_SIZE": ("minPoolSize", int),
+    "MONGO_MAX_IDLE_TIME_MS": ("maxIdleTimeMS", int),
+    "MONGO_MAX_CONNECTING": ("maxConnecting", int),
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS": ("waitQueueTimeoutMS", int),
+    "MONGO_CONNECT_TIMEOUT_MS": ("connectTimeoutMS", int),
+    "MONGO_SOCKET_TIMEOUT_MS": ("socketTimeoutMS", int),
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS": ("serverSelectionTimeoutMS", int),
+    # e.g. "zstd,snappy,zlib"; zstd and snappy need the zstandard / python-snappy packages
+    "MONGO_COMPRESSORS": ("compressors", str),
+    # primary, primaryPreferred, secondary, secondaryPreferred or nearest
+    "MONGO_READ_PREFERENCE": ("readPreference", str),
+    "MONGO_APP_NAME": ("appname", str),
+}
+
+
+def client_options():
+    """pymongo options for the Motor client, read from the environment."""
+    options = {}
+    for env, (option, cast) in MONGO_CLIENT_OPTIONS.items():
+        value = os.getenv(env)
+        if value:
+            options[option] = cast(value)
+    return options
+
+
+def create_client(url: str):
+    """Motor client for url; "mongomock://" gives an in-memory stand-in for benchmarks."""
+    if url.startswith("mongomock://"):
+        # Dev-only dependency, so only imported when asked for.
+        from mongomock_motor import AsyncMongoMockClient
+        return AsyncMongoMockClient()
+    return AsyncIOMotorClient(
+        url, event_listeners=[mongo_command_metrics, mongo_pool_metrics], **client_options())
+
+
+# MongoDB connection, opened by Database.connect() from the FastAPI lifespan
 mongo_url = os.environ["MONGO_URL"]
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ["DB_NAME"]]
+client = None
+db = None
 
 # Collections
-profile_collection = db.profile
-skills_collection = db.skills
-projects_collection = db.projects
-projects_page_collection = db.projects_page
-education_collection = db.education
-experience_collection = db.experience
-learning_journey_collection = db.learning_journey
-experiments_collection = db.experiments
-contact_section_collection = db.contact_section
-contact_messages_collection = db.contact_messages
-admin_collection = db.admin
-growth_mindset_collection = db.growth_mindset
-footer_collection = db.footer
-notifications_collection = db.notifications
+profile_collection = None
+skills_collection = None
+projects_collection = None
+projects_page_collection = None
+education_collection = None
+experience_collection = None
+learning_journey_collection = None
+experiments_collection = None
+contact_section_collection = None
+contact_messages_collection = None
+admin_collection = None
+growth_mindset_collection = None
+footer_collection = None
+notifications_collection = None
+
+
+def bind_database(database):
+    """Point db and the collection globals at database."""
+    global db, profile_collection, skills_collection, projects_collection, projects_page_collection
+    global education_collection, experience_collection, learning_journey_collection, experiments_collection
+    global contact_section_collection, contact_messages_collection, admin_collection, growth_mindset_collection
+    global footer_collection, notifications_collection
+    db = database
+    profile_collection = db.profile
+    skills_collection = db.skills
+    projects_collection = db.projects
+    projects_page_collection = db.projects_page
+    education_collection = db.education
+    experience_collection = db.experience
+    learning_journey_collection = db.learning_journey
+    experiments_collection = db.experiments
+    contact_section_collection = db.contact_section
+    contact_messages_collection = db.contact_messages
+    admin_collection = db.admin
+    growth_mindset_collection = db.growth_mindset
+    footer_collection = db.footer
+    notifications_collection = db.notifications
 
 logger = logging.getLogger(__name__)
 
+# Fields a list view may request with ?fields= (the id is always returned)
+CONTACT_MESSAGE_FIELDS = {"name", "email", "message", "read", "createdAt"}
+PROJECT_FIELDS = {"title", "description", "status", "image", "imageVariants", "liveUrl", "githubUrl",
+                  "technologies", "year", "createdAt", "updatedAt"}
+EDUCATION_FIELDS = {"degree", "program", "institution", "university", "location", "start", "end", "year",
+                    "gpa", "progress", "achievements", "coursework", "link", "logo", "verified", "type",
+                    "updatedAt"}
+EXPERIENCE_FIELDS = {"role", "company", "location", "start", "end", "bullets", "technologies", "type",
+                     "logo", "t", "description", "updatedAt"}
+LEARNING_JOURNEY_FIELDS = {"phase", "skills", "status", "order", "updatedAt"}
+# Never "password"
+ADMIN_FIELDS = {"username", "name", "profileImage", "role", "createdAt"}
+
+# Notifications without a read flag count as unread
+UNREAD_NOTIFICATION_QUERY = {"read": {"$in": [False, None]}}
+
+# The hot read queries, as (collection, filter, sort), whose plans
+# Database.explain_queries reports. Each should be served by an index in INDEXES.
+QUERY_SHAPES = {
+    "projects": ("projects", {}, [("createdAt", DESCENDING)]),
+    "education": ("education", {}, [("year", DESCENDING)]),
+    "experience": ("experience", {}, [("start", DESCENDING)]),
+    "learning_journey": ("learning_journey", {}, [("order", ASCENDING)]),
+    "contact_messages": ("contact_messages", {}, [("createdAt", DESCENDING), ("_id", DESCENDING)]),
+    "contact_messages_unread": ("contact_messages", {"read": False}, [("createdAt", DESCENDING), ("_id", DESCENDING)]),
+    "notifications": ("notifications", {}, [("createdAt", DESCENDING), ("_id", DESCENDING)]),
+    "notifications_by_type": ("notifications", {"type": "info"}, [("createdAt", DESCENDING), ("_id", DESCENDING)]),
+    "notifications_unread": ("notifications", UNREAD_NOTIFICATION_QUERY, None),
+    "admin_by_username": ("admin", {"username": ""}, None),
+    "skills_by_category": ("skills", {"category": ""}, None),
+}
+
+
+def encode_keyset_cursor(created_at: datetime, doc_id: ObjectId) -> str:
+    """Opaque cursor for (createdAt, _id) keyset pagination."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{doc_id}".encode()).decode()
+
+
+def decode_keyset_cursor(cursor: str):
+    """Inverse of encode_keyset_cursor; raises ValueError on a malformed cursor."""
+    try:
+        created_at, doc_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), ObjectId(doc_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def projection(fields):
+    """find() projection returning only fields (and _id); None returns whole documents."""
+    return {field: 1 for field in fields} if fields else None
+
+
+def normalize_doc(doc):
+    """Replace a document's ObjectId _id with a string id, in place; None passes through."""
+    if doc is not None:
+        doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+async def normalize_docs(cursor):
+    """Drain a Motor cursor into a list of normalized documents."""
+    return [normalize_doc(doc) async for doc in cursor]
+
 
 class Database:
     @staticmethod
-    async def create_indexes():
-        """Creates database indexes on startup."""
-        try:
-            # This creates an index on the 'createdAt' field.
-            # MongoDB will automatically delete any document 30 days after its 'createdAt' time.
-            # 2592000 seconds = 30 days
-            await notifications_collection.create_index(
-                [("createdAt", ASCENDING)],
-                expireAfterSeconds=864000
-            )
-            logger.info("TTL index for notifications created successfully.")
+    async def connect():
+        """Creates the client, binds the collections and opens the first pool connections.
+
+        Idempotent: the lifespan calls it on startup, and scripts that use the
+        database without the app (seeding, datagen) call it themselves.
+        """
+        global client
+        if client is not None:
+            return
+        client = create_client(mongo_url)
+        bind_database(client[os.environ["DB_NAME"]])
+        if mongo_url.startswith("mongomock://"):
+            return
+        # One ping per minimum pool connection, concurrently, so the first
+        # requests don't pay for server selection and connection handshakes.
+        warm = max(client_options().get("minPoolSize", 0), 1)
+        try:
+            await asyncio.gather(*(client.admin.command("ping") for _ in range(warm)))
+            logger.info(f"Connected to MongoDB with {warm} warm connection(s).")
         except Exception as e:
-            logger.error(f"Error creating TTL index: {e}")
+            logger.error(f"Error warming up the MongoDB connection: {e}")
+
+    @staticmethod
+    def close():
+        """Closes the client and its pool."""
+        global client
+        if client is not None:
+            client.close()
+            client = None
+
+    @staticmethod
+    async def create_indexes():
+        """Creates every index in the INDEXES registry concurrently, then verifies them."""
+        async def create(collection: str, keys, options):
+            try:
+                await db[collection].create_index(keys, **options)
+            except Exception as e:
+                logger.error(f"Error creating index {keys} on {collection}: {e}")
+
+        await asyncio.gather(*(
+            create(collection, keys, options) for collection, specs in INDEXES.items() for keys, options in specs))
+        problems = await Database.verify_indexes()
+        for problem in problems:
+            logger.warning(f"Index check failed: {problem}")
+        if not problems:
+            logger.info(f"All {sum(map(len, INDEXES.values()))} indexes in place.")
+        if not mongo_url.startswith("mongomock://"):
+            # The in-memory stand-in has no query planner to explain with.
+            for name, plan in (await Database.explain_queries()).items():
+                if plan.get("slow"):
+                    logger.warning(f"Query '{name}' has a slow plan: {' <- '.join(plan['stages'])}")
+
+    @staticmethod
+    async def verify_indexes():
+        """Registered indexes that are missing or differ from the registry; [] when all are in place."""
+        async def check(collection: str, specs):
+            try:
+                return index_problems(collection, specs, await db[collection].index_information())
+            except Exception as e:
+                logger.error(f"Error reading indexes of {collection}: {e}")
+                return [f"{collection}: could not read indexes ({e})"]
+
+        results = await asyncio.gather(*(check(collection, specs) for collection, specs in INDEXES.items()))
+        return [problem for problems in results for problem in problems]
+
+    @staticmethod
+    async def explain_queries():
+        """Winning plan summary of every query shape in QUERY_SHAPES, by name."""
+        async def explain(collection: str, query: dict, sort):
+            try:
+                cursor = db[collection].find(query).limit(100)
+                if sort:
+                    cursor = cursor.sort(sort)
+                return summarize_plan(await cursor.explain())
+            except Exception as e:
+                logger.error(f"Error explaining query on {collection}: {e}")
+                return {"error": str(e)}
+
+        plans = await asyncio.gather(*(explain(*shape) for shape in QUERY_SHAPES.values()))
+        return dict(zip(QUERY_SHAPES, plans))
+
+    @staticmethod
+    async def build_search_index():
+        """Builds the in-memory search index on startup."""
+        try:
+            await asyncio.gather(search_index.refresh(), suggest_index.refresh())
+            logger.info(f"Search index built: {search_index.stats()}, suggestions: {suggest_index.stats()}")
+        except Exception as e:
+            logger.error(f"Error building search index: {e}")
+
+    @staticmethod
+    async def suggest(prefix: str, limit: int = 10):
+        """Typeahead suggestions for the admin search box."""
+        try:
+            return await suggest_index.suggest(prefix, limit)
+        except Exception as e:
+            logger.error(f"Error getting search suggestions: {e}")
+            return []
 
     @staticmethod
     async def search_content(query: str):
         """Search for a query across all major portfolio content."""
         try:
-            search_regex = {"$regex": query, "$options": "i"}
-
-            profile_task = profile_collection.find_one({
-                "$or": [{"name": search_regex}, {"headline": search_regex}, {"bio": search_regex}, {"highlights": search_regex}, {"location": search_regex}, {"email": search_regex}, {"linkedin": search_regex}]
-            })
-
-            projects_task = projects_collection.find({
-                "$or": [
-                    {"title": search_regex},
-                    {"description": search_regex},
-                    {"technologies": search_regex},
-                    {"status": search_regex},
-                    {"liveUrl": search_regex},    # <-- ADDED
-                    {"githubUrl": search_regex}  # <-- ADDED
-                ]
-            }).to_list(length=None)
-
-            skills_task = skills_collection.find({
-                "$or": [{"category": search_regex}, {"skills.name": search_regex}]
-            }).to_list(length=None)
-
-            education_task = education_collection.find_one({
-                "$or": [{"degree": search_regex}, {"institution": search_regex}, {"year": search_regex}]
-            })
-
-            experience_task = experience_collection.find_one({
-                "$or": [{"main_title": search_regex}, {"main_message": search_regex}, {"goals.title": search_regex}, {"goals.description": search_regex}, {"cta_title": search_regex}, {"cta_message": search_regex}]
-            })
-
-            learning_journey_task = learning_journey_collection.find({
-                "$or": [{"phase": search_regex}, {"skills": search_regex}, {"status": search_regex}]
-            }).to_list(length=None)
-
-            growth_mindset_task = growth_mindset_collection.find_one({
-                "$or": [{"title": search_regex}, {"quote": search_regex}]
-            })
-
-            experiments_task = experiments_collection.find_one({
-                "$or": [
-                    {"header_title": search_regex}, {
-                        "header_description": search_regex},
-                    {"lab_title": search_regex}, {
-                        "lab_description": search_regex},
-                    {"lab_features.title": search_regex}, {
-                        "lab_features.description": search_regex},
-                    {"experiments.title": search_regex}, {
-                        "experiments.description": search_regex},
-                    {"experiments.status": search_regex}
-                ]
-            })
-
-            contacts_task = contact_section_collection.find_one({
-                "$or": [
-                    {"header_title": search_regex}, {
-                        "header_description": search_regex},
-                    {"connect_title": search_regex}, {
-                        "connect_description": search_regex},
-                    {"get_in_touch_title": search_regex}, {
-                        "get_in_touch_description": search_regex},
-                    {"contact_links.name": search_regex}, {"contact_links.value": search_regex}, {
-                        "contact_links.icon": search_regex},
-                ]
-            })
-
-            footer_task = footer_collection.find_one({
-                "$or": [
-                    {"brand_name": search_regex}, {
-                        "brand_description": search_regex},
-                    {"quick_links.name": search_regex}, {
-                        "quick_links.href": search_regex},
-                    {"connect_title": search_regex}, {
-                        "connect_description": search_regex},
-                    {"bottom_text": search_regex}
-                ]
-            })
-
-            # Run all searches concurrently
-            profile_match, projects_docs, skills_docs, education_match, experience_match, learning_journey_docs, growth_mindset_match, experiments_match, contact_section_match, footer_match = await asyncio.gather(
-                profile_task, projects_task, skills_task, education_task, experience_task, learning_journey_task, growth_mindset_task, experiments_task, contacts_task, footer_task
-            )
-
-            # Process results
-            results = {"profile": [], "projects": [], "skills": [], "education": [], "experience": [
-            ], "learning_journey": [], "growth_mindset": [], "experiments": [], "contact": [], "footer": []}
-
-            # --- NEW: PROCESS FOOTER SECTION ---
-            if footer_match:
-                fields_to_check = ["brand_name", "brand_description",
-                                   "connect_title", "connect_description", "bottom_text"]
-                for field in fields_to_check:
-                    value = footer_match.get(field)
-                    if isinstance(value, str) and query.lower() in value.lower():
-                        results["footer"].append(
-                            {"field": field.replace('_', ' ').capitalize(), "value": value})
-
-                for link in footer_match.get("quick_links", []):
-                    if query.lower() in link.get("name", "").lower() or query.lower() in link.get("href", "").lower():
-                        results["footer"].append(
-                            {"field": f"Quick Link: {link.get('name')}", "value": link.get('href')})
-
-            if contact_section_match:
-                fields_to_check = ["header_title", "header_description", "connect_title",
-                                   "connect_description", "get_in_touch_title", "get_in_touch_description"]
-                for field in fields_to_check:
-                    value = contact_section_match.get(field)
-                    if isinstance(value, str) and query.lower() in value.lower():
-                        results["contact"].append(
-                            {"field": field.replace('_', ' ').capitalize(), "value": value})
-
-                for link in contact_section_match.get("contact_links", []):
-                    if query.lower() in link.get("name", "").lower() or query.lower() in link.get("value", "").lower() or query.lower() in link.get("icon", "").lower():
-                        results["contact"].append({"field": f"Contact Link: {link.get('name')}", "value": link.get(
-                            'value'), "icon": link.get('icon')})
-
-            if experiments_match:
-                fields_to_check = [
-                    "header_title", "header_description", "lab_title", "lab_description"]
-                for field in fields_to_check:
-                    value = experiments_match.get(field)
-                    if isinstance(value, str) and query.lower() in value.lower():
-                        results["experiments"].append(
-                            {"field": field.replace('_', ' ').capitalize(), "value": value})
-
-                for feature in experiments_match.get("lab_features", []):
-                    if query.lower() in feature.get("title", "").lower() or query.lower() in feature.get("description", "").lower():
-                        results["experiments"].append(
-                            {"field": f"Lab Feature: {feature.get('title')}", "value": feature.get('description')})
-
-                for experiment in experiments_match.get("experiments", []):
-                    if query.lower() in experiment.get("title", "").lower() or query.lower() in experiment.get("description", "").lower() or query.lower() in experiment.get("status", "").lower():
-                        results["experiments"].append(
-                            {"field": f"Experiment: {experiment.get('title')}", "value": experiment.get('description')})
-
-            if profile_match:
-                fields_to_check = ["name", "headline", "bio",
-                                   "highlights", "location", "email", "linkedin"]
-                for field in fields_to_check:
-                    value = profile_match.get(field)
-                    if isinstance(value, str) and query.lower() in value.lower():
-                        results["profile"].append({
-                            # e.g., "Resume url"
-                            "field": field.replace('_', ' ').capitalize(),
-                            "value": value
-                        })
-
-            if education_match:
-                fields_to_check = ["degree", "institution", "year"]
-                for field in fields_to_check:
-                    value = education_match.get(field)
-                    if isinstance(value, str) and query.lower() in value.lower():
-                        results["education"].append({
-                            "field": field.capitalize(),
-                            "value": value
-                        })
-
-            if experience_match:
-                fields_to_check = ["main_title",
-                                   "main_message", "cta_title", "cta_message"]
-                for field in fields_to_check:
-                    value = experience_match.get(field)
-                    if isinstance(value, str) and query.lower() in value.lower():
-                        results["experience"].append({
-                            "field": field.replace('_', ' ').capitalize(),
-                            "value": value
-                        })
-                for goal in experience_match.get("goals", []):
-                    if query.lower() in goal.get("title", "").lower():
-                        results["experience"].append({
-                            "field": f"Goal: {goal.get('title')}",
-                            "value": goal.get('description')
-                        })
-                    elif query.lower() in goal.get("description", "").lower():
-                        results["experience"].append({
-                            "field": f"Goal: {goal.get('title')}",
-                            "value": goal.get('description')
-                        })
-
-            project_results = []
-            seen_projects = set()
-            for project in projects_docs:
-                project_id = str(project["_id"])
-                if project_id in seen_projects:
-                    continue
-                matches_in_project = []
-                if query.lower() in project.get("title", "").lower():
-                    matches_in_project.append("Match in title")
-                if query.lower() in project.get("description", "").lower():
-                    matches_in_project.append("Match in description")
-                if query.lower() in project.get("status", "").lower():
-                    matches_in_project.append(
-                        f"Match in status: '{project.get('status')}'")
-                for tech in project.get("technologies", []):
-                    if query.lower() in tech.lower():
-                        matches_in_project.append(
-                            f"Match in technology: '{tech}'")
-                if project.get("liveUrl") and query.lower() in project.get("liveUrl", "").lower():
-                    matches_in_project.append("Match in Live URL")
-                if project.get("githubUrl") and query.lower() in project.get("githubUrl", "").lower():
-                    matches_in_project.append("Match in GitHub URL")
-                if matches_in_project:
-                    project_results.append({
-                        "id": project_id,
-                        "title": project.get("title"),
-                        "matches": matches_in_project
-                    })
-                    seen_projects.add(project_id)
-
-            results["projects"] = project_results
-
-            skill_results = []
-            seen_skills = set()
-            for s_doc in skills_docs:
-                category = s_doc.get("category", "Unknown")
-                if query.lower() in category.lower():
-                    category_match_id = f"category-{category}"
-                    if category_match_id not in seen_skills:
-                        skill_results.append({
-                            "type": "category",
-                            "name": category
-                        })
-                        seen_skills.add(category_match_id)
-                for skill in s_doc.get("skills", []):
-                    skill_name = skill.get("name")
-                    if skill_name and query.lower() in skill_name.lower():
-                        skill_match_id = f"skill-{skill_name}-{category}"
-                        if skill_match_id not in seen_skills:
-                            skill_results.append({
-                                "type": "skill",
-                                "name": skill_name,
-                                "proficiency": skill.get("proficiency"),
-                                "category": category
-                            })
-                            seen_skills.add(skill_match_id)
-            results["skills"] = skill_results
-
-            if learning_journey_docs:
-                for phase in learning_journey_docs:
-                    results["learning_journey"].append({
-                        "field": f"Phase: {phase.get('phase')}",
-                        "value": f"Status: {phase.get('status')}. Skills: {', '.join(phase.get('skills', []))}"
-                    })
-
-            if growth_mindset_match:
-                if query.lower() in growth_mindset_match.get("title", "").lower():
-                    results["growth_mindset"].append(
-                        {"field": "Title", "value": growth_mindset_match.get("title")})
-                if query.lower() in growth_mindset_match.get("quote", "").lower():
-                    results["growth_mindset"].append(
-                        {"field": "Quote", "value": growth_mindset_match.get("quote")})
-
-            return results
+            return await search_index.search(query)
         except Exception as e:
             logger.error(f"Error during content search: {e}")
-            return {"profile": [], "projects": [], "skills": [], "education": [], "experience": []}
+            return empty_results()
+
+    @staticmethod
+    async def search_ranked(query: str, limit: int = 20, cursor: str = None):
+        """One ranked page of search hits; raises ValueError for a bad cursor."""
+        try:
+            return await search_index.ranked(query, limit, cursor)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error during ranked search: {e}")
+            return {"items": [], "next_cursor": None, "total": 0}
+
+    @staticmethod
+    async def stream_search(query: str):
+        """Yields (section, results) pairs as each section's hits are ready."""
+        async for section, results in search_index.stream(query):
+            yield section, results
 
     @staticmethod
+    @cached("profile")
     async def get_profile():
         """Get profile data"""
         try:
             profile = await profile_collection.find_one()
-            if profile:
-                profile["id"] = str(profile["_id"])
-                del profile["_id"]
-            return profile
+            return normalize_doc(profile)
         except Exception as e:
             logger.error(f"Error getting profile: {e}")
             return None
 
     @staticmethod
+    @invalidates("profile")
     async def update_profile(profile_data: dict):
         """Update profile data"""
         try:
@@ -333,6 +317,7 @@ class Database:
             return False
 
     @staticmethod
+    @cached("skills")
     async def get_skills():
         """Get all skills by category"""
         try:
@@ -346,6 +331,7 @@ class Database:
             return {}
 
     @staticmethod
+    @invalidates("skills")
     async def update_skills(category: str, skills: list):
         """Update skills for a category"""
         try:
@@ -362,6 +348,7 @@ class Database:
             return False
 
     @staticmethod
+    @invalidates("skills")
     async def delete_skills_category(category: str):
         """Delete a skill category"""
         try:
@@ -372,6 +359,7 @@ class Database:
             return False
 
     @staticmethod
+    @cached("projects_page")
     async def get_projects_page():
         try:
             # Find the single document by its fixed ID
@@ -382,6 +370,7 @@ class Database:
             return None
 
     @staticmethod
+    @invalidates("projects_page")
     async def update_projects_page(data: dict):
         try:
             # Use update_one with $set for safe partial updates from the admin panel
@@ -396,21 +385,17 @@ class Database:
             return False
 
     @staticmethod
-    async def get_projects():
-        """Get all projects"""
+    @cached("projects")
+    async def get_projects(fields: list = None):
+        """Get all projects, optionally only the given fields"""
         try:
-            cursor = projects_collection.find().sort("createdAt", -1)
-            projects = []
-            async for project in cursor:
-                project["id"] = str(project["_id"])
-                del project["_id"]
-                projects.append(project)
-            return projects
+            return await normalize_docs(projects_collection.find({}, projection(fields)).sort("createdAt", -1))
         except Exception as e:
             logger.error(f"Error getting projects: {e}")
             return []
 
     @staticmethod
+    @invalidates("projects")
     async def create_project(project_data: dict):
         """Create new project"""
         try:
@@ -421,6 +406,7 @@ class Database:
             return None
 
     @staticmethod
+    @invalidates("projects")
     async def update_project(project_id: str, project_data: dict):
         """Update project"""
         try:
@@ -435,6 +421,7 @@ class Database:
             return False
 
     @staticmethod
+    @invalidates("projects")
     async def delete_project(project_id: str):
         """Delete project"""
         try:
@@ -447,21 +434,18 @@ class Database:
             return False
 
     @staticmethod
-    async def get_all_education():
+    @cached("education")
+    async def get_all_education(fields: list = None):
+        """Get all education entries, optionally only the given fields."""
         try:
-            cursor = education_collection.find().sort(
-                "year", -1)  # Sort descending by year
-            education_list = []
-            async for edu in cursor:
-                edu["id"] = str(edu["_id"])
-                del edu["_id"]
-                education_list.append(edu)
-            return education_list
+            # Sort descending by year
+            return await normalize_docs(education_collection.find({}, projection(fields)).sort("year", -1))
         except Exception as e:
             logger.error(f"Error getting education list: {e}")
             return []
 
     @staticmethod
+    @invalidates("education")
     async def create_education(education_data: dict):
         """Create a new education entry."""
         try:
@@ -472,6 +456,7 @@ class Database:
             return None
 
     @staticmethod
+    @invalidates("education")
     async def update_education(education_id: str, education_data: dict):
         """Update an education entry by its ID."""
         try:
@@ -484,6 +469,7 @@ class Database:
             return False
 
     @staticmethod
+    @invalidates("education")
     async def delete_education(education_id: str):
         """Delete an education entry by its ID."""
         try:
@@ -494,21 +480,18 @@ class Database:
             return False
 
     @staticmethod
-    async def get_all_experience():
-        """Get all experience entries, sorted by start date."""
+    @cached("experience")
+    async def get_all_experience(fields: list = None):
+        """Get all experience entries, sorted by start date, optionally only the given fields."""
         try:
-            cursor = experience_collection.find().sort("start", -1)  # Sort newest first
-            experience_list = []
-            async for exp in cursor:
-                exp["id"] = str(exp["_id"])
-                del exp["_id"]
-                experience_list.append(exp)
-            return experience_list
+            # Sort newest first
+            return await normalize_docs(experience_collection.find({}, projection(fields)).sort("start", -1))
         except Exception as e:
             logger.error(f"Error getting experience list: {e}")
             return []
 
     @staticmethod
+    @invalidates("experience")
     async def create_experience(experience_data: dict):
         """Create a new experience entry."""
         try:
@@ -519,6 +502,7 @@ class Database:
             return None
 
     @staticmethod
+    @invalidates("experience")
     async def update_experience(experience_id: str, experience_data: dict):
         """Update an experience entry by its ID."""
         try:
@@ -531,6 +515,7 @@ class Database:
             return False
 
     @staticmethod
+    @invalidates("experience")
     async def delete_experience(experience_id: str):
         """Delete an experience entry by its ID."""
         try:
@@ -541,19 +526,18 @@ class Database:
             return False
 
     @staticmethod
+    @cached("growth_mindset")
     async def get_growth_mindset():
         """Get growth mindset data"""
         try:
             data = await growth_mindset_collection.find_one()
-            if data:
-                data["id"] = str(data["_id"])
-                del data["_id"]
-            return data
+            return normalize_doc(data)
         except Exception as e:
             logger.error(f"Error getting growth mindset data: {e}")
             return None
 
     @staticmethod
+    @invalidates("growth_mindset")
     async def update_growth_mindset(data: dict):
         """Update growth mindset data"""
         try:
@@ -564,21 +548,17 @@ class Database:
             return False
 
     @staticmethod
-    async def get_learning_journey():
-        """Get learning journey timeline"""
+    @cached("learning_journey")
+    async def get_learning_journey(fields: list = None):
+        """Get learning journey timeline, optionally only the given fields"""
         try:
-            cursor = learning_journey_collection.find().sort("order", 1)
-            journey = []
-            async for phase in cursor:
-                phase["id"] = str(phase["_id"])
-                del phase["_id"]
-                journey.append(phase)
-            return journey
+            return await normalize_docs(learning_journey_collection.find({}, projection(fields)).sort("order", 1))
         except Exception as e:
             logger.error(f"Error getting learning journey: {e}")
             return []
 
     @staticmethod
+    @invalidates("learning_journey")
     async def create_learning_phase(phase_data: dict):
         """Create new learning phase"""
         try:
@@ -589,6 +569,7 @@ class Database:
             return None
 
     @staticmethod
+    @invalidates("learning_journey")
     async def update_learning_phase(phase_id: str, phase_data: dict):
         """Update learning phase"""
         try:
@@ -603,6 +584,7 @@ class Database:
             return False
 
     @staticmethod
+    @invalidates("learning_journey")
     async def delete_learning_phase(phase_id: str):
         """Delete learning phase"""
         try:
@@ -617,19 +599,18 @@ class Database:
             return False
 
     @staticmethod
+    @cached("experiments")
     async def get_experiments_section():
         """Get the entire experiments section data"""
         try:
             data = await experiments_collection.find_one()
-            if data:
-                data["id"] = str(data["_id"])
-                del data["_id"]
-            return data
+            return normalize_doc(data)
         except Exception as e:
             logger.error(f"Error getting experiments section: {e}")
             return None
 
     @staticmethod
+    @invalidates("experiments")
     async def update_experiments_section(data: dict):
         """Update the entire experiments section data"""
         try:
@@ -640,19 +621,18 @@ class Database:
             return False
 
     @staticmethod
+    @cached("contact_section")
     async def get_contact_section():
         """Get contact section data"""
         try:
             data = await contact_section_collection.find_one()
-            if data:
-                data["id"] = str(data["_id"])
-                del data["_id"]
-            return data
+            return normalize_doc(data)
         except Exception as e:
             logger.error(f"Error getting contact section: {e}")
             return None
 
     @staticmethod
+    @invalidates("contact_section")
     async def update_contact_section(data: dict):
         """Update contact section data"""
         try:
@@ -673,19 +653,71 @@ class Database:
             return None
 
     @staticmethod
-    async def get_contact_messages():
-        """Get all contact messages"""
-        try:
-            cursor = contact_messages_collection.find().sort("createdAt", -1)
-            messages = []
-            async for message in cursor:
-                message["id"] = str(message["_id"])
-                del message["_id"]
-                messages.append(message)
-            return messages
+    async def get_contact_messages(limit: int = 100, cursor: str = None, read: bool = None, fields: list = None):
+        """Get one page of contact messages, newest first.
+
+        Keyset pagination on (createdAt, _id): pass the previous page's
+        next_cursor as cursor. Raises ValueError for a malformed cursor.
+        """
+        query = {} if read is None else {"read": read}
+        if cursor:
+            created_at, last_id = decode_keyset_cursor(cursor)
+            query["$or"] = [
+                {"createdAt": {"$lt": created_at}},
+                {"createdAt": created_at, "_id": {"$lt": last_id}},
+            ]
+        # The cursor needs createdAt even when the caller didn't ask for it.
+        loaded_fields = [*fields, "createdAt"] if fields else None
+        try:
+            docs = await contact_messages_collection.find(query, projection(loaded_fields)).sort(
+                [("createdAt", -1), ("_id", -1)]).limit(limit + 1).to_list(length=limit + 1)
+            next_cursor = None
+            if len(docs) > limit:
+                docs = docs[:limit]
+                next_cursor = encode_keyset_cursor(docs[-1]["createdAt"], docs[-1]["_id"])
+            messages = [normalize_doc(message) for message in docs]
+            if fields and "createdAt" not in fields:
+                for message in messages:
+                    del message["createdAt"]
+            return {"items": messages, "next_cursor": next_cursor}
         except Exception as e:
             logger.error(f"Error getting contact messages: {e}")
-            return []
+            return {"items": [], "next_cursor": None}
+
+    @staticmethod
+    async def count_contact_messages(read: bool = None):
+        """Count contact messages, optionally only read or unread ones"""
+        try:
+            return await contact_messages_collection.count_documents({} if read is None else {"read": read})
+        except Exception as e:
+            logger.error(f"Error counting contact messages: {e}")
+            return 0
+
+    @staticmethod
+    async def get_dashboard_summary():
+        """Counts for the admin dashboard, gathered concurrently.
+
+        Whole-collection totals come from collection metadata and filtered
+        counts walk the (read, ...) indexes, so the cost does not grow with
+        the number of projects or messages.
+        """
+        (project_count, skill_category_count, message_count,
+         unread_message_count, recent_messages, unread_notification_count) = await asyncio.gather(
+            projects_collection.estimated_document_count(),
+            skills_collection.estimated_document_count(),
+            contact_messages_collection.estimated_document_count(),
+            Database.count_contact_messages(read=False),
+            Database.get_contact_messages(limit=5, read=False),
+            Database.count_unread_notifications(),
+        )
+        return {
+            "project_count": project_count,
+            "message_count": message_count,
+            "unread_message_count": unread_message_count,
+            "skill_category_count": skill_category_count,
+            "recent_messages": recent_messages["items"],
+            "unread_notification_count": unread_notification_count,
+        }
 
     @staticmethod
     async def mark_message_read(message_id: str):
@@ -716,19 +748,18 @@ class Database:
             return False
 
     @staticmethod
+    @cached("footer")
     async def get_footer():
         """Get footer data"""
         try:
             data = await footer_collection.find_one()
-            if data:
-                data["id"] = str(data["_id"])
-                del data["_id"]
-            return data
+            return normalize_doc(data)
         except Exception as e:
             logger.error(f"Error getting footer data: {e}")
             return None
 
     @staticmethod
+    @invalidates("footer")
     async def update_footer(data: dict):
         """Update footer data"""
         try:
@@ -740,24 +771,73 @@ class Database:
 
     @staticmethod
     async def create_notification(notification_data: dict):
-        """Creates a new notification document"""
-        try:
-            await notifications_collection.insert_one(notification_data)
-            return True
-        except Exception as e:
-            logger.error(f"Error creating notification: {e}")
-            return False
-
-    @staticmethod
-    async def get_notifications(limit: int = 100):
-        """Gets the most recent notifications"""
-        cursor = notifications_collection.find().sort("createdAt", -1).limit(limit)
-        notifications = []
-        async for doc in cursor:
-            doc["id"] = str(doc["_id"])
-            del doc["_id"]
-            notifications.append(doc)
-        return notifications
+        """Queues a notification for the batch writer, or inserts it directly when the writer isn't running"""
+        # Assign the id up front so open streams can be told about it before the write lands.
+        notification_data.setdefault("_id", ObjectId())
+        if notification_queue.running:
+            created = notification_queue.put(notification_data)
+        else:
+            try:
+                await notifications_collection.insert_one(notification_data)
+                created = True
+            except Exception as e:
+                logger.error(f"Error creating notification: {e}")
+                created = False
+        if created:
+            unread_delta = 0 if notification_data.get("read") else 1
+            unread_counter.add(unread_delta)
+            notification = {k: v for k, v in notification_data.items() if k != "_id"}
+            notification["id"] = str(notification_data["_id"])
+            notification_hub.publish("notification", {
+                "notification": notification,
+                "unread_delta": unread_delta,
+            })
+        return created
+
+    @staticmethod
+    async def count_unread_notifications():
+        """Unread notification count, served from the in-memory counter"""
+        try:
+            return await unread_counter.get()
+        except Exception as e:
+            logger.error(f"Error counting unread notifications: {e}")
+            return 0
+
+    @staticmethod
+    async def get_notifications(limit: int = 100, before: str = None, after: str = None, type: str = None):
+        """Get one page of notifications, newest first.
+
+        Keyset pagination on (createdAt, _id): pass next_cursor as before for
+        older notifications, or prev_cursor as after for newer ones. Raises
+        ValueError for a malformed cursor.
+        """
+        query = {} if type is None else {"type": type}
+        if before or after:
+            created_at, last_id = decode_keyset_cursor(before or after)
+            op = "$lt" if before else "$gt"
+            query["$or"] = [
+                {"createdAt": {op: created_at}},
+                {"createdAt": created_at, "_id": {op: last_id}},
+            ]
+        # Walk towards the cursor from the far side when paging forwards.
+        direction = 1 if after else -1
+        try:
+            docs = await notifications_collection.find(query).sort(
+                [("createdAt", direction), ("_id", direction)]).limit(limit + 1).to_list(length=limit + 1)
+            more = len(docs) > limit
+            docs = docs[:limit]
+            if after:
+                docs.reverse()
+            next_cursor = prev_cursor = None
+            if docs:
+                if more or after:
+                    next_cursor = encode_keyset_cursor(docs[-1]["createdAt"], docs[-1]["_id"])
+                if (more and after) or before:
+                    prev_cursor = encode_keyset_cursor(docs[0]["createdAt"], docs[0]["_id"])
+            return {"items": [normalize_doc(doc) for doc in docs], "next_cursor": next_cursor, "prev_cursor": prev_cursor}
+        except Exception as e:
+            logger.error(f"Error getting notifications: {e}")
+            return {"items": [], "next_cursor": None, "prev_cursor": None}
 
     @staticmethod
     async def mark_notification_as_read(notification_id: str):
@@ -769,6 +849,9 @@ class Database:
                 {"_id": obj_id},
                 {"$set": {"read": True}}
             )
+            if result.modified_count > 0:
+                unread_counter.add(-1)
+                notification_hub.publish("read", {"id": notification_id, "unread_delta": -1})
             return result.modified_count > 0
         except Exception as e:
             logger.error(
@@ -778,12 +861,15 @@ class Database:
     @staticmethod
     async def mark_notifications_as_read():
         """Marks all unread notifications as read"""
-        # Change the filter from {"read": False} to {"read": {"$ne": True}}
-        # This finds documents where 'read' is false OR where the 'read' field doesn't exist at all.
-        await notifications_collection.update_many(
-            {"read": {"$ne": True}},
+        # Matches documents where 'read' is false OR where the field doesn't exist at all,
+        # written as $in rather than $ne so it can use the (read, createdAt) index.
+        result = await notifications_collection.update_many(
+            UNREAD_NOTIFICATION_QUERY,
             {"$set": {"read": True}}
         )
+        # Notifications still waiting in the write queue were not marked and stay counted.
+        unread_counter.add(-result.modified_count)
+        notification_hub.publish("read_all", {"unread_count": await Database.count_unread_notifications()})
         return True
 
     @staticmethod
@@ -791,6 +877,7 @@ class Database:
         """Deletes all notifications from the collection."""
         try:
             await notifications_collection.delete_many({})
+            notification_hub.publish("cleared", {"unread_count": await unread_counter.resync()})
             return True
         except Exception as e:
             logger.error(f"Error deleting all notifications: {e}")
@@ -801,26 +888,17 @@ class Database:
         """Get admin by username"""
         try:
             admin = await admin_collection.find_one({"username": username})
-            if admin:
-                admin["id"] = str(admin["_id"])
-                del admin["_id"]
-            return admin
+            return normalize_doc(admin)
         except Exception as e:
             logger.error(f"Error getting admin: {e}")
             return None
 
     @staticmethod
-    async def get_admins():
-        """Get all admin users, excluding their passwords"""
+    async def get_admins(fields: list = None):
+        """Get all admin users, excluding their passwords, optionally only the given fields"""
         try:
-            # {"password": 0} excludes the password field
-            cursor = admin_collection.find({}, {"password": 0})
-            admins = []
-            async for admin in cursor:
-                admin["id"] = str(admin["_id"])
-                del admin["_id"]
-                admins.append(admin)
-            return admins
+            # {"password": 0} excludes the password field; an inclusion projection never includes it
+            return await normalize_docs(admin_collection.find({}, projection(fields) or {"password": 0}))
         except Exception as e:
             logger.error(f"Error getting admins: {e}")
             return []
@@ -844,3 +922,41 @@ class Database:
         except Exception as e:
             logger.error(f"Error deleting admin {username}: {e}")
             return False
+
+
+# Admin search reads through the cached getters and re-indexes a section
+# whenever its cache entry is invalidated by a write.
+SEARCH_LOADERS = {
+    "profile": Database.get_profile,
+    "projects": Database.get_projects,
+    "skills": Database.get_skills,
+    "education": Database.get_all_education,
+    "experience": Database.get_all_experience,
+    "learning_journey": Database.get_learning_journey,
+    "growth_mindset": Database.get_growth_mindset,
+    "experiments": Database.get_experiments_section,
+    "contact_section": Database.get_contact_section,
+    "footer": Database.get_footer,
+}
+search_index = SearchIndex(SEARCH_LOADERS)
+suggest_index = SuggestIndex(SEARCH_LOADERS)
+section_cache.subscribe(search_index.mark_dirty)
+section_cache.subscribe(suggest_index.mark_dirty)
+
+# Notifications are written behind the request in batches; started and
+# drained by the FastAPI lifespan in server.py.
+notification_queue = NotificationQueue(
+    lambda docs: notifications_collection.insert_many(docs, ordered=False))
+# Live notification events for every open admin stream in this process.
+notification_hub = NotificationHub()
+
+
+async def _recount_unread_notifications():
+    # Queued notifications are counted from the queue whether or not their batch
+    # has landed yet, and excluded from the collection count so none is counted twice.
+    pending = notification_queue.pending()
+    count = await notifications_collection.count_documents(
+        {**UNREAD_NOTIFICATION_QUERY, "_id": {"$nin": [n["_id"] for n in pending]}})
+    return count + sum(1 for n in pending if not n.get("read"))
+
+unread_counter = UnreadCounter(_recount_unread_notifications)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Synthetic dataset generator and scaling report.
+
+Generates deterministic documents for the growable collections, validated
+against the models.py schemas, and bulk-loads them through seed_data:
+
+    python datagen.py load --size 100000
+    python datagen.py load --size 1000000 --collections projects,notifications
+
+Document i of a collection always gets the same id and, for a given
+--seed, the same content, so loads are upserts: rerunning is a no-op and
+growing from 10^4 to 10^5 only writes the new documents.
+
+The report grows every collection through a list of sizes and measures each
+endpoint's latency and allocation peak at every step, in-process against an
+in-memory MongoDB stand-in by default:
+
+    python datagen.py report --sizes 1000,10000 --output scaling.json
+    MONGO_URL=mongodb://localhost:27017 python datagen.py report --sizes 1000,10000,100000,1000000
+
+The report starts from the seed_data baseline. The in-memory stand-in is
+reseeded from scratch; a real database only has the baseline upserted
+unless --force is given, which clears the seeded collections first.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bson import ObjectId
+
+from models import (
+    ContactMessageCreate,
+    EducationCreate,
+    ExperienceCreate,
+    LearningJourneyCreate,
+    NotificationBase,
+    ProjectCreate,
+    SkillsBase,
+)
+
+WORDS = ["portfolio", "automation", "cloud", "dashboard", "pipeline", "realtime", "search", "design",
+         "scalable", "experiment", "learning", "agent", "api", "frontend", "backend", "data", "python",
+         "react", "mongo", "fastapi", "vision", "graph", "compiler", "network", "security", "mobile"]
+TECHNOLOGIES = ["Python", "FastAPI", "React", "MongoDB", "Docker", "AWS", "TailwindCSS", "Node", "AI",
+                "WebGL", "TypeScript", "Redis", "Kubernetes", "PostgreSQL", "Go", "Rust"]
+STATUSES = ["completed", "in-progress", "coming-soon", "planned"]
+NOTIFICATION_TYPES = ["info", "success", "warning", "error", "message", "user", "update", "security", "create", "delete"]
+
+# Seconds between consecutive synthetic createdAt values; 10^6 documents span
+# under six days, inside the notifications TTL.
+CREATED_AT_STEP_SECONDS = 0.5
+
+REPORT_ENDPOINTS = {
+    "projects": "/api/projects",
+    "skills": "/api/skills",
+    "education": "/api/education",
+    "experience": "/api/experience",
+    "learning_journey": "/api/learning-journey",
+    "portfolio": "/api/portfolio",
+    "messages": "/api/admin/messages",
+    "notifications": "/api/admin/notifications",
+    "search": "/api/admin/search?q=python",
+    "dashboard": "/api/admin/dashboard-summary",
+}
+
+
+def synthetic_id(collection: str, index: int) -> ObjectId:
+    """A stable ObjectId for the index-th synthetic document of a collection."""
+    return ObjectId(hashlib.sha256(f"{collection}:{index}".encode()).digest()[:12])
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words)).capitalize() + "."
+
+
+def _project(rng, i):
+    return {
+        "title": f"Synthetic project {i:07d}",
+        "description": _sentence(rng, 12),
+        "status": rng.choice(STATUSES[:3]),
+        "image": f"https://picsum.photos/seed/project-{i}/1000/600",
+        "liveUrl": None,
+        "githubUrl": None,
+        "year": rng.randint(2019, 2026),
+        "technologies": rng.sample(TECHNOLOGIES, 3),
+    }
+
+
+def _contact_message(rng, i):
+    return {
+        "name": f"Visitor {i:07d}",
+        "email": f"visitor{i}@example.com",
+        "message": _sentence(rng, 24),
+        "read": rng.random() < 0.5,
+    }
+
+
+def _notification(rng, i):
+    return {
+        "message": _sentence(rng, 8),
+        "type": rng.choice(NOTIFICATION_TYPES),
+        "read": rng.random() < 0.5,
+    }
+
+
+def _education(rng, i):
+    start = rng.randint(2005, 2024)
+    return {
+        "degree": rng.choice(["B.Tech", "M.Tech", "B.Sc", "M.Sc", "Diploma", "Certificate"]),
+        "program": f"{rng.choice(WORDS).capitalize()} Engineering",
+        "institution": f"Synthetic Institute {i:07d}",
+        "university": f"Synthetic University {rng.randrange(1000):03d}",
+        "location": rng.choice(["Uttarakhand, IN", "Odisha, IN", "Karnataka, IN", "Remote"]),
+        "start": str(start),
+        "end": str(start + 4),
+        "year": str(start + 4),
+        "progress": rng.randint(0, 100),
+        "achievements": [_sentence(rng, 4) for _ in range(2)],
+        "coursework": rng.sample(TECHNOLOGIES, 4),
+    }
+
+
+def _experience(rng, i):
+    return {
+        "role": rng.choice(["Software Developer", "Frontend Engineer", "Data Intern", "Cloud Engineer"]),
+        "company": f"Synthetic Company {i:07d}",
+        "location": rng.choice(["New York, USA", "Bengaluru, IN", "Remote"]),
+        "start": f"{rng.randint(2015, 2025)}-{rng.randint(1, 12):02d}",
+        "bullets": [_sentence(rng, 10) for _ in range(3)],
+        "technologies": rng.sample(TECHNOLOGIES, 4),
+        "type": rng.choice(["work", "internship", "volunteering"]),
+        "t": round(rng.random(), 3),
+        "description": _sentence(rng, 16),
+    }
+
+
+def _learning_phase(rng, i):
+    return {
+        "phase": f"Synthetic phase {i:07d}",
+        "skills": rng.sample(TECHNOLOGIES, 3),
+        "status": rng.choice(["completed", "in-progress", "planned"]),
+        "order": i,
+    }
+
+
+def _skills(rng, i):
+    return {
+        "category": f"Synthetic category {i:07d}",
+        "skills": [{"name": name, "proficiency": rng.randint(0, 100)} for name in rng.sample(TECHNOLOGIES, 5)],
+    }
+
+
+# collection -> (schema the generated fields must satisfy, field generator,
+# timestamp fields set to the document's createdAt)
+GENERATORS = {
+    "projects": (ProjectCreate, _project, ("createdAt", "updatedAt")),
+    "contact_messages": (ContactMessageCreate, _contact_message, ("createdAt",)),
+    "notifications": (NotificationBase, _notification, ("createdAt",)),
+    "education": (EducationCreate, _education, ("updatedAt",)),
+    "experience": (ExperienceCreate, _experience, ("updatedAt",)),
+    "learning_journey": (LearningJourneyCreate, _learning_phase, ("updatedAt",)),
+    "skills": (SkillsBase, _skills, ()),
+}
+
+
+def generate(collection: str, count: int, seed: int = 0, start: int = 0, now: datetime = None, validate: bool = True):
+    """Yield documents start..count-1 of a synthetic collection.
+
+    Each document draws from its own RNG seeded by (seed, collection, index),
+    so any range can be generated independently of the ones before it.
+    """
+    schema, fields, timestamps = GENERATORS[collection]
+    now = now or datetime.utcnow().replace(microsecond=0)
+    for i in range(start, count):
+        rng = random.Random(f"{seed}:{collection}:{i}")
+        doc = fields(rng, i)
+        if validate:
+            schema(**doc)
+        created = now - timedelta(seconds=i * CREATED_AT_STEP_SECONDS)
+        for key in timestamps:
+            doc[key] = created
+        # Skills are keyed by category like the admin API writes them.
+        doc["_id"] = doc["category"] if collection == "skills" else synthetic_id(collection, i)
+        yield doc
+
+
+async def load(sizes: dict, seed: int = 0, start: dict = None, validate: bool = True):
+    """Bulk-upsert sizes[collection] synthetic documents into each collection, concurrently.
+
+    start optionally gives, per collection, how many documents already exist
+    from an earlier load with the same seed; only the rest are written.
+    """
+    import seed_data
+    from database import Database
+
+    await Database.connect()
+    start = start or {}
+    now = datetime.utcnow().replace(microsecond=0)
+    counts = await asyncio.gather(*(
+        seed_data.load_collection(
+            name, generate(name, size, seed, start.get(name, 0), now, validate), upsert=True, keys=("_id",))
+        for name, size in sizes.items()))
+    await seed_data.refresh_caches(sizes)
+    return dict(zip(sizes, counts))
+
+
+# --- Scaling report -------------------------------------------------------
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+async def measure_endpoint(client, path: str, headers: dict, repeat: int):
+    """Cold latency, warm p50/p95, response size and allocation peak for one GET."""
+    import seed_data
+    from benchmark import ms, percentile
+    from cache import section_cache
+
+    def cold():
+        # Drop every cached section (and with it the search indexes) so the
+        # first request does the full, size-dependent work.
+        section_cache.invalidate(*seed_data.SEED_KEYS)
+
+    cold()
+    started = time.perf_counter()
+    response = await client.get(path, headers=headers)
+    cold_s = time.perf_counter() - started
+
+    warm = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await client.get(path, headers=headers)
+        warm.append(time.perf_counter() - started)
+    warm.sort()
+
+    cold()
+    tracemalloc.start()
+    try:
+        await client.get(path, headers=headers)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "bytes": len(response.content),
+        "cold_ms": ms(cold_s),
+        "p50_ms": ms(percentile(warm, 50)),
+        "p95_ms": ms(percentile(warm, 95)),
+        "peak_alloc_kb": round(peak / 1024, 1),
+    }
+
+
+async def report(args):
+    os.environ.setdefault("MONGO_URL", "mongomock://")
+    os.environ.setdefault("DB_NAME", "portfolio_scale")
+    import httpx
+    import seed_data
+    import server
+
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("passlib").setLevel(logging.ERROR)
+    collections = args.collections.split(",") if args.collections else list(GENERATORS)
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    endpoints = {name: REPORT_ENDPOINTS[name] for name in (args.endpoints.split(",") if args.endpoints else REPORT_ENDPOINTS)}
+
+    steps = []
+    # Baseline content and the admin account; synthetic documents go on top.
+    # Only wipe a real database when asked to.
+    reseed = args.force or os.environ["MONGO_URL"].startswith("mongomock://")
+    await seed_data.seed_database(upsert=not reseed)
+    transport = httpx.ASGITransport(app=server.app)
+    async with server.lifespan(server.app), httpx.AsyncClient(transport=transport, base_url="http://scale", timeout=None) as client:
+        response = await client.post("/api/admin/login", json={"username": args.username, "password": args.password})
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        loaded = 0
+        for size in sizes:
+            print(f"📦 Growing {', '.join(collections)} to {size} documents...")
+            started = time.perf_counter()
+            await load({name: size for name in collections}, args.seed, {name: loaded for name in collections})
+            load_s = time.perf_counter() - started
+            loaded = size
+
+            results = {}
+            for name, path in endpoints.items():
+                results[name] = await measure_endpoint(client, path, headers, args.repeat)
+                print(f"   {name:<17} cold {results[name]['cold_ms']:>10.1f} ms   "
+                      f"p50 {results[name]['p50_ms']:>10.1f} ms   "
+                      f"peak {results[name]['peak_alloc_kb']:>10.1f} KiB   {results[name]['bytes']} B")
+            steps.append({"size": size, "load_s": round(load_s, 3), "max_rss_mb": _max_rss_mb(), "endpoints": results})
+
+    return {
+        "meta": {
+            "target": os.environ["MONGO_URL"],
+            "collections": collections,
+            "sizes": sizes,
+            "seed": args.seed,
+            "reseeded": reseed,
+            "repeat": args.repeat,
+        },
+        "steps": steps,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic datasets and report how endpoints scale with them.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load_parser = commands.add_parser("load", help="Bulk-load synthetic documents into the configured database")
+    load_parser.add_argument("--size", type=int, required=True, help="Documents per collection")
+    load_parser.add_argument("--collections", help=f"Comma-separated subset of: {', '.join(GENERATORS)}")
+    load_parser.add_argument("--seed", type=int, default=0, help="Content seed (ids don't depend on it)")
+    load_parser.add_argument("--no-validate", action="store_true", help="Skip validating documents against models.py")
+
+    report_parser = commands.add_parser("report", help="Measure endpoint latency and memory as collections grow")
+    report_parser.add_argument("--sizes", default="1000,10000", help="Comma-separated collection sizes (default 1000,10000)")
+    report_parser.add_argument("--collections", help=f"Comma-separated subset of: {', '.join(GENERATORS)}")
+    report_parser.add_argument("--endpoints", help=f"Comma-separated subset of: {', '.join(REPORT_ENDPOINTS)}")
+    report_parser.add_argument("--repeat", type=int, default=10, help="Warm requests per endpoint and size (default 10)")
+    report_parser.add_argument("--seed", type=int, default=0, help="Content seed")
+    report_parser.add_argument("--force", action="store_true",
+                               help="Clear and reseed the baseline collections of a real database first "
+                                    "(always done for mongomock://; otherwise the baseline is upserted)")
+    report_parser.add_argument("--username", default="shreeya")
+    report_parser.add_argument("--password", default="shreeya123")
+    report_parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if args.command == "load":
+        collections = args.collections.split(",") if args.collections else list(GENERATORS)
+
+        async def run():
+            from database import Database
+            try:
+                return await load({name: args.size for name in collections}, args.seed, validate=not args.no_validate)
+            finally:
+                Database.close()
+
+        started = time.perf_counter()
+        counts = asyncio.run(run())
+        for name, count in counts.items():
+            print(f"   {name}: {count}")
+        print(f"✅ Loaded in {time.perf_counter() - started:.2f}s")
+        return
+
+    # Keep stdout clean for the report; progress goes to stderr.
+    with contextlib.redirect_stdout(sys.stderr):
+        result = asyncio.run(report(args))
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
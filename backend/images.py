@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from starlette.concurrency import run_in_threadpool
+from uploads import HASH_LENGTH, HASHED_NAME_RE, safe_filename
+
+logger = logging.getLogger(__name__)
+
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+# Breakpoints, in pixels, that derivatives are produced for
+IMAGE_VARIANT_WIDTHS = tuple(sorted(int(w) for w in os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,960,1280").split(",")))
+# Encoder quality per output format; AVIF is skipped when Pillow lacks support.
+IMAGE_QUALITY = {"avif": 55, "webp": 80}
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tiff", ".avif"}
+
+
+def _supported_formats():
+    try:
+        from PIL import features
+    except ImportError:
+        return ()
+    return tuple(fmt for fmt in IMAGE_QUALITY if features.check(fmt))
+
+
+def _derivative_name(stem: str, content_hash: str, width: int, fmt: str) -> str:
+    # The name hashes everything that shapes the output, so it is safe to cache forever.
+    key = hashlib.sha256(f"{content_hash}:{width}:{fmt}:{IMAGE_QUALITY[fmt]}".encode()).hexdigest()
+    return f"{stem}-{width}w.{key[:HASH_LENGTH]}.{fmt}"
+
+
+def render_variants(source: str, out_dir: str, stem: str, content_hash: str, widths, formats):
+    """Resize source to each width (never upscaling) in each format.
+
+    Runs in a worker process. Derivatives already on disk are reused.
+    Returns [{"name", "width", "height", "format"}], smallest first.
+    """
+    from PIL import Image, ImageOps
+
+    variants = []
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.mode in ("LA", "P", "PA") else "RGB")
+        targets = sorted({w for w in widths if w < image.width} | {min(image.width, max(widths))})
+        for width in targets:
+            height = max(round(image.height * width / image.width), 1)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                name = _derivative_name(stem, content_hash, width, fmt)
+                path = os.path.join(out_dir, name)
+                if not os.path.exists(path):
+                    partial = path + ".part"
+                    resized.save(partial, format=fmt.upper(), quality=IMAGE_QUALITY[fmt])
+                    os.replace(partial, path)
+                variants.append({"name": name, "width": width, "height": height, "format": fmt})
+    return variants
+
+
+def srcset(variants, fmt: str) -> str:
+    """The srcset attribute value for one format of a variant list."""
+    return ", ".join(f"{v['url']} {v['width']}w" for v in variants if v["format"] == fmt)
+
+
+class ImageProcessor:
+    """Produces responsive WebP/AVIF derivatives of uploaded images.
+
+    Derivatives live in <static>/images and are resized in a process pool so
+    Pillow never holds the event loop or the GIL. A JSON manifest per source
+    content hash caches the variant list on disk, and concurrent requests for
+    the same image share one render.
+    """
+
+    def __init__(self, static_dir: Path, static_url: str = "/static", workers: int = IMAGE_WORKERS,
+                 widths=IMAGE_VARIANT_WIDTHS):
+        self.static_dir = Path(static_dir)
+        self.static_url = static_url.rstrip("/")
+        self.out_dir = self.static_dir / "images"
+        self.workers = workers
+        self.widths = tuple(widths)
+        self.formats = _supported_formats()
+        self._executor = None
+        self._pending = {}
+        self.rendered = 0
+        self.cached = 0
+        self.failed = 0
+
+    def _local_path(self, url: str):
+        """Map a /static URL to a file inside static_dir, or None."""
+        if not url or not url.startswith(self.static_url + "/"):
+            return None
+        path = (self.static_dir / url[len(self.static_url) + 1:]).resolve()
+        if self.static_dir.resolve() not in path.parents or path.suffix.lower() not in IMAGE_SUFFIXES:
+            return None
+        return path
+
+    @staticmethod
+    def _content_hash(path: Path) -> str:
+        match = HASHED_NAME_RE.search(path.name)
+        if match is not None:
+            return match.group(0).split(".")[1]
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()[:HASH_LENGTH]
+
+    def _read_manifest(self, manifest: Path):
+        try:
+            data = json.loads(manifest.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("widths") != list(self.widths) or data.get("formats") != list(self.formats):
+            return None
+        if not all((self.out_dir / v["name"]).exists() for v in data["variants"]):
+            return None
+        return data["variants"]
+
+    async def variants_for(self, url: str):
+        """Responsive variants for an image URL, rendering them if needed.
+
+        Returns [{"url", "width", "height", "format"}]; empty for external
+        URLs, missing files, or when Pillow isn't available.
+        """
+        source = self._local_path(url)
+        if source is None or not self.formats:
+            return []
+        try:
+            if not await run_in_threadpool(source.is_file):
+                return []
+            content_hash = await run_in_threadpool(self._content_hash, source)
+            task = self._pending.get(content_hash)
+            if task is None:
+                task = asyncio.ensure_future(self._variants(source, content_hash))
+                self._pending[content_hash] = task
+                task.add_done_callback(lambda _: self._pending.pop(content_hash, None))
+            variants = await asyncio.shield(task)
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Error generating image variants for {url}: {e}")
+            return []
+        return [{"url": f"{self.static_url}/images/{v['name']}", **{k: v[k] for k in ("width", "height", "format")}}
+                for v in variants]
+
+    async def _variants(self, source: Path, content_hash: str):
+        manifest = self.out_dir / f"{content_hash}.json"
+        variants = await run_in_threadpool(self._read_manifest, manifest)
+        if variants is not None:
+            self.cached += 1
+            return variants
+        await run_in_threadpool(self.out_dir.mkdir, parents=True, exist_ok=True)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        stem, _ = safe_filename(HASHED_NAME_RE.sub("", source.name))
+        loop = asyncio.get_running_loop()
+        variants = await loop.run_in_executor(
+            self._executor, render_variants, str(source), str(self.out_dir), stem, content_hash,
+            self.widths, self.formats)
+        await run_in_threadpool(manifest.write_text, json.dumps(
+            {"widths": list(self.widths), "formats": list(self.formats), "variants": variants}))
+        self.rendered += 1
+        return variants
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "formats": list(self.formats),
+            "widths": list(self.widths),
+            "in_flight": len(self._pending),
+            "rendered": self.rendered,
+            "cached": self.cached,
+            "failed": self.failed,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,89 @@
+from pymongo import ASCENDING, DESCENDING
+
+# Every index the app's queries rely on, by collection: (keys, options).
+# Database.create_indexes builds them all concurrently on startup and then
+# checks them against index_information().
+INDEXES = {
+    "notifications": [
+        # Notifications expire 10 days after createdAt.
+        ([("createdAt", ASCENDING)], {"expireAfterSeconds": 864000}),
+        # Feed pages are read newest first, optionally filtered by type;
+        # the unread count and "mark all read" go through (read, createdAt).
+        ([("createdAt", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("read", ASCENDING), ("createdAt", DESCENDING)], {}),
+        ([("type", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)], {}),
+    ],
+    "contact_messages": [
+        # Inbox pages are read newest first, optionally filtered by read state.
+        ([("createdAt", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("read", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)], {}),
+    ],
+    # The sort orders of the public list sections
+    "projects": [([("createdAt", DESCENDING)], {})],
+    "education": [([("year", DESCENDING)], {})],
+    "experience": [([("start", DESCENDING)], {})],
+    "learning_journey": [([("order", ASCENDING)], {})],
+    # Point lookups; usernames and skill categories are one document each.
+    "admin": [([("username", ASCENDING)], {"unique": True})],
+    "skills": [([("category", ASCENDING)], {"unique": True})],
+}
+
+# Options that must match for an existing index to count as the registered one
+CHECKED_OPTIONS = ("unique", "expireAfterSeconds", "sparse")
+
+
+def _normalize_keys(keys):
+    return [(field, int(direction) if isinstance(direction, (int, float)) else direction)
+            for field, direction in keys]
+
+
+def index_problems(collection: str, specs, index_information: dict):
+    """Registered indexes of a collection that are missing or differ, as readable strings."""
+    existing = {tuple(_normalize_keys(info["key"])): info for info in index_information.values()}
+    problems = []
+    for keys, options in specs:
+        info = existing.get(tuple(_normalize_keys(keys)))
+        label = f"{collection} {_normalize_keys(keys)}"
+        if info is None:
+            problems.append(f"{label}: missing")
+            continue
+        for option in CHECKED_OPTIONS:
+            if info.get(option) != options.get(option) and (info.get(option) or options.get(option)):
+                problems.append(f"{label}: {option} is {info.get(option)!r}, expected {options.get(option)!r}")
+    return problems
+
+
+def _stages(plan):
+    """Stage names of an explain plan tree, outermost first."""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_stages(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            stages.extend(_stages(value))
+    return stages
+
+
+def summarize_plan(explain: dict):
+    """The parts of a find() explain output that matter for spotting slow queries.
+
+    A plan is flagged slow when it scans the whole collection or sorts in
+    memory; both grow with the collection instead of the page size.
+    """
+    stages = _stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+    stats = explain.get("executionStats", {})
+    collection_scan = "COLLSCAN" in stages
+    in_memory_sort = "SORT" in stages
+    return {
+        "stages": stages,
+        "collection_scan": collection_scan,
+        "in_memory_sort": in_memory_sort,
+        "returned": stats.get("nReturned"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "millis": stats.get("executionTimeMillis"),
+        "slow": collection_scan or in_memory_sort,
+    }
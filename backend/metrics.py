@@ -0,0 +1,360 @@
+import bisect
+import logging
+import os
+import threading
+import time
+from pymongo import common, monitoring
+
+logger = logging.getLogger(__name__)
+
+# MongoDB commands slower than this are logged with their query shape
+MONGO_SLOW_QUERY_MS = float(os.getenv("MONGO_SLOW_QUERY_MS", "100"))
+# In-flight commands remembered for timing; the oldest are forgotten past this
+MONGO_MAX_PENDING_COMMANDS = int(os.getenv("MONGO_MAX_PENDING_COMMANDS", "10000"))
+# Bearer token scrapers must send to read /metrics; the endpoint is off when unset.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name: str, help: str, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(labels.get(name, "") for name in self.labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labels, key)} {value}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # Per-bucket (non-cumulative) counts, plus +Inf, then sum.
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._values.items()]
+        names = self.labels + ("le",)
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(names, (*key, bound))} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {series[-1]}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """A minimal Prometheus registry rendering the text exposition format.
+
+    Besides the metrics created through it, components that already keep a
+    stats() dict (the password hasher, notification queue, section cache,
+    ...) are exported as gauges via add_stats, read at scrape time.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._stats = []
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels=()):
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels=()):
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def add_stats(self, prefix: str, stats):
+        """Export the numeric values of stats() as <prefix>_<key> gauges."""
+        self._stats.append((prefix, stats))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for prefix, stats in self._stats:
+            try:
+                values = stats()
+            except Exception as e:
+                logger.error(f"Error collecting {prefix} stats: {e}")
+                continue
+            for key, value in values.items():
+                if isinstance(value, bool):
+                    value = int(value)
+                if isinstance(value, (int, float)):
+                    lines.append(f"# TYPE {prefix}_{key} gauge")
+                    lines.append(f"{prefix}_{key} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route and status code", ("method", "route", "status"))
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route"))
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served")
+json_encode_duration_seconds = registry.histogram(
+    "json_encode_duration_seconds", "Time spent serializing response bodies to JSON",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1))
+mongodb_command_duration_seconds = registry.histogram(
+    "mongodb_command_duration_seconds", "MongoDB command latency by collection and command",
+    ("collection", "command"))
+mongodb_command_failures_total = registry.counter(
+    "mongodb_command_failures_total", "MongoDB commands that failed", ("collection", "command"))
+mongodb_slow_commands_total = registry.counter(
+    "mongodb_slow_commands_total", "MongoDB commands slower than MONGO_SLOW_QUERY_MS", ("collection", "command"))
+mongodb_pool_wait_seconds = registry.histogram(
+    "mongodb_pool_wait_seconds", "Time spent waiting to check a connection out of the MongoDB pool",
+    ("address",), buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0))
+mongodb_pool_checkout_failures_total = registry.counter(
+    "mongodb_pool_checkout_failures_total", "Connection checkouts that failed, by reason", ("address", "reason"))
+mongodb_pool_connections = registry.gauge(
+    "mongodb_pool_connections", "Open connections in the MongoDB pool", ("address",))
+mongodb_pool_checked_out = registry.gauge(
+    "mongodb_pool_checked_out", "MongoDB connections currently checked out", ("address",))
+mongodb_pool_max_size = registry.gauge(
+    "mongodb_pool_max_size", "Configured maximum size of the MongoDB pool", ("address",))
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, status and in-flight requests.
+
+    Requests are labelled with the matched route template ("/api/projects/{project_id}")
+    or mount prefix ("/static"), never the raw path, to keep label cardinality
+    bounded. Streaming responses are timed until the stream closes.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        root_path = scope.get("root_path", "")
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            if route is not None:
+                label = route.path
+            elif scope.get("root_path", "") != root_path:
+                label = scope["root_path"][len(root_path):]
+            else:
+                label = "<unmatched>"
+            http_request_duration_seconds.observe(elapsed, method=scope["method"], route=label)
+            http_requests_total.inc(method=scope["method"], route=label, status=status)
+
+
+# The parts of a command body query_shape looks at
+SHAPE_KEYS = ("filter", "query", "sort")
+
+
+def query_shape(command) -> str:
+    """The field names a command filters and sorts on, without their values."""
+    parts = []
+    for key in SHAPE_KEYS:
+        value = command.get(key)
+        if isinstance(value, dict) and value:
+            parts.append(f"{key}={sorted(value)}")
+    return " ".join(parts)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Times every MongoDB command, labelled by collection and command name.
+
+    pymongo calls these hooks from Motor's worker threads; the started event
+    is the only one that carries the collection name and the command body,
+    so the collection and the filter/sort parts of the body are remembered
+    per (connection, request id) until the command finishes. At most
+    max_pending commands are remembered; a command that never reports back
+    is eventually forgotten. Commands slower than MONGO_SLOW_QUERY_MS are
+    counted and logged with their query shape; Database.explain_queries
+    shows the plans.
+    """
+
+    def __init__(self, slow_ms: float = MONGO_SLOW_QUERY_MS, max_pending: int = MONGO_MAX_PENDING_COMMANDS):
+        self.slow_seconds = slow_ms / 1000
+        self.max_pending = max_pending
+        self._commands = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        command = event.command
+        collection = command.get(event.command_name)
+        if not isinstance(collection, str):
+            # getMore names the cursor id first and the collection separately
+            collection = command.get("collection")
+        shape = {key: command[key] for key in SHAPE_KEYS if key in command}
+        with self._lock:
+            self._commands[(event.connection_id, event.request_id)] = (
+                collection if isinstance(collection, str) else "", shape)
+            while len(self._commands) > self.max_pending:
+                del self._commands[next(iter(self._commands))]
+
+    def _finish(self, event):
+        with self._lock:
+            collection, command = self._commands.pop((event.connection_id, event.request_id), ("", {}))
+        seconds = event.duration_micros / 1e6
+        mongodb_command_duration_seconds.observe(seconds, collection=collection, command=event.command_name)
+        if seconds >= self.slow_seconds:
+            mongodb_slow_commands_total.inc(collection=collection, command=event.command_name)
+            logger.warning(f"Slow MongoDB {event.command_name} on {collection or '-'}: "
+                           f"{seconds * 1000:.1f} ms {query_shape(command)}")
+        return collection
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        collection = self._finish(event)
+        mongodb_command_failures_total.inc(collection=collection, command=event.command_name)
+
+
+mongo_command_metrics = MongoCommandMetrics()
+
+
+def _address(address) -> str:
+    return f"{address[0]}:{address[1]}"
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool size, utilisation and checkout wait time per server.
+
+    A checkout starts and finishes on the same worker thread, so the start
+    time is remembered per (thread, server) until the connection is handed
+    out or the checkout fails. The wait histogram is the one to watch when
+    sizing maxPoolSize for several app workers sharing one deployment.
+    """
+
+    def __init__(self):
+        self._checkouts = {}
+
+    def pool_created(self, event):
+        mongodb_pool_max_size.set(event.options.get("maxPoolSize", common.MAX_POOL_SIZE),
+                                  address=_address(event.address))
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        mongodb_pool_connections.inc(address=_address(event.address))
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        mongodb_pool_connections.dec(address=_address(event.address))
+
+    def connection_check_out_started(self, event):
+        self._checkouts[(threading.get_ident(), event.address)] = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        started = self._checkouts.pop((threading.get_ident(), event.address), None)
+        address = _address(event.address)
+        if started is not None:
+            mongodb_pool_wait_seconds.observe(time.perf_counter() - started, address=address)
+        mongodb_pool_checked_out.inc(address=address)
+
+    def connection_check_out_failed(self, event):
+        started = self._checkouts.pop((threading.get_ident(), event.address), None)
+        address = _address(event.address)
+        if started is not None:
+            mongodb_pool_wait_seconds.observe(time.perf_counter() - started, address=address)
+        mongodb_pool_checkout_failures_total.inc(address=address, reason=event.reason)
+
+    def connection_checked_in(self, event):
+        mongodb_pool_checked_out.dec(address=_address(event.address))
+
+
+mongo_pool_metrics = MongoPoolMetrics()
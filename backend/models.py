@@ -58,8 +58,16 @@ class ProjectBase(BaseModel):
     
 
 
+class ImageVariant(BaseModel):
+    url: str
+    width: int
+    height: int
+    format: str
+
+
 class Project(ProjectBase):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    imageVariants: List[ImageVariant] = []
     createdAt: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc))
     updatedAt: datetime = Field(
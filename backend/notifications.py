@@ -0,0 +1,228 @@
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_QUEUE_SIZE = int(os.getenv("NOTIFICATION_QUEUE_SIZE", "1000"))
+NOTIFICATION_BATCH_SIZE = int(os.getenv("NOTIFICATION_BATCH_SIZE", "100"))
+NOTIFICATION_FLUSH_INTERVAL_SECONDS = float(os.getenv("NOTIFICATION_FLUSH_INTERVAL_SECONDS", "0.5"))
+NOTIFICATION_UNREAD_RESYNC_SECONDS = float(os.getenv("NOTIFICATION_UNREAD_RESYNC_SECONDS", "300"))
+
+_STOP = object()
+
+
+class NotificationQueue:
+    """Write-behind buffer that batches notification inserts.
+
+    Request handlers enqueue without waiting on MongoDB; a background task
+    writes batches of up to batch_size documents, waiting at most
+    flush_interval seconds for a batch to fill. When the queue is full new
+    notifications are dropped and counted rather than blocking the request.
+    """
+
+    def __init__(self, writer, max_size: int = NOTIFICATION_QUEUE_SIZE,
+                 batch_size: int = NOTIFICATION_BATCH_SIZE,
+                 flush_interval: float = NOTIFICATION_FLUSH_INTERVAL_SECONDS):
+        self._writer = writer
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = None
+        self._task = None
+        self._closing = False
+        self._pending = {}
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.max_depth = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._closing
+
+    def start(self):
+        """Start the background flusher on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._closing = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0):
+        """Flush everything queued so far, then stop the flusher."""
+        if not self.running:
+            return
+        # From here on Database.create_notification writes directly.
+        self._closing = True
+        await self._queue.put(_STOP)
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Notification flusher did not drain within {timeout}s; "
+                         f"{self._queue.qsize()} notifications lost")
+            self._task.cancel()
+        self._task = None
+
+    def put(self, notification: dict) -> bool:
+        """Queue a notification; returns False if it was dropped."""
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Notification queue full ({self.max_size}); dropping notification")
+            return False
+        self._pending[id(notification)] = notification
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    async def _run(self):
+        while True:
+            first = await self._queue.get()
+            batch, stopping = [], first is _STOP
+            if not stopping:
+                batch.append(first)
+                if self._queue.qsize() < self.batch_size - 1:
+                    await asyncio.sleep(self.flush_interval)
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+            if batch:
+                await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch):
+        try:
+            await self._writer(batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Error writing {len(batch)} notifications: {e}")
+        finally:
+            for notification in batch:
+                self._pending.pop(id(notification), None)
+
+    def pending(self):
+        """Notifications accepted by put() that have not been written yet."""
+        return list(self._pending.values())
+
+    def stats(self):
+        return {
+            "running": self.running,
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
+NOTIFICATION_STREAM_BUFFER = int(os.getenv("NOTIFICATION_STREAM_BUFFER", "100"))
+
+
+class NotificationHub:
+    """In-process pub/sub fan-out for admin notification streams.
+
+    Each open stream owns a small queue; publish() never blocks. A subscriber
+    that falls buffer events behind has its backlog replaced by a single
+    "resync" event telling the client to refetch instead of replaying.
+    """
+
+    def __init__(self, buffer: int = NOTIFICATION_STREAM_BUFFER):
+        self.buffer = buffer
+        self._subscribers = set()
+        self.published = 0
+        self.resyncs = 0
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.buffer)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: dict):
+        self.published += 1
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait((event, data))
+            except asyncio.QueueFull:
+                self.resyncs += 1
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(("resync", {}))
+
+    def stats(self):
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "resyncs": self.resyncs,
+        }
+
+
+class UnreadCounter:
+    """Unread notification count kept in memory between periodic recounts.
+
+    Writes adjust the count with add(); get() only queries MongoDB when the
+    count is unknown or older than resync_interval. The recount corrects the
+    drift that deltas cannot see: TTL expiry, failed batch writes and other
+    workers' writes. Deltas added while a recount is running are applied on
+    top of its result rather than being overwritten by it.
+    """
+
+    def __init__(self, recount, resync_interval: float = NOTIFICATION_UNREAD_RESYNC_SECONDS):
+        self._recount = recount
+        self.resync_interval = resync_interval
+        self._value = None
+        # Running total of every delta, so a recount can tell which arrived during it
+        self._added = 0
+        self._synced_at = 0.0
+        self._lock = asyncio.Lock()
+        self.resyncs = 0
+
+    def _stale(self) -> bool:
+        return self._value is None or time.monotonic() - self._synced_at > self.resync_interval
+
+    def add(self, delta: int):
+        self._added += delta
+        if self._value is not None:
+            self._value = max(0, self._value + delta)
+
+    async def get(self) -> int:
+        if self._stale():
+            async with self._lock:
+                if self._stale():
+                    await self.resync()
+        return self._value
+
+    async def resync(self) -> int:
+        """Replace the count with a fresh recount."""
+        added = self._added
+        count = await self._recount()
+        self._value = max(0, count + self._added - added)
+        self._synced_at = time.monotonic()
+        self.resyncs += 1
+        return self._value
+
+    def stats(self):
+        return {
+            "value": self._value,
+            "resyncs": self.resyncs,
+            "resync_interval_seconds": self.resync_interval,
+        }
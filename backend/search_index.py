@@ -0,0 +1,605 @@
+import asyncio
+import base64
+import bisect
+import json
+import logging
+import re
+from collections import Counter, defaultdict, namedtuple
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Result keys returned by /api/admin/search, in display order.
+RESULT_SECTIONS = [
+    "profile", "projects", "skills", "education", "experience",
+    "learning_journey", "growth_mindset", "experiments", "contact", "footer",
+]
+
+
+def tokenize(text) -> list:
+    """Lower-case alphanumeric tokens of text."""
+    if not isinstance(text, str):
+        return []
+    return TOKEN_RE.findall(text.lower())
+
+
+# Ranking: hits on names and titles outrank hits buried in descriptions or URLs,
+# whole-token hits outrank prefix hits, and recently edited content gets a boost
+# that halves every RECENCY_HALF_LIFE_DAYS.
+TITLE, LABEL, TEXT, URL = 3.0, 2.0, 1.0, 0.5
+PREFIX_MATCH = 0.5
+EXACT_PHRASE_BONUS = 1.5
+RECENCY_BOOST = 0.5
+RECENCY_HALF_LIFE_DAYS = 90
+
+_Entry = namedtuple("_Entry", "key section ref tokens texts result weight timestamp")
+
+
+def empty_results():
+    return {section: [] for section in RESULT_SECTIONS}
+
+
+def _label(field: str) -> str:
+    return field.replace('_', ' ').capitalize()
+
+
+def _timestamp(doc):
+    value = doc.get("updatedAt") or doc.get("createdAt")
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _doc_ref(doc) -> str:
+    """The identity of a document that survives re-indexing."""
+    for field in ("id", "_id", "category", "name"):
+        if doc.get(field):
+            return str(doc[field])
+    return ""
+
+
+def _string_fields(doc, weights):
+    for field, weight in weights.items():
+        value = doc.get(field)
+        if isinstance(value, str):
+            yield [value], {"field": _label(field), "value": value}, weight, doc
+
+
+# ----------------------------------------------------------------------------
+# Extractors: turn the value returned by a Database getter into index entries.
+# Each yields (texts, result, weight, doc) where texts are the strings the entry
+# matches on, result is the item returned to the admin UI for a hit and doc is
+# the document whose timestamp drives the recency boost.
+# ----------------------------------------------------------------------------
+
+def _extract_profile(doc):
+    if doc:
+        yield from _string_fields(doc, {
+            "name": TITLE, "headline": LABEL, "bio": TEXT, "highlights": TEXT,
+            "location": LABEL, "email": URL, "linkedin": URL,
+        })
+
+
+def _extract_projects(docs):
+    for project in docs or []:
+        base = {"id": project.get("id"), "title": project.get("title")}
+        if isinstance(project.get("title"), str):
+            yield [project["title"]], {**base, "match": "Match in title"}, TITLE, project
+        if isinstance(project.get("description"), str):
+            yield [project["description"]], {**base, "match": "Match in description"}, TEXT, project
+        if isinstance(project.get("status"), str):
+            yield [project["status"]], {**base, "match": f"Match in status: '{project['status']}'"}, LABEL, project
+        for tech in project.get("technologies") or []:
+            yield [tech], {**base, "match": f"Match in technology: '{tech}'"}, LABEL, project
+        if project.get("liveUrl"):
+            yield [project["liveUrl"]], {**base, "match": "Match in Live URL"}, URL, project
+        if project.get("githubUrl"):
+            yield [project["githubUrl"]], {**base, "match": "Match in GitHub URL"}, URL, project
+
+
+def _extract_skills(skills_by_category):
+    for category, skills in (skills_by_category or {}).items():
+        yield [category], {"type": "category", "name": category}, TITLE, {}
+        seen = set()
+        for skill in skills or []:
+            name = skill.get("name")
+            if name and name not in seen:
+                seen.add(name)
+                yield [name], {
+                    "type": "skill",
+                    "name": name,
+                    "proficiency": skill.get("proficiency"),
+                    "category": category,
+                }, LABEL, skill
+
+
+def _extract_education(docs):
+    for doc in docs or []:
+        yield from _string_fields(doc, {"degree": TITLE, "institution": LABEL, "year": LABEL})
+
+
+def _extract_experience(docs):
+    for doc in docs or []:
+        yield from _string_fields(doc, {
+            "role": TITLE, "company": LABEL, "location": LABEL, "description": TEXT,
+            "main_title": TITLE, "main_message": TEXT, "cta_title": LABEL, "cta_message": TEXT,
+        })
+        for goal in doc.get("goals") or []:
+            yield [goal.get("title"), goal.get("description")], {
+                "field": f"Goal: {goal.get('title')}", "value": goal.get("description")}, LABEL, doc
+
+
+def _extract_learning_journey(docs):
+    for phase in docs or []:
+        skills = phase.get("skills") or []
+        yield [phase.get("phase"), phase.get("status"), *skills], {
+            "field": f"Phase: {phase.get('phase')}",
+            "value": f"Status: {phase.get('status')}. Skills: {', '.join(skills)}",
+        }, LABEL, phase
+
+
+def _extract_growth_mindset(doc):
+    if doc:
+        yield from _string_fields(doc, {"title": TITLE, "quote": TEXT})
+
+
+def _extract_experiments(doc):
+    if not doc:
+        return
+    yield from _string_fields(doc, {
+        "header_title": TITLE, "header_description": TEXT, "lab_title": TITLE, "lab_description": TEXT,
+    })
+    for feature in doc.get("lab_features") or []:
+        yield [feature.get("title"), feature.get("description")], {
+            "field": f"Lab Feature: {feature.get('title')}", "value": feature.get("description")}, LABEL, doc
+    for experiment in doc.get("experiments") or []:
+        yield [experiment.get("title"), experiment.get("description"), experiment.get("status")], {
+            "field": f"Experiment: {experiment.get('title')}", "value": experiment.get("description")}, LABEL, doc
+
+
+def _extract_contact_section(doc):
+    if not doc:
+        return
+    yield from _string_fields(doc, {
+        "header_title": TITLE, "header_description": TEXT, "connect_title": LABEL,
+        "connect_description": TEXT, "get_in_touch_title": LABEL, "get_in_touch_description": TEXT,
+    })
+    for link in doc.get("contact_links") or []:
+        yield [link.get("name"), link.get("value"), link.get("icon")], {
+            "field": f"Contact Link: {link.get('name')}", "value": link.get("value"), "icon": link.get("icon")}, LABEL, doc
+
+
+def _extract_footer(doc):
+    if not doc:
+        return
+    yield from _string_fields(doc, {
+        "brand_name": TITLE, "brand_description": TEXT, "connect_title": LABEL,
+        "connect_description": TEXT, "bottom_text": TEXT,
+    })
+    for link in doc.get("quick_links") or []:
+        yield [link.get("name"), link.get("href")], {
+            "field": f"Quick Link: {link.get('name')}", "value": link.get("href")}, URL, doc
+
+
+# Cache key -> (result section, extractor)
+SECTIONS = {
+    "profile": ("profile", _extract_profile),
+    "projects": ("projects", _extract_projects),
+    "skills": ("skills", _extract_skills),
+    "education": ("education", _extract_education),
+    "experience": ("experience", _extract_experience),
+    "learning_journey": ("learning_journey", _extract_learning_journey),
+    "growth_mindset": ("growth_mindset", _extract_growth_mindset),
+    "experiments": ("experiments", _extract_experiments),
+    "contact_section": ("contact", _extract_contact_section),
+    "footer": ("footer", _extract_footer),
+}
+
+
+def encode_cursor(score: float, ref: str, now: datetime) -> str:
+    return base64.urlsafe_b64encode(json.dumps([score, ref, now.isoformat()]).encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    """Inverse of encode_cursor; raises ValueError on a malformed cursor."""
+    try:
+        score, ref, now = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        now = datetime.fromisoformat(now)
+        if now.tzinfo is None:
+            raise ValueError("cursor time has no timezone")
+        return float(score), str(ref), now
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class SearchIndex:
+    """Inverted index (token -> entry ids) over the portfolio sections.
+
+    Sections are loaded through the cached Database getters. A section is
+    re-indexed on the next search after its cache key is invalidated, so admin
+    writes update the index one section at a time instead of rebuilding it.
+    Query tokens match any indexed token they are a prefix of; a multi-word
+    query must match every word within the same entry.
+    """
+
+    def __init__(self, loaders: dict):
+        self._loaders = loaders
+        self._entries = {}
+        self._postings = defaultdict(set)
+        self._vocabulary = []
+        self._section_entries = defaultdict(list)
+        self._dirty = set(loaders)
+        self._locks = defaultdict(asyncio.Lock)
+        self._next_id = 0
+
+    def mark_dirty(self, key: str):
+        """Schedule a section for re-indexing (a section_cache listener)."""
+        if key in self._loaders:
+            self._dirty.add(key)
+
+    def _stale(self, key) -> bool:
+        return key in self._dirty or self._locks[key].locked()
+
+    async def refresh(self):
+        """Re-index every section whose data changed since the last refresh."""
+        keys = [key for key in self._loaders if self._stale(key)]
+        if keys:
+            await asyncio.gather(*(self._refresh_section(key) for key in keys))
+
+    async def _refresh_section(self, key):
+        # One load per section at a time; searches arriving meanwhile wait for
+        # it instead of starting their own or reading the old entries.
+        async with self._locks[key]:
+            if key in self._dirty:
+                await self._load_section(key)
+        return key
+
+    async def _load_section(self, key):
+        # Cleared before loading so an invalidation during the load re-marks it.
+        self._dirty.discard(key)
+        try:
+            value = await self._loaders[key]()
+        except Exception as e:
+            logger.error(f"Error loading {key} for search index: {e}")
+            self._dirty.add(key)
+            return
+        self._replace_section(key, value)
+
+    def _replace_section(self, key, value):
+        for entry_id in self._section_entries.pop(key, []):
+            for token in self._entries.pop(entry_id).tokens:
+                postings = self._postings[token]
+                postings.discard(entry_id)
+                if not postings:
+                    del self._postings[token]
+                    index = bisect.bisect_left(self._vocabulary, token)
+                    del self._vocabulary[index]
+
+        section, extract = SECTIONS[key]
+        ordinals = defaultdict(int)
+        for texts, result, weight, doc in extract(value):
+            texts = [text for text in texts if isinstance(text, str)]
+            tokens = frozenset(token for text in texts for token in tokenize(text))
+            if not tokens:
+                continue
+            doc_ref = _doc_ref(doc)
+            ordinals[doc_ref] += 1
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = _Entry(
+                key, section, f"{key}/{doc_ref}/{ordinals[doc_ref]:04d}", tokens,
+                frozenset(text.lower() for text in texts), result, weight, _timestamp(doc))
+            self._section_entries[key].append(entry_id)
+            for token in tokens:
+                if token not in self._postings:
+                    bisect.insort(self._vocabulary, token)
+                self._postings[token].add(entry_id)
+
+    def _prefix_matches(self, prefix: str) -> set:
+        matches = set()
+        index = bisect.bisect_left(self._vocabulary, prefix)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(prefix):
+            matches |= self._postings[self._vocabulary[index]]
+            index += 1
+        return matches
+
+    def _match(self, tokens) -> list:
+        if not tokens:
+            return []
+        tokens = sorted(tokens, key=len, reverse=True)
+        matched = self._prefix_matches(tokens[0])
+        for token in tokens[1:]:
+            if not matched:
+                break
+            matched &= self._prefix_matches(token)
+        return sorted(matched)
+
+    def match(self, query: str) -> list:
+        """Sorted ids of the entries matching every token of query."""
+        return self._match(set(tokenize(query)))
+
+    def _collect(self, entry_ids) -> dict:
+        results = empty_results()
+        projects = {}
+        for entry_id in entry_ids:
+            entry = self._entries[entry_id]
+            if entry.section == "projects":
+                result = entry.result
+                project = projects.get(result["id"])
+                if project is None:
+                    project = projects[result["id"]] = {
+                        "id": result["id"], "title": result["title"], "matches": []}
+                    results["projects"].append(project)
+                project["matches"].append(result["match"])
+            else:
+                results[entry.section].append(entry.result)
+        return results
+
+    async def search(self, query: str) -> dict:
+        """Search results grouped by section, in the shape the admin UI expects."""
+        await self.refresh()
+        return self._collect(self.match(query))
+
+    async def stream(self, query: str):
+        """Yield (section, results) for each section as soon as it is searchable.
+
+        Sections whose index is current are answered immediately; sections that
+        still need re-indexing follow in the order their loads complete.
+        """
+        tokens = set(tokenize(query))
+        pending = [key for key in SECTIONS if self._stale(key)]
+        ready = [key for key in SECTIONS if key not in pending]
+        matched = self._match(tokens)
+        for key in ready:
+            section = SECTIONS[key][0]
+            yield section, self._collect(i for i in matched if self._entries[i].key == key)[section]
+        for loaded in asyncio.as_completed([self._refresh_section(key) for key in pending]):
+            key = await loaded
+            section = SECTIONS[key][0]
+            entry_ids = [i for i in self._match(tokens) if self._entries[i].key == key]
+            yield section, self._collect(entry_ids)[section]
+
+    def _score(self, entry, tokens, phrase, now) -> float:
+        quality = sum(1.0 if token in entry.tokens else PREFIX_MATCH for token in tokens) / len(tokens)
+        score = entry.weight * quality
+        if phrase in entry.texts:
+            score *= EXACT_PHRASE_BONUS
+        if entry.timestamp is not None:
+            age_days = max((now - entry.timestamp).total_seconds(), 0) / 86400
+            score *= 1 + RECENCY_BOOST * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+        return round(score, 6)
+
+    async def ranked(self, query: str, limit: int = 20, cursor: str = None) -> dict:
+        """One page of hits across all sections, best first.
+
+        Hits are ordered by (score desc, ref asc), where ref names the entry by
+        section, document id and position within the document. The cursor
+        holds the last (score, ref) returned and the time the first page was
+        scored at, so later pages apply the same recency boost and resume at
+        the same place even if sections were re-indexed in between.
+        """
+        await self.refresh()
+        tokens = set(tokenize(query))
+        phrase = query.strip().lower()
+        after = decode_cursor(cursor) if cursor else None
+        now = after[2] if after else datetime.now(timezone.utc)
+        hits = sorted(
+            ((self._score(self._entries[i], tokens, phrase, now), self._entries[i].ref, i)
+             for i in self._match(tokens)),
+            key=lambda hit: (-hit[0], hit[1]),
+        )
+        total = len(hits)
+        if after:
+            hits = [hit for hit in hits if (-hit[0], hit[1]) > (-after[0], after[1])]
+
+        page = hits[:limit]
+        items = [
+            {"section": self._entries[i].section, "score": score, **self._entries[i].result}
+            for score, _, i in page
+        ]
+        next_cursor = encode_cursor(page[-1][0], page[-1][1], now) if len(hits) > limit else None
+        return {"items": items, "next_cursor": next_cursor, "total": total}
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "tokens": len(self._vocabulary),
+            "dirty_sections": len(self._dirty),
+        }
+
+
+# ----------------------------------------------------------------------------
+# Typeahead: short labels (titles, technologies, skill names, ...) per section.
+# ----------------------------------------------------------------------------
+
+# Hard caps that keep the suggestion array bounded whatever the admin stores.
+# Each section gets an equal share of MAX_SUGGEST_TERMS keys.
+MAX_SUGGEST_TERMS = 20000
+MAX_SUGGEST_LABEL_LENGTH = 80
+# Keys inspected per lookup; bounds the worst case for one-letter prefixes.
+MAX_SUGGEST_SCAN = 256
+
+
+def _labels_profile(doc):
+    if doc:
+        yield doc.get("name"), "profile"
+        yield doc.get("role"), "profile"
+        for skill in doc.get("skills_primary") or []:
+            yield skill, "skill"
+
+
+def _labels_projects(docs):
+    for project in docs or []:
+        yield project.get("title"), "project"
+        yield project.get("status"), "status"
+        for tech in project.get("technologies") or []:
+            yield tech, "technology"
+
+
+def _labels_skills(skills_by_category):
+    for category, skills in (skills_by_category or {}).items():
+        yield category, "category"
+        for skill in skills or []:
+            yield skill.get("name"), "skill"
+
+
+def _labels_education(docs):
+    for doc in docs or []:
+        yield doc.get("degree"), "education"
+        yield doc.get("program"), "education"
+        yield doc.get("institution"), "institution"
+
+
+def _labels_experience(docs):
+    for doc in docs or []:
+        yield doc.get("role"), "experience"
+        yield doc.get("company"), "company"
+        for tech in doc.get("technologies") or []:
+            yield tech, "technology"
+
+
+def _labels_learning_journey(docs):
+    for phase in docs or []:
+        yield phase.get("phase"), "phase"
+        for skill in phase.get("skills") or []:
+            yield skill, "skill"
+
+
+def _labels_growth_mindset(doc):
+    if doc:
+        yield doc.get("title"), "section"
+
+
+def _labels_experiments(doc):
+    if doc:
+        yield doc.get("lab_title"), "section"
+        for feature in doc.get("lab_features") or []:
+            yield feature.get("title"), "lab_feature"
+        for experiment in doc.get("experiments") or []:
+            yield experiment.get("title"), "experiment"
+
+
+def _labels_contact_section(doc):
+    if doc:
+        for link in doc.get("contact_links") or []:
+            yield link.get("name"), "contact_link"
+
+
+def _labels_footer(doc):
+    if doc:
+        yield doc.get("brand_name"), "brand"
+        for link in doc.get("quick_links") or []:
+            yield link.get("name"), "quick_link"
+
+
+SUGGEST_SECTIONS = {
+    "profile": _labels_profile,
+    "projects": _labels_projects,
+    "skills": _labels_skills,
+    "education": _labels_education,
+    "experience": _labels_experience,
+    "learning_journey": _labels_learning_journey,
+    "growth_mindset": _labels_growth_mindset,
+    "experiments": _labels_experiments,
+    "contact_section": _labels_contact_section,
+    "footer": _labels_footer,
+}
+
+
+class SuggestIndex:
+    """Sorted array of (key, rank, label, kind) tuples searched with bisect.
+
+    Every label is stored under its full lower-cased text (rank 0) and under
+    each later word (rank 1), so "boot" suggests "Spring Boot" but ranks below
+    labels that start with the prefix. Sections are re-collected when their
+    cache key is invalidated and merged back into the array on the next lookup,
+    one load per section at a time. A section keeps at most its share of
+    MAX_SUGGEST_TERMS keys, favouring the labels it mentions most often.
+    """
+
+    def __init__(self, loaders: dict):
+        self._loaders = loaders
+        self._section_keys = {}
+        self._keys = []
+        self._dirty = set(loaders)
+        self._locks = defaultdict(asyncio.Lock)
+        self._merged = True
+        self.max_section_keys = MAX_SUGGEST_TERMS // max(len(loaders), 1)
+
+    def mark_dirty(self, key: str):
+        """Schedule a section for re-collection (a section_cache listener)."""
+        if key in self._loaders:
+            self._dirty.add(key)
+
+    def _stale(self, key) -> bool:
+        return key in self._dirty or self._locks[key].locked()
+
+    async def refresh(self):
+        keys = [key for key in self._loaders if self._stale(key)]
+        if keys:
+            await asyncio.gather(*(self._refresh_section(key) for key in keys))
+        if not self._merged:
+            self._keys = sorted(k for section in self._section_keys.values() for k in section)
+            self._merged = True
+
+    async def _refresh_section(self, key):
+        # Same single-flight scheme as SearchIndex._refresh_section.
+        async with self._locks[key]:
+            if key not in self._dirty:
+                return
+            self._dirty.discard(key)
+            try:
+                value = await self._loaders[key]()
+            except Exception as e:
+                logger.error(f"Error loading {key} for suggestions: {e}")
+                self._dirty.add(key)
+                return
+            self._section_keys[key] = self._collect(key, value, self.max_section_keys)
+            self._merged = False
+
+    @staticmethod
+    def _collect(key, value, max_keys: int = MAX_SUGGEST_TERMS) -> set:
+        counts = Counter()
+        for label, kind in SUGGEST_SECTIONS[key](value):
+            if isinstance(label, str) and label.strip():
+                counts[label.strip()[:MAX_SUGGEST_LABEL_LENGTH], kind] += 1
+        keys = set()
+        # Most frequent labels first, so the ones dropped past max_keys are the rarest.
+        for (label, kind), _ in counts.most_common():
+            lowered = label.lower()
+            label_keys = [(lowered, 0, label, kind)]
+            for match in TOKEN_RE.finditer(lowered):
+                if match.start() > 0:
+                    label_keys.append((lowered[match.start():], 1, label, kind))
+            if len(keys) + len(label_keys) > max_keys:
+                logger.warning(f"Suggestions for {key} capped at {max_keys} keys")
+                break
+            keys.update(label_keys)
+        return keys
+
+    async def suggest(self, prefix: str, limit: int = 10) -> list:
+        """Up to limit distinct labels starting with (a word starting with) prefix."""
+        await self.refresh()
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        candidates = []
+        index = bisect.bisect_left(self._keys, (prefix,))
+        end = min(len(self._keys), index + MAX_SUGGEST_SCAN)
+        while index < end and self._keys[index][0].startswith(prefix):
+            candidates.append(self._keys[index])
+            index += 1
+        candidates.sort(key=lambda k: (k[1], len(k[2]), k[2].lower()))
+        suggestions, seen = [], set()
+        for _, _, label, kind in candidates:
+            if label.lower() not in seen:
+                seen.add(label.lower())
+                suggestions.append({"label": label, "kind": kind})
+                if len(suggestions) == limit:
+                    break
+        return suggestions
+
+    def stats(self):
+        return {"keys": len(self._keys), "dirty_sections": len(self._dirty)}
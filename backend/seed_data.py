@@ -1,48 +1,43 @@
+import argparse
 import asyncio
-from datetime import datetime
-from auth import get_password_hash
-from database import (
-    Database,
-    profile_collection,
-    skills_collection,
-    projects_collection,
-    projects_page_collection,
-    education_collection,
-    experience_collection,
-    learning_journey_collection,
-    experiments_collection,
-    growth_mindset_collection,
-    contact_section_collection,
-    footer_collection,
-    admin_collection
-)
+import itertools
 import sys
 import os
+import time
+from datetime import datetime
+from pymongo import InsertOne, ReplaceOne
+from auth import admin_token_cache, get_password_hash
+import database
+import datagen
+from cache import section_cache
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Documents per insert_many / bulk_write call
+SEED_BATCH_SIZE = int(os.getenv("SEED_BATCH_SIZE", "1000"))
 
-async def seed_database():
-    """Seed database with initial portfolio data, clearing old data first."""
-
-    print("🧹 Clearing existing data...")
-    # --- THIS IS THE NEW PART ---
-    # Clear existing data to prevent duplicates
-    await projects_collection.delete_many({})
-    await projects_page_collection.delete_many({})
-    await education_collection.delete_many({})
-    await experience_collection.delete_many({})
-    await learning_journey_collection.delete_many({})
-    await experiments_collection.delete_many({})
-    await growth_mindset_collection.delete_many({})
-    await contact_section_collection.delete_many({})
-    await admin_collection.delete_many({})
-    await profile_collection.delete_many({})
-    await skills_collection.delete_many({})
-    await footer_collection.delete_many({})
-    # Profile and Skills are updated with replace_one(upsert=True), so they don't need clearing.
-    # --- END OF NEW PART ---
-    print("🗑️  Old data cleared.")
+# Fields identifying a seeded document, so upsert mode replaces it in place
+# instead of adding a duplicate. Singleton sections match on {}.
+SEED_KEYS = {
+    "profile": (),
+    "skills": ("_id",),
+    "projects_page": ("_id",),
+    "projects": ("title",),
+    "education": ("degree", "institution"),
+    "experience": ("role", "company"),
+    "learning_journey": ("phase",),
+    "growth_mindset": (),
+    "experiments": (),
+    "contact_section": (),
+    "footer": (),
+    "admin": ("username",),
+    # Synthetic documents from datagen carry deterministic ids.
+    "contact_messages": ("_id",),
+    "notifications": ("_id",),
+}
 
+
+def seed_documents():
+    """The portfolio's initial content, as {collection name: [documents]}."""
     # Profile data
     profile_data = {
         "name": "Bhavy Upreti",
@@ -69,7 +64,6 @@ async def seed_database():
         "skills_primary": ["React", "JavaScript", "Node", "WebGL", "Systems", "Design","Python", "Java", "FastAPI", "TailwindCSS", "AWS", "Docker"],
         "chipCount": 8
     }
-    await Database.update_profile(profile_data)
 
     # Skills data''
     skills_data = {
@@ -140,16 +134,12 @@ async def seed_database():
         ]
     }
 
-    for category, skills in skills_data.items():
-        # This line now passes the list of skill objects
-        await Database.update_skills(category, skills)
 
     project_page = {
         "header": "ARTIFACTS · PROJECTS",
         "subtitle": "Selected works — experiments in automation, AI, and striking design.",
         "tip": "Tip: hover a card for parallax. Click cards for deep view.",
     }
-    await Database.update_projects_page(project_page)
 
     # Projects data
     projects_data = [
@@ -192,8 +182,6 @@ async def seed_database():
         }
     ]
 
-    for project in projects_data:
-        await Database.create_project(project)
 
     # Education data
     education_data = [{
@@ -283,8 +271,6 @@ async def seed_database():
         "updatedAt": datetime.utcnow()
     }
     ]
-    for edu in education_data:
-        await Database.create_education(edu)
 
     # Experience data
     experience_data = [
@@ -343,8 +329,6 @@ async def seed_database():
         }
     ]
     
-    for experience in experience_data:
-        await Database.create_experience(experience)
     
     # Learning Journey data
     learning_journey_data = [
@@ -371,15 +355,12 @@ async def seed_database():
         }
     ]
 
-    for phase in learning_journey_data:
-        await Database.create_learning_phase(phase)
 
     growth_mindset_data = {
         "title": "Growth Mindset",
         "quote": "\"The journey of a thousand miles begins with a single step. Every skill learned, every challenge overcome, brings me closer to my goals.\"",
         "updatedAt": datetime.utcnow()
     }
-    await Database.update_growth_mindset(growth_mindset_data)
 
     # Experiments data
     experiments_section_data = {
@@ -408,7 +389,6 @@ async def seed_database():
         ],
         "updatedAt": datetime.utcnow()
     }
-    await Database.update_experiments_section(experiments_section_data)
 
     contact_section_data = {
         "header_title": "Contact & Social",
@@ -439,7 +419,6 @@ async def seed_database():
         ],
         "updatedAt": datetime.utcnow()
     }
-    await Database.update_contact_section(contact_section_data)
 
     footer_data = {
         "brand_name": "Shreeya Das",
@@ -455,7 +434,6 @@ async def seed_database():
         "bottom_text": "Building the future, one line at a time",
         "updatedAt": datetime.utcnow()
     }
-    await Database.update_footer(footer_data)
 
     # Admin user
     admin_data = {
@@ -466,9 +444,119 @@ async def seed_database():
         "role": "superadmin",
         "createdAt": datetime.utcnow()
     }
-    await Database.create_admin(admin_data)
 
-    print("✅ Database seeded successfully!")
+
+    return {
+        "profile": [profile_data],
+        "skills": [{"_id": category, "category": category, "skills": skills}
+                   for category, skills in skills_data.items()],
+        "projects_page": [{"_id": "projects_page_main", **project_page}],
+        "projects": projects_data,
+        "education": education_data,
+        "experience": experience_data,
+        "learning_journey": learning_journey_data,
+        "growth_mindset": [growth_mindset_data],
+        "experiments": [experiments_section_data],
+        "contact_section": [contact_section_data],
+        "footer": [footer_data],
+        "admin": [admin_data],
+    }
+
+
+# Collections --scale adds synthetic documents to
+SCALED_COLLECTIONS = ("projects", "contact_messages", "notifications")
+
+
+# Collections holding real visitor data are never cleared; synthetic
+# documents are always upserted into them by id.
+NEVER_CLEARED = {"contact_messages", "notifications"}
+
+
+def _batches(documents, size: int = SEED_BATCH_SIZE):
+    # Works on generators too, so large synthetic loads never sit in memory whole.
+    documents = iter(documents)
+    while batch := list(itertools.islice(documents, size)):
+        yield batch
+
+
+async def load_collection(name: str, documents, upsert: bool = False, keys=None) -> int:
+    """Bulk-load one collection and return the number of documents written.
+
+    Replace mode clears the collection and inserts in bulk; upsert mode
+    replaces each document matched on keys (default: its SEED_KEYS) and
+    leaves every other document in the collection alone.
+    """
+    collection = database.db[name]
+    upsert = upsert or name in NEVER_CLEARED
+    keys = SEED_KEYS[name] if keys is None else keys
+    if not upsert:
+        await collection.delete_many({})
+    written = 0
+    for batch in _batches(documents):
+        if upsert:
+            requests = [ReplaceOne({key: doc[key] for key in keys}, doc, upsert=True) for doc in batch]
+            result = await collection.bulk_write(requests, ordered=False)
+            written += result.matched_count + result.upserted_count
+        else:
+            result = await collection.bulk_write([InsertOne(doc) for doc in batch], ordered=False)
+            written += result.inserted_count
+    return written
+
+
+async def refresh_caches(collections):
+    """Invalidate the cached sections of bulk-loaded collections.
+
+    Bulk loads bypass Database, so nothing else tells the section cache,
+    the search indexes or the unread-notification counter about them.
+    """
+    section_cache.invalidate(*collections)
+    if "admin" in collections:
+        admin_token_cache.clear()
+    if "notifications" in collections:
+        await database.unread_counter.resync()
+
+
+async def seed_database(upsert: bool = False, scale: int = 0):
+    """Seed database with initial portfolio data.
+
+    Collections are loaded concurrently. By default every seeded collection
+    is cleared first; with upsert=True seeded documents are replaced in
+    place and nothing else is deleted. scale adds that many synthetic
+    projects, contact messages and notifications for load testing.
+    """
+    await database.Database.connect()
+    started = time.perf_counter()
+    documents = seed_documents()
+    for name in SCALED_COLLECTIONS if scale else ():
+        documents.setdefault(name, []).extend(datagen.generate(name, scale))
+
+    mode = "upsert" if upsert else "replace"
+    print(f"🌱 Seeding {sum(map(len, documents.values()))} documents into {len(documents)} collections ({mode})...")
+    counts = await asyncio.gather(*(load_collection(name, docs, upsert) for name, docs in documents.items()))
+
+    await refresh_caches(documents)
+
+    for name, count in zip(documents, counts):
+        print(f"   {name}: {count}")
+    print(f"✅ Database seeded successfully in {time.perf_counter() - started:.2f}s!")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the portfolio database.")
+    parser.add_argument("--upsert", action="store_true",
+                        help="Replace seeded documents in place instead of clearing their collections first")
+    parser.add_argument("--scale", type=int, default=0,
+                        help="Also generate this many synthetic projects, contact messages and notifications")
+    args = parser.parse_args()
+
+    async def run():
+        try:
+            await seed_database(upsert=args.upsert, scale=args.scale)
+        finally:
+            database.Database.close()
+
+    asyncio.run(run())
+
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    main()
@@ -0,0 +1,37 @@
+import time
+import orjson
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from metrics import json_encode_duration_seconds
+
+
+def bson_default(obj):
+    """orjson fallback for types it doesn't serialize natively.
+
+    datetime, Enum, UUID and dataclasses are handled by orjson itself;
+    ObjectId becomes its hex string and anything else (pydantic models,
+    sets, Decimal, ...) goes through FastAPI's jsonable_encoder.
+    """
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(content) -> bytes:
+    """Serialize content to compact UTF-8 JSON."""
+    started = time.perf_counter()
+    body = orjson.dumps(content, default=bson_default, option=orjson.OPT_NON_STR_KEYS)
+    json_encode_duration_seconds.observe(time.perf_counter() - started)
+    return body
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Used as the app's default_response_class. Routes returning large lists
+    return it directly, which also skips FastAPI's jsonable_encoder pass.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -1,9 +1,9 @@
 from models import Profile, AdminProfileResponse
-from fastapi import FastAPI, APIRouter, HTTPException, status, Depends
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, APIRouter, HTTPException, status, Depends, Request, Response, Query
 from fastapi import File, UploadFile
-import shutil
-from fastapi.responses import JSONResponse
+import asyncio
+import hmac
+from fastapi.responses import JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
@@ -15,8 +15,17 @@ from contextlib import asynccontextmanager
 
 # Import our models and database
 from models import *
-from database import Database, notifications_collection
-from auth import authenticate_admin, create_access_token, get_current_admin, get_password_hash
+from database import (Database, notification_queue, notification_hub, unread_counter, search_index, suggest_index,
+                      CONTACT_MESSAGE_FIELDS, PROJECT_FIELDS, EDUCATION_FIELDS, EXPERIENCE_FIELDS,
+                      LEARNING_JOURNEY_FIELDS, ADMIN_FIELDS)
+from cache import section_cache, etag_matches, encode_json, variant_key
+from serialization import FastJSONResponse
+from metrics import registry as metrics_registry, MetricsMiddleware, METRICS_TOKEN
+from uploads import store_upload, UploadTooLarge
+from assets import AssetFiles
+from images import ImageProcessor, IMAGE_SUFFIXES, srcset
+from auth import (authenticate_admin, create_access_token, get_current_admin, get_current_admin_for_stream,
+                  password_hasher, admin_token_cache)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -28,20 +37,32 @@ load_dotenv(ROOT_DIR / '.env')
 async def lifespan(app: FastAPI):
     # Code here runs on startup
     print("--- Running startup tasks ---")
+    await Database.connect()
     await Database.create_indexes()
+    await Database.build_search_index()
+    notification_queue.start()
     yield
-    # Code here runs on shutdown (not needed for this)
+    # Code here runs on shutdown
     print("--- Running shutdown tasks ---")
+    await notification_queue.stop()
+    password_hasher.shutdown()
+    image_processor.shutdown()
+    Database.close()
 
 # Pass the lifespan function to your FastAPI app instance
 app = FastAPI(title="Bhavy Portfolio API",
-              version="1.0.0", lifespan=lifespan)
+              version="1.0.0", lifespan=lifespan,
+              default_response_class=FastJSONResponse)
 
 UPLOAD_DIR = ROOT_DIR / "static"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-# Mount the static directory to serve files from /static URL
-app.mount("/static", StaticFiles(directory=UPLOAD_DIR), name="static")
+# Mount the static directory to serve files from /static URL, with precompressed
+# variants, range requests and immutable caching for content-hashed uploads
+app.mount("/static", AssetFiles(directory=UPLOAD_DIR), name="static")
+
+# Responsive WebP/AVIF derivatives of uploaded project images
+image_processor = ImageProcessor(UPLOAD_DIR)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -53,6 +74,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def parse_fields(fields: Optional[str], allowed: set):
+    """Split a ?fields=a,b query value, rejecting names outside allowed."""
+    if not fields:
+        return None
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in allowed and f != "id"]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return [f for f in requested if f != "id"] or None
+
+
+def sse_event(event: str, payload: dict) -> bytes:
+    """One Server-Sent Events frame with a JSON data line."""
+    return b"event: " + event.encode() + b"\ndata: " + encode_json(payload) + b"\n\n"
+
+
+def cached_json_response(request: Request, key: str, value, build):
+    """Serve a pre-serialized body for a cached section, or 304 if the client already has it."""
+    body, etag = section_cache.render(key, value, build)
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # ============================================================================
 # PUBLIC API ROUTES (No Authentication Required)
 # ============================================================================
@@ -66,13 +113,13 @@ async def root():
 
 
 @api_router.get("/profile")
-async def get_profile():
+async def get_profile(request: Request):
     """Get profile data"""
     try:
         profile = await Database.get_profile()
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
-        return {"success": True, "data": profile}
+        return cached_json_response(request, "profile", profile, lambda: {"success": True, "data": profile})
     except Exception as e:
         logger.error(f"Error getting profile: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -81,24 +128,25 @@ async def get_profile():
 
 
 @api_router.get("/skills")
-async def get_skills():
+async def get_skills(request: Request):
     """Get all skills by category"""
     try:
         skills = await Database.get_skills()
-        return {"success": True, "data": skills}
+        return cached_json_response(request, "skills", skills, lambda: {"success": True, "data": skills})
     except Exception as e:
         logger.error(f"Error getting skills: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @api_router.get("/projects/content", response_model=ProjectsPage)
-async def get_projects_page_content():
+async def get_projects_page_content(request: Request):
     """
     Retrieve the header content (subtitle and tip) for the projects page.
     """
     content = await Database.get_projects_page()
     if content:
-        return content
+        return cached_json_response(
+            request, "projects_page", content, lambda: ProjectsPage(**content).dict(by_alias=True))
     raise HTTPException(
         status_code=404, detail="Projects page content not found")
 
@@ -106,11 +154,13 @@ async def get_projects_page_content():
 
 
 @api_router.get("/projects")
-async def get_projects():
-    """Get all projects"""
+async def get_projects(request: Request, fields: Optional[str] = None):
+    """Get all projects; ?fields=title,year returns only those fields (plus id)"""
+    field_list = parse_fields(fields, PROJECT_FIELDS)
     try:
-        projects = await Database.get_projects()
-        return {"success": True, "data": projects, "total": len(projects)}
+        projects = await Database.get_projects(field_list)
+        return cached_json_response(
+            request, variant_key("projects", field_list), projects, lambda: {"success": True, "data": projects, "total": len(projects)})
     except Exception as e:
         logger.error(f"Error getting projects: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -119,11 +169,13 @@ async def get_projects():
 
 
 @api_router.get("/education")
-async def get_education_list():
-    """Get all education entries"""
+async def get_education_list(request: Request, fields: Optional[str] = None):
+    """Get all education entries, optionally only ?fields="""
+    field_list = parse_fields(fields, EDUCATION_FIELDS)
     try:
-        education_list = await Database.get_all_education()
-        return {"success": True, "data": education_list}
+        education_list = await Database.get_all_education(field_list)
+        return cached_json_response(
+            request, variant_key("education", field_list), education_list, lambda: {"success": True, "data": education_list})
     except Exception as e:
         logger.error(f"Error getting education: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -132,14 +184,16 @@ async def get_education_list():
 
     
 @api_router.get("/experience")
-async def get_experience_list():
-    """Get all experience entries"""
+async def get_experience_list(request: Request, fields: Optional[str] = None):
+    """Get all experience entries, optionally only ?fields="""
+    field_list = parse_fields(fields, EXPERIENCE_FIELDS)
     try:
-        experience_list = await Database.get_all_experience()
+        experience_list = await Database.get_all_experience(field_list)
         if not experience_list:
             raise HTTPException(
                 status_code=404, detail="Experience list not found")
-        return {"success": True, "data": experience_list}
+        return cached_json_response(
+            request, variant_key("experience", field_list), experience_list, lambda: {"success": True, "data": experience_list})
     except Exception as e:
         logger.error(f"Error getting experience list: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -148,25 +202,26 @@ async def get_experience_list():
 
 
 @api_router.get("/learning-journey")
-async def get_learning_journey():
-    """Get learning journey timeline"""
+async def get_learning_journey(request: Request, fields: Optional[str] = None):
+    """Get learning journey timeline, optionally only ?fields="""
+    field_list = parse_fields(fields, LEARNING_JOURNEY_FIELDS)
     try:
-        journey = await Database.get_learning_journey()
-        print("--- JOURNEY DATA FROM DB:", journey)
-        return {"success": True, "data": journey, "total": len(journey)}
+        journey = await Database.get_learning_journey(field_list)
+        return cached_json_response(
+            request, variant_key("learning_journey", field_list), journey, lambda: {"success": True, "data": journey, "total": len(journey)})
     except Exception as e:
         logger.error(f"Error getting learning journey: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @api_router.get("/growth-mindset")
-async def get_growth_mindset():
+async def get_growth_mindset(request: Request):
     """Get growth mindset data"""
     try:
         data = await Database.get_growth_mindset()
         if not data:
             raise HTTPException(status_code=404, detail="Data not found")
-        return {"success": True, "data": data}
+        return cached_json_response(request, "growth_mindset", data, lambda: {"success": True, "data": data})
     except Exception as e:
         logger.error(f"Error getting growth mindset data: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -175,27 +230,27 @@ async def get_growth_mindset():
 
 
 @api_router.get("/experiments")
-async def get_experiments_section():
+async def get_experiments_section(request: Request):
     """Get the entire experiments section data"""
     try:
         data = await Database.get_experiments_section()
         if not data:
             raise HTTPException(
                 status_code=404, detail="Experiments section not found")
-        return {"success": True, "data": data}
+        return cached_json_response(request, "experiments", data, lambda: {"success": True, "data": data})
     except Exception as e:
         logger.error(f"Error getting experiments section: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @api_router.get("/contact-section")
-async def get_contact_section():
+async def get_contact_section(request: Request):
     """Get contact section data"""
     data = await Database.get_contact_section()
     if not data:
         raise HTTPException(
             status_code=404, detail="Contact section data not found")
-    return {"success": True, "data": data}
+    return cached_json_response(request, "contact_section", data, lambda: {"success": True, "data": data})
 
 # Contact Routes
 
@@ -237,18 +292,59 @@ async def submit_contact_form(contact_data: ContactMessageCreate):
 
 
 @api_router.get("/footer")
-async def get_footer():
+async def get_footer(request: Request):
     """Get footer data"""
     try:
         data = await Database.get_footer()
         if not data:
             raise HTTPException(
                 status_code=404, detail="Footer data not found")
-        return {"success": True, "data": data}
+        return cached_json_response(request, "footer", data, lambda: {"success": True, "data": data})
     except Exception as e:
         logger.error(f"Error getting footer data: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
-    
+
+# Aggregated Portfolio Route
+
+# Section name -> getter. Every getter is served through the section cache.
+PORTFOLIO_SECTIONS = {
+    "profile": Database.get_profile,
+    "skills": Database.get_skills,
+    "projects": Database.get_projects,
+    "projects_page": Database.get_projects_page,
+    "education": Database.get_all_education,
+    "experience": Database.get_all_experience,
+    "learning_journey": Database.get_learning_journey,
+    "growth_mindset": Database.get_growth_mindset,
+    "experiments": Database.get_experiments_section,
+    "contact_section": Database.get_contact_section,
+    "footer": Database.get_footer,
+}
+
+
+@api_router.get("/portfolio")
+async def get_portfolio(request: Request, sections: Optional[str] = None):
+    """Get every public section in one response, optionally filtered with ?sections=profile,projects"""
+    if sections:
+        names = {name.strip() for name in sections.split(",") if name.strip()}
+        unknown = sorted(names - PORTFOLIO_SECTIONS.keys())
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown sections: {', '.join(unknown)}")
+        # Canonical order keeps one pre-rendered body per distinct selection.
+        requested = [name for name in PORTFOLIO_SECTIONS if name in names]
+    else:
+        requested = list(PORTFOLIO_SECTIONS)
+
+    try:
+        results = await asyncio.gather(*(PORTFOLIO_SECTIONS[name]() for name in requested))
+        return cached_json_response(
+            request, f"portfolio:{','.join(requested)}", tuple(results),
+            lambda: {"success": True, "data": dict(zip(requested, results))})
+    except Exception as e:
+        logger.error(f"Error getting portfolio bundle: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
     
     
     
@@ -341,7 +437,7 @@ async def create_new_admin(admin_data: AdminCreate, current_admin: dict = Depend
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
         )
-    hashed_password = get_password_hash(admin_data.password)
+    hashed_password = await password_hasher.hash(admin_data.password)
     new_admin_data = {
         "username": admin_data.username,
         "password": hashed_password,
@@ -396,6 +492,8 @@ async def delete_admin_user(username: str, current_admin: dict = Depends(get_cur
             status_code=400, detail="You cannot delete your own account.")
 
     success = await Database.delete_admin(username)
+    # Lock the removed admin out on their next request.
+    admin_token_cache.evict(username)
     if not success:
         await Database.create_notification({
             "message": f"ERROR Admin Deletion: {current_admin['username']} Failed to delete admin {username} || Admin Not Found",
@@ -417,8 +515,8 @@ async def delete_admin_user(username: str, current_admin: dict = Depends(get_cur
 
 # List all admin users
 @api_router.get("/admin/users")
-async def list_admin_users(current_admin: dict = Depends(get_current_admin)):
-    admins = await Database.get_admins()
+async def list_admin_users(fields: Optional[str] = None, current_admin: dict = Depends(get_current_admin)):
+    admins = await Database.get_admins(parse_fields(fields, ADMIN_FIELDS))
     return {"success": True, "data": admins}
 
 
@@ -432,33 +530,67 @@ async def list_admin_users(current_admin: dict = Depends(get_current_admin)):
 
 # Site-wide Search for Admin Panel
 @api_router.get("/admin/search")
-async def search_content(q: str, current_admin: dict = Depends(get_current_admin)):
+async def search_content(
+    q: str,
+    mode: str = "grouped",
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_admin: dict = Depends(get_current_admin),
+):
     if not q:
         raise HTTPException(
             status_code=400, detail="Search query cannot be empty")
+    if mode == "ranked":
+        try:
+            page = await Database.search_ranked(q, limit, cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return FastJSONResponse({"success": True, "data": page["items"], "next_cursor": page["next_cursor"], "total": page["total"]})
+    if mode != "grouped":
+        raise HTTPException(status_code=400, detail="mode must be 'grouped' or 'ranked'")
     results = await Database.search_content(q)
-    return {"success": True, "data": results}
+    return FastJSONResponse({"success": True, "data": results})
+
+# Typeahead Suggestions for the Admin Search Box
+@api_router.get("/admin/search/suggest")
+async def suggest_search_terms(q: str, limit: int = Query(10, ge=1, le=50), current_admin: dict = Depends(get_current_admin)):
+    suggestions = await Database.suggest(q, limit)
+    return {"success": True, "data": suggestions}
+
+# Streaming Search: one NDJSON line (or SSE event) per section as soon as its hits are ready
+@api_router.get("/admin/search/stream")
+async def stream_search_content(q: str, format: str = "ndjson", current_admin: dict = Depends(get_current_admin)):
+    if not q:
+        raise HTTPException(
+            status_code=400, detail="Search query cannot be empty")
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+
+    def frame(event: str, payload: dict) -> bytes:
+        if format == "sse":
+            return sse_event(event, payload)
+        return encode_json(payload) + b"\n"
+
+    async def events():
+        async for section, results in Database.stream_search(q):
+            yield frame("section", {"section": section, "results": results})
+        yield frame("done", {"done": True})
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+# Query Plans
+@api_router.get("/admin/query-plans")
+async def get_query_plans(current_admin: dict = Depends(get_current_admin)):
+    """Index check and winning plan of every hot query, for spotting scans and in-memory sorts"""
+    indexes, plans = await asyncio.gather(Database.verify_indexes(), Database.explain_queries())
+    return {"success": True, "data": {"index_problems": indexes, "plans": plans}}
 
 # Dashboard Summary
 @api_router.get("/admin/dashboard-summary")
 async def get_dashboard_summary(current_admin: dict = Depends(get_current_admin)):
     try:
-        projects = await Database.get_projects()
-        messages = await Database.get_contact_messages()
-        skills = await Database.get_skills()
-
-        unread_messages = [m for m in messages if not m.get('read', False)]
-
-        unread_notification_count = await notifications_collection.count_documents({"read": False})
-
-        summary = {
-            "project_count": len(projects),
-            "message_count": len(messages),
-            "unread_message_count": len(unread_messages),
-            "skill_category_count": len(skills.keys()),
-            "recent_messages": unread_messages[:5],
-            "unread_notification_count": unread_notification_count,
-        }
+        summary = await Database.get_dashboard_summary()
         return {"success": True, "data": summary}
     except Exception as e:
         logger.error(f"Error getting dashboard summary: {e}")
@@ -475,13 +607,11 @@ async def get_dashboard_summary(current_admin: dict = Depends(get_current_admin)
 # Upload Resume File
 @api_router.post("/admin/upload-resume")
 async def upload_resume(file: UploadFile = File(...), current_admin: dict = Depends(get_current_admin)):
+    """Store the resume under a content-hashed name and return its immutable URL"""
     try:
-        file_path = UPLOAD_DIR / file.filename
-
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        file_path = await store_upload(file, UPLOAD_DIR)
 
-        file_url = f"/static/{file.filename}"
+        file_url = f"/static/{file_path.name}"
         await Database.create_notification({
             "message": f"UPDATE Profile: Admin {current_admin['username']} made changes in Resume.",
             "type": NotificationType.UPDATE,
@@ -489,6 +619,8 @@ async def upload_resume(file: UploadFile = File(...), current_admin: dict = Depe
             "createdAt": datetime.utcnow(),
         })
         return {"success": True, "message": "File uploaded successfully", "url": file_url}
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         await Database.create_notification({
             "message": f"ERROR Profile: Admin {current_admin['username']} failed to upload resume.",
@@ -498,6 +630,29 @@ async def upload_resume(file: UploadFile = File(...), current_admin: dict = Depe
         })
         logger.error(f"Error uploading resume: {e}")
         raise HTTPException(status_code=500, detail="Failed to upload file")
+
+
+# Upload Project Image
+@api_router.post("/admin/upload-image")
+async def upload_image(file: UploadFile = File(...), current_admin: dict = Depends(get_current_admin)):
+    """Store an image and its responsive variants; use the returned url as a project image"""
+    if os.path.splitext(file.filename or "")[1].lower() not in IMAGE_SUFFIXES:
+        raise HTTPException(status_code=415, detail="Unsupported image type")
+    try:
+        file_path = await store_upload(file, UPLOAD_DIR)
+        file_url = f"/static/{file_path.name}"
+        variants = await image_processor.variants_for(file_url)
+        return {
+            "success": True,
+            "url": file_url,
+            "variants": variants,
+            "srcset": {fmt: srcset(variants, fmt) for fmt in image_processor.formats},
+        }
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error uploading image: {e}")
+        raise HTTPException(status_code=500, detail="Failed to upload file")
     
     
     
@@ -624,7 +779,7 @@ async def update_projects_page_content_route(
                 })
             raise HTTPException(
                 status_code=400, detail="No update data provided.")
-        await Database.update_projects_page_content(update_data)
+        await Database.update_projects_page(update_data)
         # You can add a notification here if you want
         await Database.create_notification({
             "message": f"SUCCESS UPDATE: Admin {current_admin['username']} updated the Projects page header.",
@@ -644,6 +799,7 @@ async def update_projects_page_content_route(
 async def create_project(project_data: ProjectCreate, current_admin: dict = Depends(get_current_admin)):
     try:
         project_dict = project_data.dict()
+        project_dict["imageVariants"] = await image_processor.variants_for(project_dict["image"])
         project_obj = Project(**project_dict)
         project_id = await Database.create_project(project_obj.dict())
 
@@ -675,6 +831,8 @@ async def update_project(project_id: str, project_data: ProjectUpdate, current_a
         update_dict = {k: v for k, v in project_data.dict().items()
                        if v is not None}
         if update_dict:
+            if "image" in update_dict:
+                update_dict["imageVariants"] = await image_processor.variants_for(update_dict["image"])
             update_dict["updatedAt"] = datetime.utcnow()
             success = await Database.update_project(project_id, update_dict)
 
@@ -1081,11 +1239,24 @@ async def update_contact_section(data: ContactSectionData, current_admin: dict =
 
 
 @api_router.get("/admin/messages")
-async def get_contact_messages(current_admin: dict = Depends(get_current_admin)):
-    """Get all contact messages"""
+async def get_contact_messages(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    read: Optional[bool] = None,
+    fields: Optional[str] = None,
+    current_admin: dict = Depends(get_current_admin),
+):
+    """Get a page of contact messages, newest first (pass next_cursor back as cursor)"""
+    field_list = parse_fields(fields, CONTACT_MESSAGE_FIELDS)
     try:
-        messages = await Database.get_contact_messages()
-        return {"success": True, "data": messages, "total": len(messages)}
+        page, total = await asyncio.gather(
+            Database.get_contact_messages(limit, cursor, read, field_list),
+            Database.count_contact_messages(read),
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        return FastJSONResponse({"success": True, "data": page["items"], "total": total, "next_cursor": page["next_cursor"]})
     except Exception as e:
         logger.error(f"Error getting contact messages: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -1171,10 +1342,72 @@ async def update_footer(data: FooterData, current_admin: dict = Depends(get_curr
 
 
 @api_router.get("/admin/notifications")
-async def get_all_notifications(current_admin: dict = Depends(get_current_admin)):
-    notifications = await Database.get_notifications()
-    unread_count = await notifications_collection.count_documents({"read": False})
-    return {"success": True, "data": notifications, "unread_count": unread_count}
+async def get_all_notifications(
+    limit: int = Query(100, ge=1, le=500),
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    type: Optional[NotificationType] = None,
+    current_admin: dict = Depends(get_current_admin),
+):
+    """Get a page of notifications, newest first.
+
+    Pass next_cursor back as before for older notifications, or prev_cursor
+    as after for newer ones.
+    """
+    if before and after:
+        raise HTTPException(status_code=400, detail="Use either before or after, not both")
+    try:
+        page, unread_count = await asyncio.gather(
+            Database.get_notifications(limit, before, after, type),
+            Database.count_unread_notifications(),
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return FastJSONResponse({
+        "success": True,
+        "data": page["items"],
+        "unread_count": unread_count,
+        "next_cursor": page["next_cursor"],
+        "prev_cursor": page["prev_cursor"],
+    })
+
+
+# Seconds between keep-alive comments on an idle notification stream
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = 15
+
+
+@api_router.get("/admin/notifications/stream")
+async def stream_notifications(current_admin: dict = Depends(get_current_admin_for_stream)):
+    """Server-Sent Events: new notifications and unread-count changes as they happen.
+
+    Sends the current unread count first, then "notification", "read",
+    "read_all", "cleared" and "resync" events published by Database.
+    """
+    async def events():
+        # Subscribe before counting so nothing published in between is missed.
+        queue = notification_hub.subscribe()
+        getter = None
+        try:
+            yield sse_event("unread", {"unread_count": await Database.count_unread_notifications()})
+            while True:
+                getter = getter or asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter}, timeout=NOTIFICATION_STREAM_HEARTBEAT_SECONDS)
+                if not done:
+                    yield b": keep-alive\n\n"
+                    continue
+                event, data = getter.result()
+                getter = None
+                yield sse_event(event, data)
+        finally:
+            if getter is not None:
+                getter.cancel()
+            notification_hub.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @api_router.put("/admin/notifications/{notification_id}/read")
@@ -1246,6 +1479,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so latency includes CORS handling and error responses
+app.add_middleware(MetricsMiddleware)
+
+metrics_registry.add_stats("portfolio_section_cache", section_cache.stats)
+metrics_registry.add_stats("portfolio_password_hasher", password_hasher.stats)
+metrics_registry.add_stats("portfolio_notification_queue", notification_queue.stats)
+metrics_registry.add_stats("portfolio_notification_streams", notification_hub.stats)
+metrics_registry.add_stats("portfolio_unread_counter", unread_counter.stats)
+metrics_registry.add_stats("portfolio_search_index", search_index.stats)
+metrics_registry.add_stats("portfolio_suggest_index", suggest_index.stats)
+metrics_registry.add_stats("portfolio_image_processor", image_processor.stats)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus metrics in the text exposition format, for scrapers sending METRICS_TOKEN"""
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid metrics token", headers={"WWW-Authenticate": "Bearer"})
+    return Response(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # Exception handler
 
 
@@ -0,0 +1,153 @@
+import gzip
+import hashlib
+import logging
+import os
+import re
+import uuid
+from pathlib import Path
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import brotli
+except ImportError:  # Brotli variants are optional; gzip is always written.
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Hex digits of the SHA-256 kept in stored names: "resume.<hash>.pdf"
+HASH_LENGTH = 16
+HASHED_NAME_RE = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}(\.[A-Za-z0-9]+)?$")
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+# Formats worth compressing; images and archives are compressed already.
+COMPRESSIBLE_SUFFIXES = {".pdf", ".txt", ".md", ".json", ".csv", ".svg", ".html", ".css", ".js", ".xml"}
+# A variant is only kept when it is at least this much smaller than the original.
+MIN_COMPRESSION_SAVING = 0.1
+
+# Content-Encoding token -> file suffix of the precompressed variant
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+def safe_filename(filename: str):
+    """Split an untrusted client filename into a (stem, suffix) safe for the upload dir."""
+    name = Path((filename or "").replace("\\", "/")).name
+    stem, suffix = os.path.splitext(name)
+    stem = _UNSAFE_CHARS.sub("-", stem).strip(".-")[:64] or "file"
+    suffix = _UNSAFE_CHARS.sub("", suffix)[:10].lower()
+    return stem, suffix
+
+
+def is_hashed_name(name: str) -> bool:
+    """True for names produced by store_upload, whose content never changes."""
+    return HASHED_NAME_RE.search(name) is not None
+
+
+def write_precompressed(path: Path):
+    """Write .gz (and .br when brotli is installed) variants next to path.
+
+    Returns the encodings written. Variants that don't save at least
+    MIN_COMPRESSION_SAVING are skipped, so serving falls back to the original.
+    """
+    if path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+        return []
+    data = path.read_bytes()
+    compressors = {"gzip": lambda raw: gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors["br"] = lambda raw: brotli.compress(raw, quality=11)
+    written = []
+    for encoding, compress in compressors.items():
+        compressed = compress(data)
+        if len(compressed) <= len(data) * (1 - MIN_COMPRESSION_SAVING):
+            path.with_name(path.name + ENCODING_SUFFIXES[encoding]).write_bytes(compressed)
+            written.append(encoding)
+    return written
+
+
+def _write_chunk(handle, digest, chunk: bytes):
+    digest.update(chunk)
+    handle.write(chunk)
+
+
+def incoming_dir(directory: Path) -> Path:
+    """Where partial uploads for directory are written: a sibling that is not served.
+
+    It sits next to directory so the final os.replace stays on one filesystem.
+    """
+    return directory.with_name(f".{directory.name}-incoming")
+
+
+def _open_temp(directory: Path):
+    temp_dir = incoming_dir(directory)
+    temp_dir.mkdir(exist_ok=True)
+    temp_path = temp_dir / f"upload-{uuid.uuid4().hex}.part"
+    return temp_path, open(temp_path, "wb")
+
+
+def _discard(handle, temp_path: Path):
+    handle.close()
+    temp_path.unlink(missing_ok=True)
+
+
+def _move_into_place(temp_path: Path, directory: Path, stem: str, content_hash: str, suffix: str):
+    """Rename temp_path to its content-hashed name, or drop it if that content is stored already.
+
+    Returns (path, is_new).
+    """
+    existing = next(iter(directory.glob(f"*.{content_hash}{suffix}")), None)
+    if existing is not None:
+        temp_path.unlink(missing_ok=True)
+        return existing, False
+    target = directory / f"{stem}.{content_hash}{suffix}"
+    os.replace(temp_path, target)
+    return target, True
+
+
+async def store_upload(file: UploadFile, directory: Path, max_bytes: int = UPLOAD_MAX_BYTES) -> Path:
+    """Stream an upload into directory under a content-hashed name.
+
+    The file is copied in chunks on the threadpool into incoming_dir(directory),
+    hashed as it goes, and only renamed into place once complete. If a file
+    with the same content and extension is already stored, that path is
+    returned and the new copy is discarded. Raises UploadTooLarge past max_bytes.
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLarge(max_bytes)
+    stem, suffix = safe_filename(file.filename)
+    digest = hashlib.sha256()
+    size = 0
+    temp_path, handle = await run_in_threadpool(_open_temp, directory)
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(max_bytes)
+            await run_in_threadpool(_write_chunk, handle, digest, chunk)
+    except BaseException:
+        await run_in_threadpool(_discard, handle, temp_path)
+        raise
+    await run_in_threadpool(handle.close)
+
+    content_hash = digest.hexdigest()[:HASH_LENGTH]
+    target, is_new = await run_in_threadpool(
+        _move_into_place, temp_path, directory, stem, content_hash, suffix)
+    if not is_new:
+        logger.info(f"Upload {file.filename} matches stored {target.name}")
+        return target
+    try:
+        await run_in_threadpool(write_precompressed, target)
+    except Exception as e:
+        logger.error(f"Error precompressing {target.name}: {e}")
+    return target
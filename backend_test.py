@@ -2,450 +2,346 @@
 """
 Comprehensive Backend API Testing for Portfolio Application
 Tests all public and admin endpoints with proper authentication
+
+Checks run concurrently on one pooled async HTTP client, sharing a single
+admin login. Run against a deployed backend:
+
+    python backend_test.py --url http://localhost:8000
+
+or fully in-process against an in-memory MongoDB seeded by seed_data.py:
+
+    python backend_test.py --asgi
 """
 
-import requests
+import argparse
+import asyncio
+import contextlib
 import json
-import sys
 import os
+import sys
+import time
 from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).parent
+BACKEND_DIR = ROOT_DIR / "backend"
+
+
+class CheckFailed(Exception):
+    """Raised by a check with the reason it failed."""
+
 
-# Get backend URL from frontend .env file
 def get_backend_url():
-    try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    return line.split('=', 1)[1].strip()
-    except Exception as e:
-        print(f"Error reading backend URL: {e}")
-        return None
-
-BACKEND_URL = get_backend_url()
-if not BACKEND_URL:
-    print("❌ Could not get backend URL from frontend/.env")
-    sys.exit(1)
-
-API_BASE = f"{BACKEND_URL}/api"
-print(f"🔗 Testing backend at: {API_BASE}")
-
-# Test results tracking
-test_results = {
-    "passed": 0,
-    "failed": 0,
-    "errors": []
-}
-
-def log_test(test_name, success, details=""):
-    """Log test results"""
-    if success:
-        print(f"✅ {test_name}")
-        test_results["passed"] += 1
-    else:
-        print(f"❌ {test_name} - {details}")
-        test_results["failed"] += 1
-        test_results["errors"].append(f"{test_name}: {details}")
+    """Backend URL from BACKEND_URL or REACT_APP_BACKEND_URL in the frontend .env file"""
+    if os.getenv("BACKEND_URL"):
+        return os.environ["BACKEND_URL"]
+    for env_file in (Path("/app/frontend/.env"), ROOT_DIR / "frontend" / ".env"):
+        try:
+            with open(env_file, "r") as f:
+                for line in f:
+                    if line.startswith("REACT_APP_BACKEND_URL="):
+                        return line.split("=", 1)[1].strip()
+        except OSError:
+            continue
+    return None
+
 
-def make_request(method, endpoint, data=None, headers=None, expected_status=200):
-    """Make HTTP request with error handling"""
+def expect_json(response, status=200):
+    """Return the response's JSON body, failing the check on an unexpected status."""
+    if response.status_code != status:
+        raise CheckFailed(f"Status {response.status_code}: {response.text}")
     try:
-        url = f"{API_BASE}{endpoint}"
-        
-        if method.upper() == "GET":
-            response = requests.get(url, headers=headers, timeout=10)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=data, headers=headers, timeout=10)
-        elif method.upper() == "PUT":
-            response = requests.put(url, json=data, headers=headers, timeout=10)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers, timeout=10)
-        else:
-            return None, f"Unsupported method: {method}"
-        
-        return response, None
-    except requests.exceptions.RequestException as e:
-        return None, str(e)
-
-def test_public_apis():
-    """Test all public APIs that don't require authentication"""
-    print("\n🔓 Testing Public APIs...")
-    
-    # Test 1: Root endpoint
-    response, error = make_request("GET", "/")
-    if error:
-        log_test("GET /api/", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("message") and data.get("status") == "success":
-                    log_test("GET /api/", True)
-                else:
-                    log_test("GET /api/", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 2: Profile endpoint
-    response, error = make_request("GET", "/profile")
-    if error:
-        log_test("GET /api/profile", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data:
-                    profile = data["data"]
-                    required_fields = ["name", "headline", "bio", "email"]
-                    missing_fields = [field for field in required_fields if field not in profile]
-                    if missing_fields:
-                        log_test("GET /api/profile", False, f"Missing fields: {missing_fields}")
-                    else:
-                        log_test("GET /api/profile", True)
-                else:
-                    log_test("GET /api/profile", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/profile", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/profile", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 3: Skills endpoint
-    response, error = make_request("GET", "/skills")
-    if error:
-        log_test("GET /api/skills", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data:
-                    skills = data["data"]
-                    if isinstance(skills, dict):
-                        log_test("GET /api/skills", True)
-                    else:
-                        log_test("GET /api/skills", False, f"Skills data should be dict, got: {type(skills)}")
-                else:
-                    log_test("GET /api/skills", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/skills", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/skills", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 4: Projects endpoint
-    response, error = make_request("GET", "/projects")
-    if error:
-        log_test("GET /api/projects", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data and "total" in data:
-                    projects = data["data"]
-                    if isinstance(projects, list):
-                        log_test("GET /api/projects", True)
-                    else:
-                        log_test("GET /api/projects", False, f"Projects data should be list, got: {type(projects)}")
-                else:
-                    log_test("GET /api/projects", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/projects", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/projects", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 5: Education endpoint
-    response, error = make_request("GET", "/education")
-    if error:
-        log_test("GET /api/education", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data:
-                    education = data["data"]
-                    required_fields = ["degree", "institution", "year"]
-                    missing_fields = [field for field in required_fields if field not in education]
-                    if missing_fields:
-                        log_test("GET /api/education", False, f"Missing fields: {missing_fields}")
-                    else:
-                        log_test("GET /api/education", True)
-                else:
-                    log_test("GET /api/education", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/education", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/education", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 6: Experience endpoint
-    response, error = make_request("GET", "/experience")
-    if error:
-        log_test("GET /api/experience", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data:
-                    experience = data["data"]
-                    if "message" in experience:
-                        log_test("GET /api/experience", True)
-                    else:
-                        log_test("GET /api/experience", False, "Missing 'message' field in experience")
-                else:
-                    log_test("GET /api/experience", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/experience", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/experience", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 7: Learning Journey endpoint
-    response, error = make_request("GET", "/learning-journey")
-    if error:
-        log_test("GET /api/learning-journey", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data and "total" in data:
-                    journey = data["data"]
-                    if isinstance(journey, list):
-                        log_test("GET /api/learning-journey", True)
-                    else:
-                        log_test("GET /api/learning-journey", False, f"Journey data should be list, got: {type(journey)}")
-                else:
-                    log_test("GET /api/learning-journey", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/learning-journey", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/learning-journey", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 8: Experiments endpoint
-    response, error = make_request("GET", "/experiments")
-    if error:
-        log_test("GET /api/experiments", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data and "total" in data:
-                    experiments = data["data"]
-                    if isinstance(experiments, list):
-                        log_test("GET /api/experiments", True)
-                    else:
-                        log_test("GET /api/experiments", False, f"Experiments data should be list, got: {type(experiments)}")
-                else:
-                    log_test("GET /api/experiments", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/experiments", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/experiments", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 9: Contact form submission
+        return response.json()
+    except json.JSONDecodeError:
+        raise CheckFailed("Invalid JSON response")
+
+
+def expect(condition, details):
+    if not condition:
+        raise CheckFailed(details)
+
+
+# ---------------------------------------------------------------------------
+# Checks. Each takes the shared context and raises CheckFailed on failure.
+# ---------------------------------------------------------------------------
+
+PUBLIC_CHECKS = []
+ADMIN_CHECKS = []
+ERROR_CHECKS = []
+
+
+def check(group, name):
+    def register(func):
+        group.append((name, func))
+        return func
+    return register
+
+
+@check(PUBLIC_CHECKS, "GET /api/")
+async def check_root(ctx):
+    data = expect_json(await ctx.client.get("/api/"))
+    expect(data.get("message") and data.get("status") == "success", f"Unexpected response format: {data}")
+
+
+@check(PUBLIC_CHECKS, "GET /api/profile")
+async def check_profile(ctx):
+    data = expect_json(await ctx.client.get("/api/profile"))
+    expect(data.get("success") and "data" in data, f"Unexpected response format: {data}")
+    missing_fields = [field for field in ["name", "headline", "bio", "email"] if field not in data["data"]]
+    expect(not missing_fields, f"Missing fields: {missing_fields}")
+
+
+@check(PUBLIC_CHECKS, "GET /api/skills")
+async def check_skills(ctx):
+    data = expect_json(await ctx.client.get("/api/skills"))
+    expect(data.get("success") and "data" in data, f"Unexpected response format: {data}")
+    expect(isinstance(data["data"], dict), f"Skills data should be dict, got: {type(data['data'])}")
+
+
+@check(PUBLIC_CHECKS, "GET /api/projects")
+async def check_projects(ctx):
+    data = expect_json(await ctx.client.get("/api/projects"))
+    expect(data.get("success") and "data" in data and "total" in data, f"Unexpected response format: {data}")
+    expect(isinstance(data["data"], list), f"Projects data should be list, got: {type(data['data'])}")
+
+
+@check(PUBLIC_CHECKS, "GET /api/education")
+async def check_education(ctx):
+    data = expect_json(await ctx.client.get("/api/education"))
+    expect(data.get("success") and "data" in data, f"Unexpected response format: {data}")
+    expect(isinstance(data["data"], list), f"Education data should be list, got: {type(data['data'])}")
+    for entry in data["data"]:
+        missing_fields = [field for field in ["degree", "institution", "year"] if field not in entry]
+        expect(not missing_fields, f"Missing fields: {missing_fields}")
+
+
+@check(PUBLIC_CHECKS, "GET /api/experience")
+async def check_experience(ctx):
+    data = expect_json(await ctx.client.get("/api/experience"))
+    expect(data.get("success") and "data" in data, f"Unexpected response format: {data}")
+    expect(isinstance(data["data"], list), f"Experience data should be list, got: {type(data['data'])}")
+    for entry in data["data"]:
+        missing_fields = [field for field in ["role", "company"] if field not in entry]
+        expect(not missing_fields, f"Missing fields: {missing_fields}")
+
+
+@check(PUBLIC_CHECKS, "GET /api/learning-journey")
+async def check_learning_journey(ctx):
+    data = expect_json(await ctx.client.get("/api/learning-journey"))
+    expect(data.get("success") and "data" in data and "total" in data, f"Unexpected response format: {data}")
+    expect(isinstance(data["data"], list), f"Journey data should be list, got: {type(data['data'])}")
+
+
+@check(PUBLIC_CHECKS, "GET /api/experiments")
+async def check_experiments(ctx):
+    data = expect_json(await ctx.client.get("/api/experiments"))
+    expect(data.get("success") and "data" in data, f"Unexpected response format: {data}")
+    expect(isinstance(data["data"].get("experiments"), list), "Missing 'experiments' list in experiments section")
+
+
+@check(PUBLIC_CHECKS, "POST /api/contact")
+async def check_contact(ctx):
     contact_data = {
         "name": "Shreeya Patel",
         "email": "shreeya.test@example.com",
         "message": "This is a test message from the automated testing suite. Testing the contact form functionality."
     }
-    
-    response, error = make_request("POST", "/contact", data=contact_data)
-    if error:
-        log_test("POST /api/contact", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and data.get("message") and "id" in data:
-                    log_test("POST /api/contact", True)
-                    return data["id"]  # Return message ID for admin tests
-                else:
-                    log_test("POST /api/contact", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("POST /api/contact", False, "Invalid JSON response")
-        else:
-            log_test("POST /api/contact", False, f"Status {response.status_code}: {response.text}")
-    
-    return None
+    data = expect_json(await ctx.client.post("/api/contact", json=contact_data))
+    expect(data.get("success") and data.get("message") and "id" in data, f"Unexpected response format: {data}")
 
-def test_admin_apis():
-    """Test all admin APIs that require authentication"""
-    print("\n🔐 Testing Admin APIs...")
-    
-    # Test 1: Admin login
-    login_data = {
-        "username": "admin",
-        "password": "admin123"
-    }
-    
-    response, error = make_request("POST", "/admin/login", data=login_data)
-    if error:
-        log_test("POST /api/admin/login", False, error)
-        return None
-    
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "access_token" in data and data.get("token_type") == "bearer":
-                log_test("POST /api/admin/login", True)
-                token = data["access_token"]
-            else:
-                log_test("POST /api/admin/login", False, f"Unexpected response format: {data}")
-                return None
-        except json.JSONDecodeError:
-            log_test("POST /api/admin/login", False, "Invalid JSON response")
-            return None
-    else:
-        log_test("POST /api/admin/login", False, f"Status {response.status_code}: {response.text}")
-        return None
-    
-    # Create authorization header
-    auth_headers = {"Authorization": f"Bearer {token}"}
-    
-    # Test 2: Verify admin token
-    response, error = make_request("GET", "/admin/verify", headers=auth_headers)
-    if error:
-        log_test("GET /api/admin/verify", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "admin" in data:
-                    log_test("GET /api/admin/verify", True)
-                else:
-                    log_test("GET /api/admin/verify", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/admin/verify", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/admin/verify", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 3: Update profile (admin)
-    profile_update = {
-        "name": "Shreeya Patel",
-        "headline": "Full Stack Developer & AI Enthusiast",
+
+@check(ADMIN_CHECKS, "GET /api/admin/verify")
+async def check_verify(ctx):
+    data = expect_json(await ctx.client.get("/api/admin/verify", headers=ctx.auth_headers))
+    expect(data.get("success") and "admin" in data, f"Unexpected response format: {data}")
+
+
+@check(ADMIN_CHECKS, "PUT /api/admin/profile")
+async def check_update_profile(ctx):
+    # The update replaces the whole profile, so start from the current one.
+    current = expect_json(await ctx.client.get("/api/profile"))["data"]
+    profile_update = {key: value for key, value in current.items() if key not in ("id", "updatedAt")}
+    profile_update.update({
         "bio": "Updated bio from automated testing suite",
         "highlights": "Updated highlights from testing",
-        "profileImage": "https://example.com/profile.jpg",
-        "email": "shreeya@example.com",
-        "linkedin": "https://linkedin.com/in/shreeya",
-        "location": "Odisha, India"
-    }
-    
-    response, error = make_request("PUT", "/admin/profile", data=profile_update, headers=auth_headers)
-    if error:
-        log_test("PUT /api/admin/profile", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and data.get("message"):
-                    log_test("PUT /api/admin/profile", True)
-                else:
-                    log_test("PUT /api/admin/profile", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("PUT /api/admin/profile", False, "Invalid JSON response")
-        else:
-            log_test("PUT /api/admin/profile", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 4: Get contact messages (admin)
-    response, error = make_request("GET", "/admin/messages", headers=auth_headers)
-    if error:
-        log_test("GET /api/admin/messages", False, error)
-    else:
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if data.get("success") and "data" in data and "total" in data:
-                    messages = data["data"]
-                    if isinstance(messages, list):
-                        log_test("GET /api/admin/messages", True)
-                    else:
-                        log_test("GET /api/admin/messages", False, f"Messages data should be list, got: {type(messages)}")
-                else:
-                    log_test("GET /api/admin/messages", False, f"Unexpected response format: {data}")
-            except json.JSONDecodeError:
-                log_test("GET /api/admin/messages", False, "Invalid JSON response")
-        else:
-            log_test("GET /api/admin/messages", False, f"Status {response.status_code}: {response.text}")
-    
-    # Test 5: Test authentication failure (invalid token)
-    invalid_headers = {"Authorization": "Bearer invalid_token"}
-    response, error = make_request("GET", "/admin/verify", headers=invalid_headers)
-    if error:
-        log_test("Authentication failure test", False, error)
-    else:
-        if response.status_code == 401:
-            log_test("Authentication failure test", True)
-        else:
-            log_test("Authentication failure test", False, f"Expected 401, got {response.status_code}")
-    
-    return token
-
-def test_error_handling():
-    """Test error handling for invalid requests"""
-    print("\n⚠️  Testing Error Handling...")
-    
-    # Test invalid contact form data
+    })
+    data = expect_json(await ctx.client.put("/api/admin/profile", json=profile_update, headers=ctx.auth_headers))
+    expect(data.get("success") and data.get("message"), f"Unexpected response format: {data}")
+
+
+@check(ADMIN_CHECKS, "GET /api/admin/messages")
+async def check_messages(ctx):
+    data = expect_json(await ctx.client.get("/api/admin/messages", headers=ctx.auth_headers))
+    expect(data.get("success") and "data" in data and "total" in data, f"Unexpected response format: {data}")
+    expect(isinstance(data["data"], list), f"Messages data should be list, got: {type(data['data'])}")
+
+
+@check(ADMIN_CHECKS, "Authentication failure test")
+async def check_invalid_token(ctx):
+    response = await ctx.client.get("/api/admin/verify", headers={"Authorization": "Bearer invalid_token"})
+    expect(response.status_code == 401, f"Expected 401, got {response.status_code}")
+
+
+@check(ERROR_CHECKS, "Invalid contact form handling")
+async def check_invalid_contact(ctx):
     invalid_contact = {
         "name": "",  # Empty name
         "email": "invalid-email",  # Invalid email
         "message": ""  # Empty message
     }
-    
-    response, error = make_request("POST", "/contact", data=invalid_contact)
-    if error:
-        log_test("Invalid contact form handling", False, error)
-    else:
-        if response.status_code in [400, 422]:  # Bad request or validation error
-            log_test("Invalid contact form handling", True)
-        else:
-            log_test("Invalid contact form handling", False, f"Expected 400/422, got {response.status_code}")
-    
-    # Test non-existent endpoint
-    response, error = make_request("GET", "/non-existent-endpoint")
-    if error:
-        log_test("Non-existent endpoint handling", False, error)
-    else:
-        if response.status_code == 404:
-            log_test("Non-existent endpoint handling", True)
+    response = await ctx.client.post("/api/contact", json=invalid_contact)
+    expect(response.status_code in [400, 422], f"Expected 400/422, got {response.status_code}")
+
+
+@check(ERROR_CHECKS, "Non-existent endpoint handling")
+async def check_missing_endpoint(ctx):
+    response = await ctx.client.get("/api/non-existent-endpoint")
+    expect(response.status_code == 404, f"Expected 404, got {response.status_code}")
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+class TestContext:
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, client: httpx.AsyncClient, concurrency: int):
+        self.client = client
+        self.auth_headers = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.results = []
+
+    async def run(self, name, func):
+        """Run one check under the concurrency limit and record its outcome and timing."""
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                await func(self)
+                passed, details = True, ""
+            except CheckFailed as e:
+                passed, details = False, str(e)
+            except httpx.HTTPError as e:
+                passed, details = False, f"{type(e).__name__}: {e}"
+            duration_ms = (time.perf_counter() - started) * 1000
+        self.results.append({"name": name, "passed": passed, "details": details, "duration_ms": round(duration_ms, 2)})
+        if passed:
+            print(f"✅ {name} ({duration_ms:.0f} ms)")
         else:
-            log_test("Non-existent endpoint handling", False, f"Expected 404, got {response.status_code}")
+            print(f"❌ {name} - {details} ({duration_ms:.0f} ms)")
+        return passed
+
+    async def login(self, username: str, password: str):
+        """Log in once; every admin check shares the token."""
+        async def check_login(ctx):
+            data = expect_json(await ctx.client.post("/api/admin/login", json={"username": username, "password": password}))
+            expect("access_token" in data and data.get("token_type") == "bearer", f"Unexpected response format: {data}")
+            ctx.auth_headers = {"Authorization": f"Bearer {data['access_token']}"}
+        return await self.run("POST /api/admin/login", check_login)
+
+
+async def run_suite(ctx: TestContext, username: str, password: str):
+    checks = PUBLIC_CHECKS + ERROR_CHECKS
+    # The login runs alongside the public checks; admin checks start once it succeeds.
+    logged_in, *_ = await asyncio.gather(
+        ctx.login(username, password),
+        *(ctx.run(name, func) for name, func in checks),
+    )
+    if logged_in:
+        await asyncio.gather(*(ctx.run(name, func) for name, func in ADMIN_CHECKS))
+
+
+@contextlib.asynccontextmanager
+async def asgi_client():
+    """An httpx client wired straight into the app, backed by a seeded in-memory MongoDB."""
+    os.environ.setdefault("MONGO_URL", "mongomock://")
+    os.environ.setdefault("DB_NAME", "portfolio_test")
+    sys.path.insert(0, str(BACKEND_DIR))
+    import seed_data
+    import server
+    with contextlib.redirect_stdout(sys.stderr):
+        await seed_data.seed_database()
+    async with server.lifespan(server.app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://test") as client:
+            yield client
+
 
-def print_summary():
+def print_summary(results, elapsed: float):
     """Print test summary"""
-    print("\n" + "="*60)
+    passed = sum(result["passed"] for result in results)
+    failed = len(results) - passed
+    print("\n" + "=" * 60)
     print("📊 TEST SUMMARY")
-    print("="*60)
-    print(f"✅ Passed: {test_results['passed']}")
-    print(f"❌ Failed: {test_results['failed']}")
-    print(f"📈 Success Rate: {(test_results['passed'] / (test_results['passed'] + test_results['failed']) * 100):.1f}%")
-    
-    if test_results['errors']:
+    print("=" * 60)
+    print(f"✅ Passed: {passed}")
+    print(f"❌ Failed: {failed}")
+    if results:
+        print(f"📈 Success Rate: {(passed / len(results) * 100):.1f}%")
+    print(f"⏱️  Wall time: {elapsed:.2f} s (sum of checks: {sum(r['duration_ms'] for r in results) / 1000:.2f} s)")
+
+    failures = [result for result in results if not result["passed"]]
+    if failures:
         print("\n🔍 FAILED TESTS:")
-        for error in test_results['errors']:
-            print(f"   • {error}")
-    
-    print("\n" + "="*60)
+        for result in failures:
+            print(f"   • {result['name']}: {result['details']}")
+
+    print("\n" + "=" * 60)
+
+
+async def main_async(args):
+    if args.asgi:
+        client_context = asgi_client()
+        target = "in-process ASGI app"
+        # seed_data.py's admin, unless overridden
+        username = args.username or os.getenv("ADMIN_USERNAME", "shreeya")
+        password = args.password or os.getenv("ADMIN_PASSWORD", "shreeya123")
+    else:
+        backend_url = args.url or get_backend_url()
+        if not backend_url:
+            print("❌ Could not get backend URL from --url, BACKEND_URL or frontend/.env")
+            return 1
+        client_context = httpx.AsyncClient(
+            base_url=backend_url.rstrip("/"), timeout=args.timeout,
+            limits=httpx.Limits(max_connections=args.concurrency))
+        target = f"{backend_url}/api"
+        username = args.username or os.getenv("ADMIN_USERNAME", "admin")
+        password = args.password or os.getenv("ADMIN_PASSWORD", "admin123")
 
-def main():
-    """Main test execution"""
     print("🚀 Starting Portfolio Backend API Tests")
     print(f"📅 Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # Test public APIs
-    message_id = test_public_apis()
-    
-    # Test admin APIs
-    admin_token = test_admin_apis()
-    
-    # Test error handling
-    test_error_handling()
-    
-    # Print summary
-    print_summary()
-    
-    # Return exit code based on results
-    if test_results['failed'] > 0:
-        sys.exit(1)
-    else:
-        print("🎉 All tests passed!")
-        sys.exit(0)
+    print(f"🔗 Testing backend at: {target} (concurrency {args.concurrency})\n")
+
+    started = time.perf_counter()
+    async with client_context as client:
+        ctx = TestContext(client, args.concurrency)
+        await run_suite(ctx, username, password)
+    elapsed = time.perf_counter() - started
+
+    print_summary(ctx.results, elapsed)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"elapsed_s": round(elapsed, 3), "results": ctx.results}, indent=2) + "\n")
+
+    if any(not result["passed"] for result in ctx.results):
+        return 1
+    print("🎉 All tests passed!")
+    return 0
+
+
+def main():
+    """Main test execution"""
+    parser = argparse.ArgumentParser(description="Run the portfolio backend API checks concurrently.")
+    parser.add_argument("--url", help="Backend base URL (default: BACKEND_URL or REACT_APP_BACKEND_URL from frontend/.env)")
+    parser.add_argument("--asgi", action="store_true", help="Test the app in-process against a seeded in-memory MongoDB")
+    parser.add_argument("--concurrency", type=int, default=8, help="Checks in flight at once (default 8)")
+    parser.add_argument("--timeout", type=float, default=10, help="Per-request timeout in seconds (default 10)")
+    parser.add_argument("--username", help="Admin username (default: ADMIN_USERNAME, or the seeded admin with --asgi)")
+    parser.add_argument("--password", help="Admin password (default: ADMIN_PASSWORD, or the seeded admin with --asgi)")
+    parser.add_argument("--json", help="Also write per-test results and timings to this file")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
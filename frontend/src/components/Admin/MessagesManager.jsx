@@ -18,7 +18,10 @@ import { useAdmin } from "../../context/AdminContext";
 
 const MessagesManager = () => {
   const [messages, setMessages] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [total, setTotal] = useState(0);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const { toast } = useToast();
   const { fetchDashboardSummary } = useAdmin();
 
@@ -28,6 +31,8 @@ const MessagesManager = () => {
       const response = await adminApi.getMessages();
       if (response.success && response.data) {
         setMessages(response.data);
+        setNextCursor(response.next_cursor);
+        setTotal(response.total);
       }
     } catch (error) {
       handleApiError(error, toast);
@@ -36,6 +41,22 @@ const MessagesManager = () => {
     }
   };
 
+  const loadMoreMessages = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await adminApi.getMessages(nextCursor);
+      if (response.success && response.data) {
+        setMessages((current) => [...current, ...response.data]);
+        setNextCursor(response.next_cursor);
+        setTotal(response.total);
+      }
+    } catch (error) {
+      handleApiError(error, toast);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     fetchMessages();
   }, []);
@@ -46,7 +67,9 @@ const MessagesManager = () => {
         await adminApi.deleteMessage(messageId);
         toast({ title: "Message deleted successfully." });
         await fetchDashboardSummary();
-        fetchMessages(); // Refresh the list
+        // Update the loaded pages in place so paging isn't reset
+        setMessages((current) => current.filter((m) => m.id !== messageId));
+        setTotal((count) => Math.max(count - 1, 0));
       } catch (error) {
         handleApiError(error, toast);
       }
@@ -58,7 +81,9 @@ const MessagesManager = () => {
       await adminApi.markMessageRead(messageId);
       toast({ title: "Message marked as read." });
       await fetchDashboardSummary();
-      fetchMessages(); // Refresh the list
+      setMessages((current) =>
+        current.map((m) => (m.id === messageId ? { ...m, read: true } : m))
+      );
     } catch (error) {
       handleApiError(error, toast);
     }
@@ -202,6 +227,23 @@ const MessagesManager = () => {
                 No messages yet.
               </p>
             )}
+            {messages.length > 0 && (
+              <div className="flex items-center justify-between pt-4">
+                <p className="text-sm text-slate-400">
+                  Showing {messages.length} of {total} messages
+                </p>
+                {nextCursor && (
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    onClick={loadMoreMessages}
+                    disabled={loadingMore}
+                  >
+                    {loadingMore ? "Loading..." : "Load more"}
+                  </Button>
+                )}
+              </div>
+            )}
           </CardContent>
         </Card>
       </motion.div>
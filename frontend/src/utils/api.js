@@ -309,8 +309,10 @@ export const adminApi = {
   },
 
   // Messages Management
-  getMessages: async () => {
-    const response = await api.get("/admin/messages");
+  // One page of the inbox, newest first; pass next_cursor back to load the next page.
+  getMessages: async (cursor) => {
+    const params = cursor ? { limit: 50, cursor } : { limit: 50 };
+    const response = await api.get("/admin/messages", { params });
     return response.data;
   },
 
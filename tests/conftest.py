@@ -0,0 +1,67 @@
+import contextlib
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Every test runs against a fresh in-memory MongoDB (mongomock-motor).
+os.environ["MONGO_URL"] = "mongomock://"
+os.environ["DB_NAME"] = "portfolio_test"
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+ADMIN_USERNAME = "shreeya"
+ADMIN_PASSWORD = "shreeya123"
+
+# passlib logs a harmless traceback probing the bcrypt version
+logging.getLogger("passlib").setLevel(logging.ERROR)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def event_loop_lease(anyio_backend):
+    """Keep one event loop for the whole session; the app's caches hold asyncio locks."""
+    yield
+
+
+@pytest.fixture
+async def seeded(anyio_backend):
+    """A freshly seeded database, closed again after the test."""
+    import seed_data
+    from auth import admin_token_cache
+    from database import Database
+    from cache import section_cache
+
+    section_cache.clear()
+    admin_token_cache.clear()
+    with contextlib.redirect_stdout(sys.stderr):
+        await seed_data.seed_database()
+    yield
+    Database.close()
+
+
+@pytest.fixture
+async def client(seeded):
+    """An httpx client wired straight into the app, with the lifespan running."""
+    import httpx
+    import server
+
+    with contextlib.redirect_stdout(sys.stderr):
+        async with server.lifespan(server.app):
+            async with httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app=server.app), base_url="http://test") as client:
+                yield client
+
+
+@pytest.fixture
+async def admin_headers(client):
+    response = await client.post(
+        "/api/admin/login", json={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,95 @@
+import gzip
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from assets import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, AssetFiles, accepted_encodings, parse_range
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = bytes(range(256)) * 40
+HASHED = "resume.0123456789abcdef.txt"
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=990-5000", 1000) == (990, 999)
+    assert parse_range("bytes=0-1,5-9", 1000) is None
+    assert parse_range("items=0-1", 1000) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=1000-", 1000)
+    with pytest.raises(ValueError):
+        parse_range("bytes=10-5", 1000)
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, br;q=0, deflate;q=0.5") == {"gzip", "deflate"}
+    assert accepted_encodings(None) == set()
+
+
+@pytest.fixture
+async def static_client(tmp_path):
+    (tmp_path / HASHED).write_bytes(CONTENT)
+    (tmp_path / (HASHED + ".gz")).write_bytes(gzip.compress(CONTENT))
+    (tmp_path / "plain.txt").write_bytes(b"hello")
+    app = Starlette(routes=[Mount("/static", AssetFiles(directory=tmp_path))])
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_precompressed_variant_and_cache_headers(static_client):
+    response = await static_client.get(f"/static/{HASHED}", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.content == CONTENT
+
+    response = await static_client.get(f"/static/{HASHED}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.content == CONTENT
+
+    response = await static_client.get("/static/plain.txt")
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    not_modified = await static_client.get("/static/plain.txt", headers={"If-None-Match": response.headers["etag"]})
+    assert not_modified.status_code == 304
+
+
+async def test_single_ranges_are_served_from_the_original(static_client):
+    response = await static_client.get(f"/static/{HASHED}", headers={"Range": "bytes=100-199", "Accept-Encoding": "gzip"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 100-199/{len(CONTENT)}"
+    assert "content-encoding" not in response.headers
+    assert response.content == CONTENT[100:200]
+
+    response = await static_client.get(f"/static/{HASHED}", headers={"Range": "bytes=-10"})
+    assert response.content == CONTENT[-10:]
+
+    response = await static_client.head(f"/static/{HASHED}", headers={"Range": "bytes=0-9"})
+    assert response.status_code == 206 and response.content == b""
+    assert response.headers["content-length"] == "10"
+
+
+async def test_unsatisfiable_and_ignored_ranges(static_client):
+    response = await static_client.get(f"/static/{HASHED}", headers={"Range": f"bytes={len(CONTENT)}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+    response = await static_client.get(f"/static/{HASHED}", headers={"Range": "bytes=0-1,5-9"})
+    assert response.status_code == 200 and response.content == CONTENT
+
+
+async def test_if_range_only_honours_the_current_etag(static_client):
+    # The validator of the identity representation; the gzip variant has its own
+    etag = (await static_client.get(f"/static/{HASHED}", headers={"Accept-Encoding": "identity"})).headers["etag"]
+
+    response = await static_client.get(f"/static/{HASHED}", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert response.status_code == 206 and response.content == CONTENT[:10]
+
+    # A stale validator (or a date) means the client's copy changed: send the whole file
+    for validator in ('"stale"', "Wed, 21 Oct 2015 07:28:00 GMT"):
+        response = await static_client.get(f"/static/{HASHED}", headers={"Range": "bytes=0-9", "If-Range": validator})
+        assert response.status_code == 200 and response.content == CONTENT
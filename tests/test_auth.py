@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from auth import AdminTokenCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_entries_never_outlive_the_token():
+    cache = AdminTokenCache(max_entries=10, ttl=60)
+    cache.put("expired", {"username": "a"}, time.time() - 1)
+    cache.put("valid", {"username": "b"}, time.time() + 3600)
+
+    assert cache.get("expired") is None
+    assert cache.get("valid") == {"username": "b"}
+
+
+async def test_least_recently_used_token_is_evicted():
+    cache = AdminTokenCache(max_entries=2, ttl=60)
+    cache.put("a", {"username": "a"}, None)
+    cache.put("b", {"username": "b"}, None)
+    cache.get("a")
+    cache.put("c", {"username": "c"}, None)
+
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c")
+
+
+async def test_concurrent_misses_share_one_lookup():
+    cache = AdminTokenCache()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"username": "shreeya"}, None
+
+    admins = await asyncio.gather(*(cache.get_or_load("token", load) for _ in range(10)))
+
+    assert calls == 1
+    assert all(admin is admins[0] for admin in admins)
+    assert cache.get("token") is admins[0]
+
+
+async def test_failed_lookup_is_shared_but_not_cached():
+    cache = AdminTokenCache()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise PermissionError("bad token")
+
+    results = await asyncio.gather(*(cache.get_or_load("bad", load) for _ in range(3)), return_exceptions=True)
+    assert calls == 1
+    assert all(isinstance(result, PermissionError) for result in results)
+
+    with pytest.raises(PermissionError):
+        await cache.get_or_load("bad", load)
+    assert calls == 2
+
+
+async def test_lookup_racing_a_clear_is_not_stored():
+    cache = AdminTokenCache()
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def load():
+        started.set()
+        await release.wait()
+        return {"username": "removed"}, None
+
+    lookup = asyncio.create_task(cache.get_or_load("token", load))
+    await started.wait()
+    cache.clear()
+    release.set()
+
+    assert await lookup == {"username": "removed"}
+    assert cache.get("token") is None
+
+
+async def test_deleted_admin_is_locked_out(client, admin_headers):
+    response = await client.post("/api/admin/users", headers=admin_headers, json={
+        "username": "temp", "password": "temp-password", "name": "Temp", "profileImage": ""})
+    assert response.status_code == 201, response.text
+
+    login = await client.post("/api/admin/login", json={"username": "temp", "password": "temp-password"})
+    temp_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert (await client.get("/api/admin/verify", headers=temp_headers)).status_code == 200
+
+    assert (await client.delete("/api/admin/users/temp", headers=admin_headers)).status_code == 200
+    assert (await client.get("/api/admin/verify", headers=temp_headers)).status_code == 401
+
+
+async def test_invalid_token_is_rejected(client):
+    response = await client.get("/api/admin/verify", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
+
+
+async def test_evict_drops_only_that_admins_sessions():
+    cache = AdminTokenCache()
+    cache.put("a1", {"username": "a"}, None)
+    cache.put("a2", {"username": "a"}, None)
+    cache.put("b1", {"username": "b"}, None)
+
+    cache.evict("a")
+    assert cache.get("a1") is None and cache.get("a2") is None
+    assert cache.get("b1") == {"username": "b"}
+
+
+async def test_admin_writes_leave_the_section_cache_alone(client, admin_headers):
+    from cache import section_cache
+
+    invalidated = []
+    section_cache.subscribe(invalidated.append)
+    try:
+        response = await client.post("/api/admin/users", headers=admin_headers, json={
+            "username": "temp2", "password": "temp-password", "name": "Temp", "profileImage": ""})
+        assert response.status_code == 201, response.text
+        assert (await client.delete("/api/admin/users/temp2", headers=admin_headers)).status_code == 200
+    finally:
+        section_cache._listeners.remove(invalidated.append)
+    assert "admin" not in invalidated
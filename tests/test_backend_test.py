@@ -0,0 +1,26 @@
+import pytest
+
+import backend_test
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_api_suite_passes_in_process(client, capsys):
+    ctx = backend_test.TestContext(client, concurrency=8)
+    await backend_test.run_suite(ctx, "shreeya", "shreeya123")
+
+    failures = [f"{r['name']}: {r['details']}" for r in ctx.results if not r["passed"]]
+    assert failures == []
+    expected = 1 + len(backend_test.PUBLIC_CHECKS) + len(backend_test.ERROR_CHECKS) + len(backend_test.ADMIN_CHECKS)
+    assert len(ctx.results) == expected
+
+
+async def test_failed_checks_are_reported_not_raised(client, capsys):
+    ctx = backend_test.TestContext(client, concurrency=2)
+
+    async def check_broken(ctx):
+        backend_test.expect(False, "always fails")
+
+    assert not await ctx.run("broken", check_broken)
+    assert ctx.results[0]["details"] == "always fails"
+    assert "❌ broken" in capsys.readouterr().out
@@ -0,0 +1,46 @@
+import argparse
+
+import pytest
+
+import benchmark
+
+pytestmark = pytest.mark.anyio
+
+
+def test_percentile_and_summary():
+    values = [i / 1000 for i in range(1, 101)]
+    assert benchmark.percentile(values, 50) == 0.05
+    assert benchmark.percentile(values, 99) == 0.099
+    assert benchmark.percentile([], 95) == 0.0
+
+    summary = benchmark.summarize(values, errors=2, elapsed=2.0)
+    assert summary["requests"] == 100 and summary["errors"] == 2
+    assert summary["rps"] == 50.0
+    assert summary["p95_ms"] == 95.0 and summary["max_ms"] == 100.0
+
+
+def test_parse_mix():
+    assert benchmark.parse_mix("public=3, admin") == {"public": 3.0, "admin": 1.0}
+    with pytest.raises(SystemExit):
+        benchmark.parse_mix("public=1,unknown=2")
+
+
+async def test_short_in_process_run_has_no_errors():
+    args = argparse.Namespace(
+        url=None, duration=0.5, warmup=0, concurrency=2, mix=benchmark.DEFAULT_MIX, seed=True,
+        seed_scale=0, random_seed=1, username="shreeya", password="shreeya123")
+    report = await benchmark.benchmark(args)
+
+    assert report["meta"]["mode"] == "in-process"
+    assert report["overall"]["requests"] > 0
+    assert report["overall"]["errors"] == 0
+    assert set(report["scenarios"]) <= {"public", "portfolio", "search", "contact", "admin"}
+
+
+async def test_seeding_flags_are_rejected_with_url():
+    for seed, seed_scale in ((True, 0), (False, 1000)):
+        args = argparse.Namespace(
+            url="http://localhost:8000", duration=0.1, warmup=0, concurrency=1, mix=benchmark.DEFAULT_MIX,
+            seed=seed, seed_scale=seed_scale, random_seed=1, username="shreeya", password="shreeya123")
+        with pytest.raises(SystemExit, match="--url"):
+            await benchmark.benchmark(args)
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from cache import SectionCache, cached, invalidates, section_cache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = SectionCache(ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"name": "profile"}
+
+    values = await asyncio.gather(*(cache.get_or_load("profile", loader) for _ in range(10)))
+
+    assert calls == 1
+    assert all(value is values[0] for value in values)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 9
+
+
+async def test_load_racing_an_invalidation_is_not_stored():
+    cache = SectionCache(ttl=60)
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return ["stale"]
+
+    load = asyncio.create_task(cache.get_or_load("projects", slow_loader))
+    await started.wait()
+    cache.invalidate("projects")
+    release.set()
+
+    assert await load == ["stale"]
+
+    async def fresh_loader():
+        return ["fresh"]
+
+    assert await cache.get_or_load("projects", fresh_loader) == ["fresh"]
+
+
+async def test_none_is_not_cached_and_entries_expire():
+    cache = SectionCache(ttl=0)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return None if calls == 1 else calls
+
+    assert await cache.get_or_load("footer", loader) is None
+    assert await cache.get_or_load("footer", loader) == 2
+    # ttl=0: every entry is already expired on the next read
+    assert await cache.get_or_load("footer", loader) == 3
+
+
+async def test_invalidates_runs_even_when_the_write_fails():
+    invalidated = []
+    section_cache.subscribe(invalidated.append)
+
+    @invalidates("skills")
+    async def failing_write():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await failing_write()
+    assert "skills" in invalidated
+
+
+async def test_cached_getter_serves_from_cache_until_invalidated():
+    calls = 0
+
+    @cached("test_section")
+    async def getter():
+        nonlocal calls
+        calls += 1
+        return [calls]
+
+    assert await getter() == [1]
+    assert await getter() == [1]
+    section_cache.invalidate("test_section")
+    assert await getter() == [2]
+
+
+async def test_admin_write_is_visible_on_the_next_public_read(client, admin_headers):
+    before = (await client.get("/api/projects")).json()["data"]
+
+    response = await client.post("/api/admin/projects", headers=admin_headers, json={
+        "title": "Cache Probe", "description": "Created by the cache test",
+        "status": "Completed", "image": "", "technologies": ["Python"], "year": 2024,
+    })
+    assert response.status_code == 200, response.text
+
+    after = (await client.get("/api/projects")).json()["data"]
+    assert len(after) == len(before) + 1
+    assert "Cache Probe" in [project["title"] for project in after]
+
+
+async def test_variants_are_capped_per_section():
+    cache = SectionCache(ttl=60, max_variants=2)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return [calls]
+
+    for fields in ("a", "b", "c", "c"):
+        await cache.get_or_load(f"projects?fields={fields}", loader)
+    assert calls == 4
+    assert cache.stats()["uncached_variant_loads"] == 2
+    assert await cache.get_or_load("projects?fields=a", loader) == [1]
+
+    # Invalidating the section frees its slots
+    cache.invalidate("projects")
+    await cache.get_or_load("projects?fields=c", loader)
+    assert await cache.get_or_load("projects?fields=c", loader) == [5]
+    assert len(cache._locks) == 1
+
+
+async def test_invalidation_drops_rendered_bodies():
+    cache = SectionCache(ttl=60, max_bodies=2)
+    value = await cache.get_or_load("projects?fields=title", lambda: asyncio.sleep(0, ["p"]))
+    cache.render("projects?fields=title", value, lambda: value)
+    cache.render("footer", ["f"], lambda: ["f"])
+    assert cache.stats()["rendered_bodies"] == 2
+
+    cache.invalidate("projects")
+    assert cache.stats()["rendered_bodies"] == 1
+
+    # Uncached variants are not kept, and the rest are bounded
+    cache.render("skills?fields=name", ["s"], lambda: ["s"])
+    for key in ("portfolio:profile", "portfolio:footer", "portfolio:skills"):
+        cache.render(key, (), lambda: {})
+    assert list(cache._bodies) == ["portfolio:footer", "portfolio:skills"]
+
+
+async def test_fields_are_validated_and_get_their_own_etag(client):
+    response = await client.get("/api/projects", params={"fields": "title,password"})
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+    full = await client.get("/api/projects")
+    titles = await client.get("/api/projects", params={"fields": "title,id"})
+    assert titles.status_code == 200
+    assert set(titles.json()["data"][0]) == {"id", "title"}
+    assert titles.headers["etag"] != full.headers["etag"]
+
+    # Field order doesn't matter
+    same = await client.get("/api/projects", params={"fields": "id,title"},
+                            headers={"If-None-Match": titles.headers["etag"]})
+    assert same.status_code == 304
@@ -0,0 +1,31 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_summary_counts_follow_writes(client, admin_headers):
+    async def summary():
+        response = await client.get("/api/admin/dashboard-summary", headers=admin_headers)
+        assert response.status_code == 200
+        return response.json()["data"]
+
+    before = await summary()
+    projects = (await client.get("/api/projects")).json()["data"]
+    skills = (await client.get("/api/skills")).json()["data"]
+    assert before["project_count"] == len(projects)
+    assert before["skill_category_count"] == len(skills)
+
+    for i in range(7):
+        response = await client.post("/api/contact", json={
+            "name": f"Visitor {i}", "email": f"v{i}@example.com", "message": "Hi"})
+        assert response.status_code == 200
+    message_id = (await client.get("/api/admin/messages", headers=admin_headers)).json()["data"][0]["id"]
+    assert (await client.put(f"/api/admin/messages/{message_id}/read", headers=admin_headers)).status_code == 200
+
+    after = await summary()
+    assert after["message_count"] == before["message_count"] + 7
+    assert after["unread_message_count"] == before["unread_message_count"] + 6
+    # Only the five newest unread messages are embedded
+    assert len(after["recent_messages"]) == 5
+    assert all(message["read"] is False for message in after["recent_messages"])
+    assert after["recent_messages"][0]["name"] == "Visitor 5"
@@ -0,0 +1,43 @@
+import pytest
+
+import database
+from database import Database, bind_database, client_options
+
+pytestmark = pytest.mark.anyio
+
+
+def test_client_options_come_from_the_environment(monkeypatch):
+    for env in database.MONGO_CLIENT_OPTIONS:
+        monkeypatch.delenv(env, raising=False)
+    assert client_options() == {}
+
+    monkeypatch.setenv("MONGO_MAX_POOL_SIZE", "50")
+    monkeypatch.setenv("MONGO_COMPRESSORS", "zstd,zlib")
+    monkeypatch.setenv("MONGO_APP_NAME", "")
+    assert client_options() == {"maxPoolSize": 50, "compressors": "zstd,zlib"}
+
+
+def test_bad_numeric_option_fails_loudly(monkeypatch):
+    monkeypatch.setenv("MONGO_MIN_POOL_SIZE", "ten")
+    with pytest.raises(ValueError):
+        client_options()
+
+
+async def test_connect_is_idempotent(seeded):
+    client, db = database.client, database.db
+    await Database.connect()
+    assert database.client is client and database.db is db
+
+
+async def test_bind_database_repoints_every_collection(seeded):
+    original = database.db
+    other = database.client["portfolio_other"]
+    try:
+        bind_database(other)
+        assert database.db is other
+        assert database.projects_collection.database is other
+        assert database.notifications_collection.name == "notifications"
+        assert await database.projects_collection.count_documents({}) == 0
+    finally:
+        bind_database(original)
+    assert await database.projects_collection.count_documents({}) > 0
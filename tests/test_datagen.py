@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+
+import datagen
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2026, 1, 1)
+
+
+@pytest.mark.parametrize("collection", sorted(datagen.GENERATORS))
+def test_documents_are_deterministic_and_valid(collection):
+    first = list(datagen.generate(collection, 12, seed=3, now=NOW))
+    assert first == list(datagen.generate(collection, 12, seed=3, now=NOW))
+    assert len({doc["_id"] for doc in first}) == len(first)
+
+
+def test_any_range_can_be_generated_on_its_own():
+    full = list(datagen.generate("projects", 10, seed=1, now=NOW))
+    assert full[6:] == list(datagen.generate("projects", 10, seed=1, start=6, now=NOW))
+    assert full != list(datagen.generate("projects", 10, seed=2, now=NOW))
+
+
+async def test_load_upserts_by_id(seeded):
+    import database
+
+    before = await database.db.projects.count_documents({})
+    assert await datagen.load({"projects": 20, "notifications": 5}) == {"projects": 20, "notifications": 5}
+    await datagen.load({"projects": 20})
+    assert await database.db.projects.count_documents({}) == before + 20
+
+    # Growing only writes the new documents
+    await datagen.load({"projects": 30}, start={"projects": 20})
+    assert await database.db.projects.count_documents({}) == before + 30
+
+
+async def test_report_only_reseeds_when_forced(seeded, monkeypatch):
+    import argparse
+
+    import seed_data
+
+    calls = []
+    seed = seed_data.seed_database
+
+    async def recording_seed(**kwargs):
+        calls.append(kwargs)
+        await seed(**kwargs)
+
+    monkeypatch.setattr(seed_data, "seed_database", recording_seed)
+    monkeypatch.setenv("MONGO_URL", "mongodb://db.example:27017")
+    args = argparse.Namespace(collections="projects", sizes="5", endpoints="projects", repeat=1, seed=0,
+                              force=False, username="shreeya", password="shreeya123")
+
+    result = await datagen.report(args)
+    assert calls == [{"upsert": True}]
+    assert result["meta"]["reseeded"] is False
+    assert result["steps"][0]["endpoints"]["projects"]["status"] == 200
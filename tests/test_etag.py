@@ -0,0 +1,57 @@
+import pytest
+
+from cache import SectionCache, etag_matches
+
+pytestmark = pytest.mark.anyio
+
+
+def test_etag_matches_weak_lists_and_wildcard():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_render_builds_once_per_value():
+    cache = SectionCache()
+    value = [{"id": 1}]
+    builds = 0
+
+    def build():
+        nonlocal builds
+        builds += 1
+        return {"data": value}
+
+    body, etag = cache.render("projects", value, build)
+    assert cache.render("projects", value, build) == (body, etag)
+    assert builds == 1
+
+    # An equal but new value (a cache refill) is rendered again
+    cache.render("projects", [{"id": 1}], build)
+    assert builds == 2
+
+
+async def test_if_none_match_returns_304(client):
+    first = await client.get("/api/profile")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "public, no-cache"
+
+    second = await client.get("/api/profile", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+async def test_etag_changes_after_an_admin_write(client, admin_headers):
+    etag = (await client.get("/api/skills")).headers["etag"]
+
+    response = await client.put("/api/admin/skills/Testing", headers=admin_headers,
+                                json=[{"name": "pytest", "proficiency": 90}])
+    assert response.status_code == 200, response.text
+
+    response = await client.get("/api/skills", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from images import ImageProcessor, render_variants, srcset
+
+pytestmark = pytest.mark.anyio
+Image = pytest.importorskip("PIL.Image")
+
+
+def write_png(path, width=800, height=400):
+    Image.new("RGB", (width, height), (200, 30, 30)).save(path, format="PNG")
+
+
+def test_render_never_upscales_and_reuses_files(tmp_path):
+    source = tmp_path / "photo.png"
+    write_png(source)
+
+    variants = render_variants(str(source), str(tmp_path), "photo", "0" * 16, (320, 640, 1280), ("webp",))
+    assert [(v["width"], v["height"]) for v in variants] == [(320, 160), (640, 320), (800, 400)]
+    mtimes = [(tmp_path / v["name"]).stat().st_mtime_ns for v in variants]
+
+    again = render_variants(str(source), str(tmp_path), "photo", "0" * 16, (320, 640, 1280), ("webp",))
+    assert again == variants
+    assert [(tmp_path / v["name"]).stat().st_mtime_ns for v in again] == mtimes
+    assert not list(tmp_path.glob("*.part"))
+
+
+async def test_processor_shares_renders_and_caches_manifests(tmp_path):
+    processor = ImageProcessor(tmp_path, workers=1, widths=(320, 640))
+    if not processor.formats:
+        pytest.skip("Pillow has no WebP/AVIF support")
+    write_png(tmp_path / "photo.0123456789abcdef.png")
+    url = "/static/photo.0123456789abcdef.png"
+
+    try:
+        results = await asyncio.gather(*(processor.variants_for(url) for _ in range(3)))
+        assert results[0] == results[1] == results[2]
+        assert processor.stats()["rendered"] == 1
+        assert {v["width"] for v in results[0]} == {320, 640}
+        assert all(v["url"].startswith("/static/images/photo-") for v in results[0])
+
+        assert await processor.variants_for(url) == results[0]
+        assert processor.stats()["cached"] == 1
+        fmt = processor.formats[0]
+        assert srcset(results[0], fmt).count("w,") == 1
+    finally:
+        processor.shutdown()
+
+
+async def test_processor_ignores_foreign_and_missing_images(tmp_path):
+    processor = ImageProcessor(tmp_path / "static", workers=1)
+    (tmp_path / "static").mkdir()
+    write_png(tmp_path / "outside.png")
+
+    assert await processor.variants_for("https://example.com/a.png") == []
+    assert await processor.variants_for("/static/../outside.png") == []
+    assert await processor.variants_for("/static/missing.png") == []
+    assert await processor.variants_for("/static/notes.txt") == []
@@ -0,0 +1,68 @@
+import pytest
+from pymongo import ASCENDING, DESCENDING
+
+from indexes import index_problems, summarize_plan
+
+pytestmark = pytest.mark.anyio
+
+SPECS = [
+    ([("createdAt", DESCENDING), ("_id", DESCENDING)], {}),
+    ([("username", ASCENDING)], {"unique": True}),
+]
+
+
+def test_matching_indexes_have_no_problems():
+    info = {
+        "_id_": {"key": [("_id", 1)]},
+        "createdAt_-1__id_-1": {"key": [("createdAt", -1.0), ("_id", -1)]},
+        "username_1": {"key": [("username", 1)], "unique": True},
+    }
+    assert index_problems("admin", SPECS, info) == []
+
+
+def test_missing_and_mismatched_indexes_are_reported():
+    info = {
+        "createdAt_1__id_-1": {"key": [("createdAt", 1), ("_id", -1)]},
+        "username_1": {"key": [("username", 1)]},
+    }
+    assert index_problems("admin", SPECS, info) == [
+        "admin [('createdAt', -1), ('_id', -1)]: missing",
+        "admin [('username', 1)]: unique is None, expected True",
+    ]
+
+
+def test_plan_summary_flags_scans_and_in_memory_sorts():
+    explain = {
+        "queryPlanner": {"winningPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}},
+        "executionStats": {"nReturned": 5, "totalKeysExamined": 0, "totalDocsExamined": 500,
+                           "executionTimeMillis": 12},
+    }
+    summary = summarize_plan(explain)
+    assert summary["stages"] == ["SORT", "COLLSCAN"]
+    assert summary["collection_scan"] and summary["in_memory_sort"] and summary["slow"]
+    assert (summary["returned"], summary["docs_examined"], summary["millis"]) == (5, 500, 12)
+
+    indexed = summarize_plan({"queryPlanner": {"winningPlan": {
+        "stage": "LIMIT", "inputStage": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}}}})
+    assert indexed["stages"] == ["LIMIT", "FETCH", "IXSCAN"]
+    assert not indexed["slow"] and indexed["returned"] is None
+
+
+async def test_created_indexes_verify_clean(client):
+    from database import Database, db
+
+    assert await Database.verify_indexes() == []
+    await db.projects.drop_indexes()
+    assert await Database.verify_indexes() == [f"projects {[('createdAt', -1)]}: missing"]
+    await Database.create_indexes()
+    assert await Database.verify_indexes() == []
+
+
+async def test_query_plans_route_requires_admin(client, admin_headers):
+    assert (await client.get("/api/admin/query-plans")).status_code in (401, 403)
+
+    response = await client.get("/api/admin/query-plans", headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["index_problems"] == []
+    assert isinstance(data["plans"], dict) and data["plans"]
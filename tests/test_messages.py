@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def insert_messages(count):
+    import database
+
+    # Pairs share a createdAt so paging has to break ties on _id.
+    base = datetime.utcnow()
+    await database.contact_messages_collection.insert_many([
+        {"name": f"Sender {i}", "email": f"s{i}@example.com", "message": f"Hello {i}",
+         "read": i % 3 == 0, "createdAt": base - timedelta(minutes=i // 2)}
+        for i in range(count)
+    ])
+
+
+async def read_all_pages(client, headers, **params):
+    items, cursor = [], None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/admin/messages", params=query, headers=headers)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        items += body["data"]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items, body["total"]
+
+
+async def test_keyset_pages_cover_every_message_once(client, admin_headers):
+    await insert_messages(11)
+
+    items, total = await read_all_pages(client, admin_headers, limit=3)
+    assert total == 11
+    # Newest first; within a shared createdAt the later insert (higher _id) comes first
+    order = [1, 0, 3, 2, 5, 4, 7, 6, 9, 8, 10]
+    assert [m["name"] for m in items] == [f"Sender {i}" for i in order]
+
+
+async def test_read_filter_and_field_projection(client, admin_headers):
+    await insert_messages(9)
+
+    unread, total = await read_all_pages(client, admin_headers, limit=2, read="false", fields="name,read")
+    assert total == 6 == len(unread)
+    assert all(set(m) == {"id", "name", "read"} and m["read"] is False for m in unread)
+
+
+async def test_invalid_parameters(client, admin_headers):
+    async def get(**params):
+        return await client.get("/api/admin/messages", params=params, headers=admin_headers)
+
+    assert (await get(cursor="garbage")).status_code == 400
+    assert (await get(fields="name,password")).status_code == 400
+    assert (await get(limit=501)).status_code == 422
+    assert (await client.get("/api/admin/messages")).status_code in (401, 403)
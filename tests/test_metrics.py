@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+import pytest
+
+from metrics import (MongoCommandMetrics, Registry, mongodb_command_duration_seconds,
+                     mongodb_slow_commands_total, query_shape)
+
+pytestmark = pytest.mark.anyio
+
+ADDRESS = ("localhost", 27017)
+
+
+def started(name, command, request_id):
+    return SimpleNamespace(command_name=name, command=command, connection_id=ADDRESS, request_id=request_id)
+
+
+def finished(name, request_id, micros):
+    return SimpleNamespace(command_name=name, connection_id=ADDRESS, request_id=request_id, duration_micros=micros)
+
+
+def series(metric, **labels):
+    return metric._values.get(metric._key(labels))
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, route="/api/x")
+    registry.add_stats("component", lambda: {"depth": 3, "running": True, "name": "ignored"})
+
+    text = registry.render()
+    assert 'latency_seconds_bucket{route="/api/x",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/api/x",le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{route="/api/x",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/api/x"} 3' in text
+    assert "component_depth 3" in text and "component_running 1" in text
+    assert "component_name" not in text
+
+
+def test_query_shape_has_field_names_only():
+    assert query_shape({"find": "users", "filter": {"email": "a@b.c", "age": {"$gt": 3}}, "sort": {"age": -1}}) \
+        == "filter=['age', 'email'] sort=['age']"
+
+
+def test_get_more_and_kill_cursors_are_labelled_with_their_collection():
+    listener = MongoCommandMetrics(slow_ms=1000)
+    listener.started(started("getMore", {"getMore": 123, "collection": "cursor_probe"}, 1))
+    listener.succeeded(finished("getMore", 1, 10))
+    listener.started(started("killCursors", {"killCursors": "cursor_probe", "cursors": [123]}, 2))
+    listener.succeeded(finished("killCursors", 2, 10))
+
+    assert series(mongodb_command_duration_seconds, collection="cursor_probe", command="getMore")
+    assert series(mongodb_command_duration_seconds, collection="cursor_probe", command="killCursors")
+
+
+def test_slow_commands_are_counted_and_pending_commands_are_bounded(caplog):
+    listener = MongoCommandMetrics(slow_ms=1, max_pending=3)
+    listener.started(started("insert", {"insert": "slow_probe", "documents": [{"big": "x" * 1000}]}, 1))
+    listener.started(started("find", {"find": "slow_probe", "filter": {"read": False}}, 2))
+    assert "documents" not in listener._commands[(ADDRESS, 1)][1]
+
+    listener.succeeded(finished("find", 2, 5000))
+    assert series(mongodb_slow_commands_total, collection="slow_probe", command="find") == 1
+    assert "filter=['read']" in caplog.text
+
+    # Commands that never report back are eventually forgotten
+    for request_id in range(10, 20):
+        listener.started(started("find", {"find": "slow_probe"}, request_id))
+    assert len(listener._commands) == 3
+    assert (ADDRESS, 1) not in listener._commands
+
+
+async def test_metrics_endpoint_needs_the_token(client, monkeypatch):
+    import server
+
+    assert (await client.get("/metrics")).status_code == 404
+
+    monkeypatch.setattr(server, "METRICS_TOKEN", "scrape-secret")
+    assert (await client.get("/metrics")).status_code == 401
+    response = await client.get("/metrics", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+async def test_metrics_endpoint_labels_routes_by_template(client, monkeypatch):
+    import server
+
+    monkeypatch.setattr(server, "METRICS_TOKEN", "scrape-secret")
+    await client.get("/api/projects")
+    await client.get("/api/admin/projects/does-not-exist")
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    text = response.text
+    assert 'http_requests_total{method="GET",route="/api/projects",status="200"}' in text
+    assert "does-not-exist" not in text
+    assert "portfolio_section_cache_hits" in text
+
+
+def test_pool_metrics_track_waits_failures_and_checked_out_connections():
+    from metrics import (MongoPoolMetrics, mongodb_pool_checked_out, mongodb_pool_checkout_failures_total,
+                         mongodb_pool_connections, mongodb_pool_max_size, mongodb_pool_wait_seconds)
+
+    pool = ("pool-probe", 27017)
+    address = "pool-probe:27017"
+    event = SimpleNamespace(address=pool)
+    listener = MongoPoolMetrics()
+
+    listener.pool_created(SimpleNamespace(address=pool, options={"maxPoolSize": 7}))
+    listener.connection_created(event)
+    listener.connection_created(event)
+    listener.connection_closed(event)
+    assert series(mongodb_pool_max_size, address=address) == 7
+    assert series(mongodb_pool_connections, address=address) == 1
+
+    for _ in range(2):
+        listener.connection_check_out_started(event)
+        listener.connection_checked_out(event)
+    listener.connection_checked_in(event)
+    assert series(mongodb_pool_checked_out, address=address) == 1
+
+    listener.connection_check_out_started(event)
+    listener.connection_check_out_failed(SimpleNamespace(address=pool, reason="timeout"))
+    assert series(mongodb_pool_checkout_failures_total, address=address, reason="timeout") == 1
+    # Two successful checkouts and one failed one all waited
+    assert sum(series(mongodb_pool_wait_seconds, address=address)[:-1]) == 3
+    assert not listener._checkouts
@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from notifications import NotificationQueue
+
+pytestmark = pytest.mark.anyio
+
+
+class Recorder:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, docs):
+        if self.fail:
+            raise RuntimeError("write failed")
+        self.batches.append(list(docs))
+
+
+async def test_batches_fill_up_to_batch_size():
+    writer = Recorder()
+    queue = NotificationQueue(writer, max_size=100, batch_size=4, flush_interval=0.01)
+    queue.start()
+    for i in range(10):
+        assert queue.put({"n": i})
+    assert len(queue.pending()) == 10
+
+    await queue.stop()
+    assert [len(batch) for batch in writer.batches] == [4, 4, 2]
+    assert [doc["n"] for batch in writer.batches for doc in batch] == list(range(10))
+    assert queue.pending() == []
+    assert queue.stats()["written"] == 10
+
+
+async def test_full_queue_drops_instead_of_blocking():
+    writer = Recorder()
+    queue = NotificationQueue(writer, max_size=2, batch_size=10, flush_interval=0.01)
+    queue.start()
+    results = [queue.put({"n": i}) for i in range(4)]
+    assert results == [True, True, False, False]
+    await queue.stop()
+    assert queue.stats()["dropped"] == 2
+    assert sum(len(batch) for batch in writer.batches) == 2
+
+
+async def test_failed_batches_are_counted_and_released():
+    queue = NotificationQueue(Recorder(fail=True), max_size=10, batch_size=10, flush_interval=0.01)
+    queue.start()
+    queue.put({"n": 1})
+    await queue.stop()
+    assert queue.stats()["failed"] == 1
+    assert queue.pending() == []
+
+
+async def test_stop_is_idempotent_and_restartable():
+    writer = Recorder()
+    queue = NotificationQueue(writer, flush_interval=0.01)
+    await queue.stop()
+    queue.start()
+    queue.start()
+    assert queue.running
+    await queue.stop()
+    assert not queue.running
+    queue.start()
+    queue.put({"n": 1})
+    await queue.stop()
+    assert writer.batches == [[{"n": 1}]]
+
+
+async def test_create_notification_is_written_behind(client, admin_headers):
+    import database
+
+    for i in range(3):
+        assert await database.Database.create_notification(
+            {"message": f"m{i}", "type": "info", "read": False, "createdAt": datetime.utcnow()})
+    assert database.notification_queue.running
+    # The batch lands within one flush interval
+    await asyncio.sleep(database.notification_queue.flush_interval * 2)
+    assert await database.notifications_collection.count_documents({"message": {"$in": ["m0", "m1", "m2"]}}) == 3
@@ -0,0 +1,61 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from notifications import NotificationHub
+
+pytestmark = pytest.mark.anyio
+
+
+def parse_event(frame: bytes):
+    lines = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+    return lines["event"], json.loads(lines["data"])
+
+
+def test_slow_subscriber_gets_a_single_resync():
+    hub = NotificationHub(buffer=3)
+    fast, slow = hub.subscribe(), hub.subscribe()
+    for i in range(3):
+        hub.publish("notification", {"n": i})
+        fast.get_nowait()
+    hub.publish("notification", {"n": 3})
+
+    assert fast.get_nowait() == ("notification", {"n": 3})
+    assert slow.qsize() == 1 and slow.get_nowait() == ("resync", {})
+    hub.unsubscribe(slow)
+    assert hub.stats()["subscribers"] == 1
+
+
+async def test_stream_sends_the_unread_count_then_live_events(client):
+    import server
+    from database import Database
+
+    response = await server.stream_notifications(current_admin={"username": "shreeya"})
+    assert response.media_type == "text/event-stream"
+    # httpx's ASGI transport buffers whole bodies, so read the stream directly.
+    events = response.body_iterator
+    event, data = parse_event(await events.__anext__())
+    assert event == "unread"
+    unread = data["unread_count"]
+
+    next_frame = asyncio.ensure_future(events.__anext__())
+    await asyncio.sleep(0)
+    await Database.create_notification({"message": "live", "type": "info", "read": False,
+                                        "createdAt": datetime.utcnow()})
+    event, data = parse_event(await asyncio.wait_for(next_frame, 1))
+    assert event == "notification"
+    assert data["notification"]["message"] == "live"
+    assert data["unread_delta"] == 1
+    assert await Database.count_unread_notifications() == unread + 1
+
+    await events.aclose()
+    assert server.notification_hub.stats()["subscribers"] == 0
+
+
+async def test_stream_requires_a_token(client):
+    response = await client.get("/api/admin/notifications/stream")
+    assert response.status_code == 401
+    response = await client.get("/api/admin/notifications/stream", params={"token": "not-a-jwt"})
+    assert response.status_code == 401
@@ -0,0 +1,117 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from notifications import UnreadCounter
+
+pytestmark = pytest.mark.anyio
+
+
+async def insert_notifications(count):
+    import database
+
+    # Flush notifications queued by earlier requests (e.g. the login) first
+    await database.notification_queue.stop()
+    database.notification_queue.start()
+    base = datetime.utcnow()
+    await database.notifications_collection.delete_many({})
+    if count:
+        await database.notifications_collection.insert_many([
+            {"message": f"n{i}", "type": "info" if i % 2 else "error", "read": i % 4 == 0,
+             "createdAt": base - timedelta(seconds=i // 2)}
+            for i in range(count)
+        ])
+    await database.unread_counter.resync()
+
+
+async def test_feed_pages_backwards_and_forwards(client, admin_headers):
+    await insert_notifications(9)
+
+    async def page(**params):
+        response = await client.get("/api/admin/notifications", params=params, headers=admin_headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    first = await page(limit=4)
+    second = await page(limit=4, before=first["next_cursor"])
+    third = await page(limit=4, before=second["next_cursor"])
+    messages = [n["message"] for p in (first, second, third) for n in p["data"]]
+    assert sorted(messages) == sorted(f"n{i}" for i in range(9))
+    assert len(set(messages)) == 9
+    assert third["next_cursor"] is None
+
+    # prev_cursor leads back to the page before
+    back = await page(limit=4, after=second["prev_cursor"])
+    assert back["data"] == first["data"]
+
+    errors = await page(limit=10, type="error")
+    assert len(errors["data"]) == 5 and {n["type"] for n in errors["data"]} == {"error"}
+    assert first["unread_count"] == 6
+
+
+async def test_feed_rejects_bad_cursors(client, admin_headers):
+    response = await client.get("/api/admin/notifications", params={"before": "garbage"}, headers=admin_headers)
+    assert response.status_code == 400
+    response = await client.get("/api/admin/notifications", params={"before": "a", "after": "b"}, headers=admin_headers)
+    assert response.status_code == 400
+
+
+async def test_delta_during_a_recount_is_kept():
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def recount():
+        started.set()
+        await release.wait()
+        return 10
+
+    counter = UnreadCounter(recount, resync_interval=60)
+    resync = asyncio.create_task(counter.get())
+    await started.wait()
+    counter.add(1)
+    counter.add(1)
+    release.set()
+
+    assert await resync == 12
+    counter.add(-20)
+    assert await counter.get() == 0
+
+
+async def test_concurrent_reads_share_one_recount():
+    calls = 0
+
+    async def recount():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 3
+
+    counter = UnreadCounter(recount, resync_interval=60)
+    assert await asyncio.gather(*(counter.get() for _ in range(5))) == [3] * 5
+    assert calls == 1
+
+
+async def test_queued_batch_landing_during_a_recount_is_counted_once(client, monkeypatch):
+    import database
+
+    await insert_notifications(0)
+    landed, release = asyncio.Event(), asyncio.Event()
+    write = database.notification_queue._writer
+
+    async def slow_writer(docs):
+        # The batch is in the collection but still pending in the queue.
+        await write(docs)
+        landed.set()
+        await release.wait()
+
+    monkeypatch.setattr(database.notification_queue, "_writer", slow_writer)
+    try:
+        for i in range(3):
+            await database.Database.create_notification(
+                {"message": f"q{i}", "type": "info", "read": False, "createdAt": datetime.utcnow()})
+        await asyncio.wait_for(landed.wait(), 2)
+        assert await database.unread_counter.resync() == 3
+    finally:
+        release.set()
+    await asyncio.sleep(0.01)
+    assert await database.unread_counter.resync() == 3
@@ -0,0 +1,50 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from auth import PasswordHasher
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_hashes_off_the_event_loop_and_survives_shutdown():
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    hashed = await hasher.hash("secret")
+    assert await hasher.verify("secret", hashed)
+
+    # A second lifespan in the same process reuses the hasher
+    hasher.shutdown()
+    hasher.shutdown()
+    assert not await hasher.verify("wrong", hashed)
+    assert hasher.stats()["completed"] == 3
+    hasher.shutdown()
+
+
+async def test_rejects_beyond_workers_plus_queue():
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    release = threading.Event()
+    hasher_func = lambda: release.wait(5)  # noqa: E731
+
+    running = [asyncio.create_task(hasher._run(hasher_func)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    with pytest.raises(HTTPException) as error:
+        await hasher._run(hasher_func)
+    assert error.value.status_code == 503
+    assert error.value.headers == {"Retry-After": "1"}
+
+    release.set()
+    await asyncio.gather(*running)
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["max_in_flight"] == 2
+    hasher.shutdown()
+
+
+async def test_app_restarts_its_lifespan(seeded):
+    import server
+
+    for _ in range(2):
+        async with server.lifespan(server.app):
+            hashed = await server.password_hasher.hash("secret")
+            assert await server.password_hasher.verify("secret", hashed)
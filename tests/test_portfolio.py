@@ -0,0 +1,39 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_bundle_matches_the_individual_routes(client):
+    response = await client.get("/api/portfolio")
+    assert response.status_code == 200
+    data = response.json()["data"]
+
+    import server
+    assert list(data) == list(server.PORTFOLIO_SECTIONS)
+    assert data["profile"] == (await client.get("/api/profile")).json()["data"]
+    assert data["projects"] == (await client.get("/api/projects")).json()["data"]
+    assert data["skills"] == (await client.get("/api/skills")).json()["data"]
+
+
+async def test_section_selection_is_order_independent(client):
+    first = await client.get("/api/portfolio", params={"sections": "projects,profile"})
+    second = await client.get("/api/portfolio", params={"sections": "profile, projects"})
+
+    assert first.status_code == second.status_code == 200
+    assert list(first.json()["data"]) == ["profile", "projects"]
+    assert first.headers["etag"] == second.headers["etag"]
+
+
+async def test_unknown_section_is_rejected(client):
+    response = await client.get("/api/portfolio", params={"sections": "profile,secrets"})
+    assert response.status_code == 400
+    assert "secrets" in response.json()["detail"]
+
+
+async def test_bundle_reflects_admin_writes(client, admin_headers):
+    response = await client.put("/api/admin/skills/Testing", headers=admin_headers,
+                                json=[{"name": "pytest", "proficiency": 90}])
+    assert response.status_code == 200, response.text
+
+    skills = (await client.get("/api/portfolio", params={"sections": "skills"})).json()["data"]["skills"]
+    assert [skill["name"] for skill in skills["Testing"]] == ["pytest"]
@@ -0,0 +1,165 @@
+import asyncio
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from search_index import RESULT_SECTIONS, SearchIndex, tokenize
+
+pytestmark = pytest.mark.anyio
+
+PROJECTS = [
+    {"id": "p1", "title": "Portfolio Backend", "description": "FastAPI service on MongoDB",
+     "technologies": ["Python", "FastAPI"]},
+    {"id": "p2", "title": "Weather Dashboard", "description": "React charts",
+     "technologies": ["React"]},
+]
+
+
+def make_index(projects=PROJECTS, calls=None):
+    async def load_projects():
+        if calls is not None:
+            calls.append("projects")
+        return projects
+
+    async def load_profile():
+        return {"name": "Bhavy Example", "bio": "Backend developer who likes Python"}
+
+    return SearchIndex({"projects": load_projects, "profile": load_profile})
+
+
+def test_tokenize():
+    assert tokenize("FastAPI + MongoDB, v2!") == ["fastapi", "mongodb", "v2"]
+    assert tokenize(None) == []
+
+
+async def test_prefix_and_multi_word_queries():
+    index = make_index()
+
+    results = await index.search("fast")
+    assert [project["id"] for project in results["projects"]] == ["p1"]
+    assert "Match in technology: 'FastAPI'" in results["projects"][0]["matches"]
+
+    # Every word has to match within the same entry
+    assert (await index.search("fastapi mongodb"))["projects"][0]["id"] == "p1"
+    assert (await index.search("react mongodb"))["projects"] == []
+
+    profile = (await index.search("python"))["profile"]
+    assert [hit["field"] for hit in profile] == ["Bio"]
+
+
+async def test_only_dirty_sections_are_reindexed():
+    calls = []
+    projects = list(PROJECTS)
+    index = make_index(projects, calls)
+    await index.refresh()
+    assert calls == ["projects"]
+
+    projects.append({"id": "p3", "title": "Search Engine", "technologies": []})
+    assert (await index.search("engine"))["projects"] == []
+
+    index.mark_dirty("projects")
+    index.mark_dirty("unknown")
+    assert [project["id"] for project in (await index.search("engine"))["projects"]] == ["p3"]
+    assert calls == ["projects", "projects"]
+    assert index.stats()["dirty_sections"] == 0
+
+
+async def test_admin_search_route(client, admin_headers):
+    response = await client.get("/api/admin/search", params={"q": "python"}, headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert set(data) >= {"profile", "projects", "skills"}
+    assert any(data.values())
+
+    assert (await client.get("/api/admin/search", params={"q": "python"})).status_code in (401, 403)
+    assert (await client.get("/api/admin/search", params={"q": ""}, headers=admin_headers)).status_code == 400
+
+
+def dated_projects(count):
+    now = datetime.now(timezone.utc)
+    return [{"id": f"p{i:02d}", "title": f"Python tool {i}", "description": "python",
+             "updatedAt": now - timedelta(days=i * 7)} for i in range(count)]
+
+
+async def test_ranked_title_hits_and_recent_edits_rank_first():
+    index = make_index(dated_projects(3))
+    page = await index.ranked("python tool", limit=3)
+    assert [item["id"] for item in page["items"]] == ["p00", "p01", "p02"]
+    assert all(item["match"] == "Match in title" for item in page["items"])
+    assert page["total"] == 3
+    assert page["items"][0]["score"] > page["items"][1]["score"]
+
+
+async def test_ranked_cursor_survives_reindexing():
+    projects = dated_projects(12)
+    index = make_index(projects)
+    full = await index.ranked("python", limit=100)
+    expected = [(item["section"], item.get("id"), item.get("match") or item.get("field")) for item in full["items"]]
+
+    seen, cursor = [], None
+    while True:
+        page = await index.ranked("python", limit=5, cursor=cursor)
+        seen += [(item["section"], item.get("id"), item.get("match") or item.get("field")) for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+        # Re-indexing hands out new entry ids; pages must continue regardless.
+        index.mark_dirty("projects")
+
+    assert seen == expected
+
+
+async def test_ranked_rejects_malformed_cursors():
+    index = make_index()
+    with pytest.raises(ValueError):
+        await index.ranked("python", cursor="not-a-cursor")
+    naive = base64.urlsafe_b64encode(json.dumps([1.0, "x", "2024-01-01T00:00:00"]).encode()).decode()
+    with pytest.raises(ValueError):
+        await index.ranked("python", cursor=naive)
+
+
+async def test_concurrent_searches_share_one_reindex():
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_projects():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return PROJECTS
+
+    index = SearchIndex({"projects": slow_projects})
+    searches = [asyncio.create_task(index.search("weather")) for _ in range(5)]
+    await asyncio.sleep(0)
+    # A search arriving mid-load waits for it instead of reading the old index
+    searches.append(asyncio.create_task(index.ranked("weather")))
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*searches)
+    assert calls == 1
+    assert all(result["projects"][0]["id"] == "p2" for result in results[:5])
+    assert results[5]["items"][0]["id"] == "p2"
+
+
+async def test_stream_yields_every_section():
+    index = make_index()
+    sections = {section: results async for section, results in index.stream("python")}
+    assert set(sections) == set(RESULT_SECTIONS)
+    assert sections["projects"][0]["id"] == "p1"
+
+
+async def test_ranked_search_route(client, admin_headers):
+    params = {"q": "python", "mode": "ranked", "limit": 2}
+    first = (await client.get("/api/admin/search", params=params, headers=admin_headers)).json()
+    assert len(first["data"]) == 2 and first["next_cursor"]
+
+    second = await client.get("/api/admin/search", params={**params, "cursor": first["next_cursor"]},
+                              headers=admin_headers)
+    assert second.status_code == 200
+    assert second.json()["data"] != first["data"]
+
+    bad = await client.get("/api/admin/search", params={**params, "cursor": "garbage"}, headers=admin_headers)
+    assert bad.status_code == 400
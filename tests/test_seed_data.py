@@ -0,0 +1,73 @@
+import contextlib
+import sys
+
+import pytest
+
+import seed_data
+
+pytestmark = pytest.mark.anyio
+
+
+async def counts():
+    import database
+    return {name: await database.db[name].count_documents({}) for name in seed_data.SEED_KEYS}
+
+
+async def seed(**kwargs):
+    with contextlib.redirect_stdout(sys.stderr):
+        await seed_data.seed_database(**kwargs)
+
+
+def test_batches_stream_generators():
+    batches = list(seed_data._batches((i for i in range(7)), size=3))
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_every_seeded_collection_has_keys():
+    documents = seed_data.seed_documents()
+    assert set(documents) <= set(seed_data.SEED_KEYS)
+    for name, docs in documents.items():
+        for doc in docs:
+            assert all(key in doc for key in seed_data.SEED_KEYS[name]), (name, doc)
+
+
+async def test_reseeding_is_idempotent(seeded):
+    import database
+
+    first = await counts()
+    await database.db.contact_messages.insert_one({"name": "Visitor", "message": "keep me"})
+    await database.db.projects.insert_one({"title": "Added by an admin"})
+
+    await seed(upsert=True)
+    after_upsert = await counts()
+    assert after_upsert["projects"] == first["projects"] + 1
+    assert after_upsert["admin"] == first["admin"]
+
+    await seed()
+    after_replace = await counts()
+    assert after_replace["projects"] == first["projects"]
+    # Visitor data is never cleared
+    assert after_replace["contact_messages"] == first["contact_messages"] + 1
+
+
+async def test_scaled_seed_adds_synthetic_documents_once(seeded):
+    first = await counts()
+    await seed(scale=25)
+    await seed(scale=25)
+    scaled = await counts()
+    for name in seed_data.SCALED_COLLECTIONS:
+        assert scaled[name] == first[name] + 25
+
+
+async def test_reseed_invalidates_cached_sections(client):
+    import database
+
+    await client.get("/api/projects")
+    await database.db.projects.delete_many({})
+    # Bulk writes bypass Database, so the cached list is stale until the reseed
+    assert (await client.get("/api/projects")).json()["data"]
+
+    await seed_data.load_collection("projects", [{"title": "Only project", "id": "p1"}])
+    await seed_data.refresh_caches(["projects"])
+    titles = [p["title"] for p in (await client.get("/api/projects")).json()["data"]]
+    assert titles == ["Only project"]
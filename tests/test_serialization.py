@@ -0,0 +1,44 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+from bson import ObjectId
+from pydantic import BaseModel
+
+from serialization import FastJSONResponse, dumps
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Point(BaseModel):
+    x: int
+    tags: set
+
+
+def test_dumps_handles_bson_and_pydantic_values():
+    oid = ObjectId()
+    body = dumps({
+        "id": oid,
+        "when": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        "color": Color.RED,
+        "point": Point(x=1, tags={"a"}),
+        "price": Decimal("1.5"),
+        1: "non-string key",
+    })
+    assert json.loads(body) == {
+        "id": str(oid),
+        "when": "2024-05-01T12:30:00+00:00",
+        "color": "red",
+        "point": {"x": 1, "tags": ["a"]},
+        "price": 1.5,
+        "1": "non-string key",
+    }
+
+
+def test_response_is_compact_utf8():
+    response = FastJSONResponse({"name": "Zoë", "items": [1, 2]})
+    assert response.body == '{"name":"Zoë","items":[1,2]}'.encode()
+    assert response.headers["content-type"] == "application/json"
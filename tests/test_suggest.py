@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from search_index import MAX_SUGGEST_LABEL_LENGTH, SuggestIndex
+
+pytestmark = pytest.mark.anyio
+
+
+def make_index(projects):
+    async def load_projects():
+        return projects
+
+    async def load_skills():
+        return {"Backend": [{"name": "Spring Boot"}, {"name": "Python"}]}
+
+    return SuggestIndex({"projects": load_projects, "skills": load_skills})
+
+
+async def test_prefix_matches_rank_before_inner_word_matches():
+    index = make_index([{"title": "Bootstrap Site", "technologies": ["Python"]}])
+
+    suggestions = await index.suggest("boot")
+    assert [s["label"] for s in suggestions] == ["Bootstrap Site", "Spring Boot"]
+    assert suggestions[1]["kind"] == "skill"
+
+    # Labels are de-duplicated across sections and kinds
+    assert [s["label"] for s in await index.suggest("pyth")] == ["Python"]
+    assert await index.suggest("  ") == []
+
+
+async def test_limit_and_label_cap():
+    long_title = "Project " + "x" * 200
+    index = make_index([{"title": f"Project {i}"} for i in range(30)] + [{"title": long_title}])
+
+    suggestions = await index.suggest("project", limit=5)
+    assert len(suggestions) == 5
+    assert all(len(s["label"]) <= MAX_SUGGEST_LABEL_LENGTH for s in await index.suggest("project x", limit=50))
+
+
+async def test_dirty_section_is_recollected():
+    projects = [{"title": "Old Name"}]
+    index = make_index(projects)
+    assert await index.suggest("old")
+
+    projects[0] = {"title": "New Name"}
+    index.mark_dirty("projects")
+    assert await index.suggest("old") == []
+    assert [s["label"] for s in await index.suggest("new")] == ["New Name"]
+
+
+async def test_suggest_route(client, admin_headers):
+    response = await client.get("/api/admin/search/suggest", params={"q": "py", "limit": 3}, headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert 0 < len(data) <= 3
+    assert all(s["label"].lower().startswith("py") or " py" in s["label"].lower() for s in data)
+
+
+async def test_each_section_keeps_its_most_frequent_labels():
+    # Rare labels late in the alphabet would be the first to go if the
+    # merged array were truncated; the cap drops the rarest instead.
+    projects = [{"title": f"Aardvark {i}", "technologies": ["Zig"]} for i in range(40)]
+    index = make_index(projects)
+    index.max_section_keys = 20
+
+    assert [s["label"] for s in await index.suggest("zig")] == ["Zig"]
+    assert len(index._section_keys["projects"]) <= 20
+    assert len(index._section_keys["skills"]) <= 20
+
+
+async def test_concurrent_lookups_share_one_load():
+    calls = 0
+
+    async def load_projects():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"title": "Portfolio"}]
+
+    index = SuggestIndex({"projects": load_projects})
+    results = await asyncio.gather(*(index.suggest("port") for _ in range(5)))
+    assert calls == 1
+    assert all([s["label"] for s in result] == ["Portfolio"] for result in results)
@@ -0,0 +1,73 @@
+import functools
+import io
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from uploads import UploadTooLarge, incoming_dir, is_hashed_name, safe_filename, store_upload
+
+pytestmark = pytest.mark.anyio
+
+RESUME = b"%PDF-1.4 " + b"resume text " * 2000
+
+
+def upload(data: bytes, filename: str, size=None):
+    return UploadFile(io.BytesIO(data), filename=filename, size=size)
+
+
+def test_safe_filename():
+    assert safe_filename("../../etc/passwd") == ("passwd", "")
+    assert safe_filename("C:\\Users\\me\\My Resume (final).PDF") == ("My-Resume-final", ".pdf")
+    assert safe_filename("") == ("file", "")
+
+
+async def test_stores_under_a_content_hash_and_dedupes(tmp_path):
+    directory = tmp_path / "static"
+    directory.mkdir()
+
+    first = await store_upload(upload(RESUME, "resume.pdf"), directory)
+    assert first.parent == directory
+    assert is_hashed_name(first.name) and first.name.startswith("resume.")
+    assert first.read_bytes() == RESUME
+    assert first.with_name(first.name + ".gz").exists()
+
+    # Same bytes under another name resolve to the stored file
+    second = await store_upload(upload(RESUME, "copy.pdf"), directory, max_bytes=len(RESUME))
+    assert second == first
+    assert sorted(p.name for p in directory.iterdir() if not p.name.endswith((".gz", ".br"))) == [first.name]
+    # Partial files never appear in the served directory
+    assert list(incoming_dir(directory).iterdir()) == []
+
+
+async def test_too_large_uploads_leave_nothing_behind(tmp_path):
+    directory = tmp_path / "static"
+    directory.mkdir()
+
+    with pytest.raises(UploadTooLarge):
+        await store_upload(upload(RESUME, "resume.pdf"), directory, max_bytes=100)
+    with pytest.raises(UploadTooLarge):
+        await store_upload(upload(b"x", "tiny.txt", size=10_000), directory, max_bytes=100)
+    assert list(directory.iterdir()) == []
+    assert list(incoming_dir(directory).iterdir()) == []
+
+
+async def test_upload_routes(client, admin_headers, tmp_path, monkeypatch):
+    import server
+
+    directory = tmp_path / "static"
+    directory.mkdir()
+    monkeypatch.setattr(server, "UPLOAD_DIR", directory)
+
+    response = await client.post("/api/admin/upload-resume", headers=admin_headers,
+                                 files={"file": ("resume.pdf", RESUME, "application/pdf")})
+    assert response.status_code == 200, response.text
+    assert response.json()["url"].startswith("/static/resume.")
+
+    monkeypatch.setattr(server, "store_upload", functools.partial(store_upload, max_bytes=100))
+    response = await client.post("/api/admin/upload-resume", headers=admin_headers,
+                                 files={"file": ("resume.pdf", RESUME, "application/pdf")})
+    assert response.status_code == 413
+
+    response = await client.post("/api/admin/upload-image", headers=admin_headers,
+                                 files={"file": ("notes.txt", b"hi", "text/plain")})
+    assert response.status_code == 415